@@ -0,0 +1,6 @@
+"""
+Benchmarks for Django Template Converter
+
+Run a benchmark module from the project root, e.g.:
+    python -m benchmarks.bench_load_static
+"""
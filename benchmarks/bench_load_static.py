@@ -0,0 +1,70 @@
+"""
+Regression benchmark for {% load static %} detection
+
+Checks that a conversion serializes the parse tree exactly once, and
+reports how long conversion and a single serialization take on large
+generated inputs.
+"""
+
+import time
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup
+
+from django_template_converter.core.converter import DjangoTemplateConverter
+
+
+def generate_document(blocks: int) -> str:
+    """
+    Generate a large HTML document.
+    
+    Args:
+        blocks: Number of repeated content blocks
+        
+    Returns:
+        HTML content
+    """
+    block = (
+        '<div class="card"><img src="img/card.png" alt="Card">'
+        '<p>Lorem ipsum dolor sit amet, consectetur adipiscing elit.</p>'
+        '<a href="page.html">More</a></div>\n'
+    )
+    return (
+        '<!DOCTYPE html>\n<html><head>'
+        '<link rel="stylesheet" href="css/style.css">'
+        '<script src="js/main.js"></script></head><body>\n'
+        + block * blocks
+        + '</body></html>\n'
+    )
+
+
+def run(block_counts=(500, 2000, 8000)) -> None:
+    """Run the benchmark for each document size"""
+    converter = DjangoTemplateConverter()
+    
+    for blocks in block_counts:
+        html_content = generate_document(blocks)
+        
+        with patch.object(
+            BeautifulSoup, "decode", autospec=True, side_effect=BeautifulSoup.decode
+        ) as decode:
+            start = time.perf_counter()
+            converter.convert_string(html_content)
+            convert_time = time.perf_counter() - start
+        
+        soup = BeautifulSoup(html_content, "html.parser")
+        start = time.perf_counter()
+        str(soup)
+        serialize_time = time.perf_counter() - start
+        
+        print(
+            f"{len(html_content) / 1024:10.0f} KB  "
+            f"convert {convert_time * 1000:9.1f} ms  "
+            f"serialize {serialize_time * 1000:8.1f} ms  "
+            f"serializations {decode.call_count}"
+        )
+        assert decode.call_count == 1, "document serialized more than once"
+
+
+if __name__ == "__main__":
+    run()
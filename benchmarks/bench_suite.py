@@ -0,0 +1,295 @@
+"""
+Benchmark suite on a synthetic template corpus
+
+Generates HTML documents from 10 KB to 50 MB with different asset
+densities and srcset sizes, then times convert_string, convert_file, the
+memory-mapped StreamingConverter.convert_file and convert_tree on them.
+Peak memory is measured with tracemalloc in a separate, untimed run, so it
+covers Python allocations only (not the memory held inside libxml2).
+Results are written as JSON; pass a previous result file with --compare
+to print the speed ratio of every case.
+
+    python -m benchmarks.bench_suite --sizes 10K 1M --output results.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from django_template_converter import __version__
+from django_template_converter.core.batch import convert_tree
+from django_template_converter.core.converter import DjangoTemplateConverter, PARSERS
+from django_template_converter.core.streaming import StreamingConverter
+
+
+DEFAULT_SIZES = ("10K", "100K", "1M", "10M", "50M")
+
+# Corpus profile -> (share of blocks that reference assets, srcset candidates)
+PROFILES = {
+    "text": (0.05, 0),
+    "assets": (0.6, 0),
+    "srcset": (0.6, 6),
+}
+
+OPERATIONS = ("convert_string", "convert_file", "stream_file", "convert_tree")
+
+# Files per convert_tree case; the corpus size is split between them
+BATCH_FILES = 8
+
+_TEXT_BLOCK = (
+    '<section class="text"><h2>Heading {i}</h2>'
+    '<p>Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do '
+    'eiusmod tempor incididunt ut labore et dolore magna aliqua.</p>'
+    '<a href="#section-{i}">Anchor</a></section>\n'
+)
+_ASSET_BLOCKS = (
+    '<div class="card"><img src="img/card{i}.png" alt="Card {i}">'
+    '<a href="pages/page{i}.html">More</a></div>\n',
+    '<link rel="stylesheet" href="css/part{i}.css">\n',
+    '<script src="js/module{i}.js"></script>\n',
+    '<img src="https://cdn.example.com/photo{i}.jpg" alt="External">\n',
+    '<video controls><source src="media/clip{i}.mp4" type="video/mp4"></video>\n',
+)
+
+
+def parse_size(text: str) -> int:
+    """
+    Parse a size such as "10K", "1M" or "4096".
+    
+    Args:
+        text: Size with an optional K or M suffix
+    
+    Returns:
+        Size in bytes
+    """
+    units = {"K": 1024, "M": 1024 * 1024}
+    suffix = text[-1:].upper()
+    if suffix in units:
+        return int(float(text[:-1]) * units[suffix])
+    return int(text)
+
+
+def _srcset_block(i: int, candidates: int) -> str:
+    """Picture element with srcset attributes of the given size"""
+    srcset = ", ".join(
+        f"img/hero{i}-{width}.jpg {width}w"
+        for width in range(320, 320 * (candidates + 1), 320)
+    )
+    return (
+        f'<picture><source type="image/webp" srcset="{srcset.replace(".jpg", ".webp")}">'
+        f'<img src="img/hero{i}.jpg" srcset="{srcset}" alt="Hero {i}"></picture>\n'
+    )
+
+
+def generate_corpus(size: int, asset_ratio: float, srcset_candidates: int, seed: int = 0) -> str:
+    """
+    Generate an HTML document of roughly the given size.
+    
+    Args:
+        size: Target size in characters
+        asset_ratio: Share of content blocks that reference static files
+        srcset_candidates: Candidates per srcset attribute (0: no srcset blocks)
+        seed: Random seed
+    
+    Returns:
+        HTML content
+    """
+    rng = random.Random(seed)
+    head = (
+        '<!DOCTYPE html>\n<html><head><meta charset="utf-8">'
+        '<link rel="stylesheet" href="css/style.css"></head><body>\n'
+    )
+    tail = '<script src="js/main.js"></script></body></html>\n'
+    
+    blocks = [head]
+    length = len(head) + len(tail)
+    i = 0
+    while length < size:
+        if rng.random() >= asset_ratio:
+            block = _TEXT_BLOCK.format(i=i)
+        elif srcset_candidates and rng.random() < 0.5:
+            block = _srcset_block(i, srcset_candidates)
+        else:
+            block = rng.choice(_ASSET_BLOCKS).format(i=i)
+        blocks.append(block)
+        length += len(block)
+        i += 1
+    blocks.append(tail)
+    return "".join(blocks)
+
+
+def measure(operation: Callable[[], object], repeat: int) -> Tuple[float, int]:
+    """
+    Time an operation and measure its peak memory.
+    
+    Args:
+        operation: Callable to measure
+        repeat: Number of timed runs, the best one is reported
+    
+    Returns:
+        Best time in seconds and peak traced memory in bytes
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        best = min(best, time.perf_counter() - start)
+    
+    tracemalloc.start()
+    try:
+        operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def _operations(
+    converter: DjangoTemplateConverter,
+    html_content: str,
+    work_dir: Path,
+    parser: str,
+    workers: int
+) -> Dict[str, Callable[[], object]]:
+    """Prepare the benchmarked operations for one document"""
+    input_path = work_dir / "input.html"
+    input_path.write_text(html_content, encoding="utf-8")
+    
+    tree = work_dir / "tree"
+    part = max(1, len(html_content) // BATCH_FILES)
+    for index in range(BATCH_FILES):
+        path = tree / f"section{index % 2}" / f"page{index}.html"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            html_content[index * part:(index + 1) * part] if index < BATCH_FILES - 1
+            else html_content[index * part:],
+            encoding="utf-8"
+        )
+    
+    return {
+        "convert_string": lambda: converter.convert_string(html_content),
+        "convert_file": lambda: converter.convert_file(
+            str(input_path), str(work_dir / "output.html")
+        ),
+        "stream_file": lambda: StreamingConverter(converter).convert_file(
+            str(input_path), str(work_dir / "output.html")
+        ),
+        "convert_tree": lambda: convert_tree(
+            str(tree), str(work_dir / "tree-output"), workers=workers, parser=parser
+        ),
+    }
+
+
+def run(
+    sizes: Tuple[str, ...] = DEFAULT_SIZES,
+    profiles: Tuple[str, ...] = tuple(PROFILES),
+    operations: Tuple[str, ...] = OPERATIONS,
+    parser: str = "html.parser",
+    workers: int = 1,
+    repeat: int = 3
+) -> List[dict]:
+    """
+    Run the benchmark matrix.
+    
+    Args:
+        sizes: Document sizes, e.g. "10K" or "50M"
+        profiles: Corpus profiles, keys of PROFILES
+        operations: Operations to time, items of OPERATIONS
+        parser: Parser backend
+        workers: Worker processes for convert_tree
+        repeat: Timed runs per case
+    
+    Returns:
+        One result per size, profile and operation
+    """
+    converter = DjangoTemplateConverter(parser=parser)
+    results = []
+    for size_text in sizes:
+        size = parse_size(size_text)
+        for profile in profiles:
+            asset_ratio, srcset_candidates = PROFILES[profile]
+            html_content = generate_corpus(size, asset_ratio, srcset_candidates)
+            
+            with tempfile.TemporaryDirectory() as work_dir:
+                cases = _operations(converter, html_content, Path(work_dir), parser, workers)
+                for operation in operations:
+                    # Keep the rewrite cache from carrying over between cases
+                    converter.cache_clear()
+                    seconds, peak = measure(cases[operation], repeat)
+                    result = {
+                        "case": f"{operation}/{profile}/{size_text}",
+                        "operation": operation,
+                        "profile": profile,
+                        "size": len(html_content),
+                        "seconds": seconds,
+                        "mb_per_second": len(html_content) / seconds / 1e6,
+                        "peak_bytes": peak,
+                    }
+                    results.append(result)
+                    print(
+                        f"{result['case']:32} {seconds * 1000:10.1f} ms "
+                        f"{result['mb_per_second']:8.2f} MB/s "
+                        f"{peak / 1024 / 1024:9.1f} MB peak",
+                        flush=True
+                    )
+    return results
+
+
+def compare(results: List[dict], baseline: List[dict]) -> None:
+    """Print the speed ratio of each case against a previous run"""
+    previous = {result["case"]: result for result in baseline}
+    for result in results:
+        old = previous.get(result["case"])
+        if old is None:
+            continue
+        print(
+            f"{result['case']:32} {old['seconds'] / result['seconds']:6.2f}x speed "
+            f"{result['peak_bytes'] / max(old['peak_bytes'], 1):6.2f}x memory"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the suite from the command line"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--profiles", nargs="+", choices=PROFILES, default=list(PROFILES))
+    parser.add_argument("--operations", nargs="+", choices=OPERATIONS, default=list(OPERATIONS))
+    parser.add_argument("--parser", choices=PARSERS, default="html.parser")
+    parser.add_argument("--workers", type=int, default=1, help="workers for convert_tree")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--compare", metavar="JSON", help="previous result file")
+    args = parser.parse_args(argv)
+    
+    results = run(
+        tuple(args.sizes), tuple(args.profiles), tuple(args.operations),
+        args.parser, args.workers, args.repeat
+    )
+    report = {
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parser": args.parser,
+        "workers": args.workers,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(f"Results written to {args.output}")
+    
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            compare(results, json.load(file)["results"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Micro-benchmark for URL exclusion checks
+
+Compares the per-URL cost of the previous list-copy-and-any() check with
+the compiled UrlMatcher, with and without user supplied rules.
+"""
+
+import random
+import timeit
+
+from django_template_converter.core.matcher import DEFAULT_EXCLUDED_PREFIXES, UrlMatcher
+
+
+URL_COUNT = 100000
+
+
+def generate_urls(count: int = URL_COUNT, seed: int = 0) -> list:
+    """
+    Generate a mix of local, external and template URLs.
+    
+    Args:
+        count: Number of URLs
+        seed: Random seed
+        
+    Returns:
+        List of URLs
+    """
+    rng = random.Random(seed)
+    shapes = (
+        "css/style{}.css",
+        "img/photo{}.jpg",
+        "https://cdn.example.com/lib{}.js",
+        "//fonts.example.com/font{}.woff2",
+        "data:image/png;base64,iVBORw0KGgo{}",
+        "{{% static 'img/{}.png' %}}",
+        "/media/uploads/{}.png",
+    )
+    return [rng.choice(shapes).format(i) for i in range(count)]
+
+
+def list_copy_check(excluded: list, url: str) -> bool:
+    """Exclusion check as implemented before UrlMatcher"""
+    prefixes = excluded.copy()
+    return any(url.startswith(prefix) for prefix in prefixes)
+
+
+def run(repeat: int = 5) -> None:
+    """Run the benchmark"""
+    urls = generate_urls()
+    excluded = list(DEFAULT_EXCLUDED_PREFIXES)
+    default_matcher = UrlMatcher()
+    custom_matcher = UrlMatcher(
+        DEFAULT_EXCLUDED_PREFIXES + ("/media/",),
+        patterns=(r"[a-z]+://cdn\.",),
+        globs=("*.woff2",)
+    )
+    
+    cases = (
+        ("list copy + any()", lambda: [list_copy_check(excluded, url) for url in urls]),
+        ("UrlMatcher (prefixes)", lambda: [default_matcher.matches(url) for url in urls]),
+        ("UrlMatcher (+regex, glob)", lambda: [custom_matcher.matches(url) for url in urls]),
+    )
+    for name, case in cases:
+        best = min(timeit.repeat(case, number=1, repeat=repeat))
+        print(f"{name:28} {best * 1e9 / len(urls):8.1f} ns/URL")
+
+
+if __name__ == "__main__":
+    run()
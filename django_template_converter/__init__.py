@@ -2,12 +2,22 @@
 Django Template Converter
 
 A tool for converting HTML files to standard Django templates.
+
+The public names are imported on first access, so importing the package
+does not load the HTML parser or tkinter.
 """
 
+from ._lazy import lazy_attributes
+
 __version__ = "2.0.0"
 __author__ = "Developer"
 
-from .core.converter import DjangoTemplateConverter as Converter
+# Public name -> (module, attribute), resolved by lazy_attributes
+_LAZY_ATTRIBUTES = {
+    'Converter': ('.core.converter', 'DjangoTemplateConverter'),
+    'DjangoTemplateConverterGUI': ('.gui.window', 'DjangoTemplateConverterGUI'),
+}
 
-__all__ = ['Converter']
+__all__ = ['Converter', 'DjangoTemplateConverterGUI']
 
+__getattr__, __dir__ = lazy_attributes(globals(), _LAZY_ATTRIBUTES)
@@ -0,0 +1,11 @@
+"""
+Entry point for ``python -m django_template_converter``
+"""
+
+import sys
+
+from .cli import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
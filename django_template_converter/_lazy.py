@@ -0,0 +1,43 @@
+"""
+Lazily imported package attributes
+
+This module builds the module-level __getattr__ and __dir__ functions
+(PEP 562) that let a package import its public names on first access.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_attributes(
+    namespace: Dict[str, Any],
+    attributes: Dict[str, Tuple[str, str]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Create __getattr__ and __dir__ for a package.
+    
+    A resolved value is stored in namespace, so later accesses don't call
+    __getattr__ again.
+    
+    Args:
+        namespace: globals() of the package
+        attributes: Public name -> (module relative to the package, attribute)
+    
+    Returns:
+        __getattr__ and __dir__ functions to assign in the package
+    """
+    package = namespace['__name__']
+    
+    def __getattr__(name: str) -> Any:
+        try:
+            module_name, attribute = attributes[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(module_name, package), attribute)
+        namespace[name] = value
+        return value
+    
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(attributes))
+    
+    return __getattr__, __dir__
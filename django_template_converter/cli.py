@@ -0,0 +1,347 @@
+"""
+Command-line interface for Django Template Converter
+
+This module only depends on the core package, so it runs on headless
+machines. The GUI is imported when the "gui" command is used.
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from . import __version__
+from .core.assets import AssetIndex
+from .core.batch import convert_tree
+from .core.cache import ConversionCache
+from .core.converter import DjangoTemplateConverter, PARSERS
+from .core.patching import PatchConverter
+from .core.profiling import ConversionStats
+from .core.streaming import StreamingConverter
+from .core.watcher import DEFAULT_DEBOUNCE, DEFAULT_INTERVAL, TemplateWatcher
+
+
+STDIO = "-"
+
+
+def _add_converter_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options that configure DjangoTemplateConverter"""
+    parser.add_argument(
+        "--parser", choices=PARSERS, default="html.parser",
+        help="parser backend (default: html.parser)"
+    )
+    parser.add_argument(
+        "--exclude", action="append", default=[], metavar="PREFIX",
+        help="leave URLs starting with PREFIX unchanged (repeatable)"
+    )
+    parser.add_argument(
+        "--exclude-regex", action="append", default=[], metavar="REGEX",
+        help="leave URLs matching REGEX from their start unchanged (repeatable)"
+    )
+    parser.add_argument(
+        "--exclude-glob", action="append", default=[], metavar="GLOB",
+        help="leave URLs matching GLOB unchanged (repeatable)"
+    )
+    parser.add_argument(
+        "--prescan", action="store_true",
+        help="copy documents with nothing to rewrite without parsing them "
+             "(only {% load static %} is added)"
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line argument parser.
+    
+    Returns:
+        Argument parser
+    """
+    parser = argparse.ArgumentParser(
+        prog="django-template-converter",
+        description="Convert HTML files to Django templates."
+    )
+    parser.add_argument(
+        "--version", action="version", version=f"%(prog)s {__version__}"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    
+    convert = subparsers.add_parser(
+        "convert",
+        help="convert a file, a directory or stdin",
+        description=(
+            "Convert INPUT to a Django template. INPUT may be a file, a "
+            "directory (converted recursively into OUTPUT) or '-' for stdin."
+        )
+    )
+    convert.add_argument(
+        "input", nargs="?", default=STDIO,
+        help="input file, directory or '-' for stdin (default: stdin)"
+    )
+    convert.add_argument(
+        "-o", "--output",
+        help="output file, directory or '-' for stdout "
+             "(default: stdout for stdin, <name>_django.html for files)"
+    )
+    _add_converter_arguments(convert)
+    engines = convert.add_mutually_exclusive_group()
+    engines.add_argument(
+        "--streaming", action="store_true",
+        help="use the streaming converter, which keeps unchanged bytes as they are"
+    )
+    engines.add_argument(
+        "--patch", action="store_true",
+        help="only replace the rewritten attribute values and keep every other "
+             "byte as it is (minimal diff)"
+    )
+    convert.add_argument(
+        "--incremental", action="store_true",
+        help="skip files whose output is up to date (cache kept in the output directory)"
+    )
+    convert.add_argument(
+        "--pattern", default="*.html",
+        help="file name pattern in directory mode (default: *.html)"
+    )
+    convert.add_argument(
+        "-j", "--workers", type=int, default=None,
+        help="worker processes in directory mode (default: CPU count)"
+    )
+    convert.add_argument(
+        "--no-dedup", dest="deduplicate", action="store_false",
+        help="in directory mode, convert byte-identical files separately "
+             "instead of converting them once and copying the output"
+    )
+    convert.add_argument(
+        "--hardlink", action="store_true",
+        help="in directory mode, hard link the outputs of identical files instead of copying"
+    )
+    convert.add_argument(
+        "--profile", action="store_true",
+        help="print the time spent per conversion stage to stderr"
+    )
+    convert.add_argument(
+        "--asset-index", metavar="FILE",
+        help="write the static files referenced by every template to FILE as JSON"
+    )
+    convert.add_argument(
+        "--static-dir", action="append", default=[], metavar="DIR",
+        help="report referenced static files found in no DIR and exit with "
+             "status 1 (repeatable)"
+    )
+    
+    watch = subparsers.add_parser(
+        "watch",
+        help="reconvert templates of a directory when they change",
+        description="Watch SOURCE and reconvert changed templates into OUTPUT."
+    )
+    watch.add_argument("source", help="source directory")
+    watch.add_argument("-o", "--output", required=True, help="output directory")
+    watch.add_argument(
+        "--pattern", default="*.html",
+        help="file name pattern (default: *.html)"
+    )
+    watch.add_argument(
+        "--interval", type=float, default=DEFAULT_INTERVAL,
+        help=f"seconds between polls (default: {DEFAULT_INTERVAL})"
+    )
+    watch.add_argument(
+        "--debounce", type=float, default=DEFAULT_DEBOUNCE,
+        help=f"seconds a file must stay unchanged before converting (default: {DEFAULT_DEBOUNCE})"
+    )
+    _add_converter_arguments(watch)
+    
+    subparsers.add_parser("gui", help="open the graphical interface")
+    
+    return parser
+
+
+def _converter_options(args: argparse.Namespace) -> dict:
+    """Converter options given on the command line"""
+    return {
+        "parser": args.parser,
+        "exclude_prefixes": args.exclude,
+        "exclude_patterns": args.exclude_regex,
+        "exclude_globs": args.exclude_glob,
+        "prescan": args.prescan,
+    }
+
+
+def _convert(
+    args: argparse.Namespace,
+    stats: Optional[ConversionStats] = None,
+    assets: Optional[AssetIndex] = None
+) -> int:
+    """Run the convert command, adding per-stage timings to stats and references to assets"""
+    converter = DjangoTemplateConverter(stats=stats, **_converter_options(args))
+    engine = converter
+    engine_option = None
+    if args.streaming:
+        engine = StreamingConverter(converter)
+        engine_option = "--streaming"
+    elif args.patch:
+        engine = PatchConverter(converter)
+        engine_option = "--patch"
+    
+    for option, value in (("--profile", stats), ("--asset-index/--static-dir", assets)):
+        if value is not None and engine_option:
+            print(f"error: {option} is not supported with {engine_option}", file=sys.stderr)
+            return 2
+    
+    if args.incremental and (engine_option or args.input == STDIO or args.output == STDIO):
+        print("error: --incremental requires file or directory input and output", file=sys.stderr)
+        return 2
+    
+    references = [] if assets is not None else None
+    if args.input == STDIO:
+        if args.streaming:
+            chunks = iter(lambda: sys.stdin.read(engine.chunk_size), "")
+            converted = engine.convert_stream(chunks)
+        elif engine is converter:
+            converted = [converter.convert_string(sys.stdin.read(), references)]
+        else:
+            converted = [engine.convert_string(sys.stdin.read())]
+        if assets is not None:
+            assets.add(STDIO, references)
+        
+        if args.output in (None, STDIO):
+            for chunk in converted:
+                sys.stdout.write(chunk)
+        else:
+            with open(args.output, "w", encoding="utf-8") as file:
+                for chunk in converted:
+                    file.write(chunk)
+        return 0
+    
+    if Path(args.input).is_dir():
+        if args.output in (None, STDIO):
+            print("error: directory mode requires -o OUTPUT_DIR", file=sys.stderr)
+            return 2
+        if engine_option:
+            print(f"error: {engine_option} is not supported in directory mode", file=sys.stderr)
+            return 2
+        outputs = convert_tree(
+            args.input, args.output,
+            pattern=args.pattern, workers=args.workers,
+            incremental=args.incremental, stats=stats, assets=assets,
+            deduplicate=args.deduplicate, hardlink=args.hardlink,
+            **_converter_options(args)
+        )
+        print(f"Converted {len(outputs)} file(s) into {args.output}", file=sys.stderr)
+        return 0
+    
+    if args.output == STDIO:
+        with open(args.input, "r", encoding="utf-8") as file:
+            html_content = file.read()
+        if engine is converter:
+            sys.stdout.write(converter.convert_string(html_content, references))
+        else:
+            sys.stdout.write(engine.convert_string(html_content))
+    else:
+        if args.incremental:
+            with ConversionCache(str(Path(args.output or args.input).parent)) as cache:
+                output_path = converter.convert_file(
+                    args.input, args.output, cache=cache, references=references
+                )
+        elif engine is converter:
+            output_path = converter.convert_file(args.input, args.output, references=references)
+        else:
+            output_path = engine.convert_file(args.input, args.output)
+        print(f"Output file: {output_path}", file=sys.stderr)
+    
+    if assets is not None:
+        assets.add(args.input, references)
+    return 0
+
+
+def _check_assets(args: argparse.Namespace, assets: AssetIndex) -> int:
+    """Write the asset index and report missing static files"""
+    if args.asset_index:
+        assets.save(args.asset_index)
+        print(f"Asset index: {args.asset_index}", file=sys.stderr)
+    
+    if not args.static_dir:
+        return 0
+    missing = assets.missing(args.static_dir)
+    for template, paths in missing.items():
+        for path in paths:
+            print(f"missing static file: {template}: {path}", file=sys.stderr)
+    return 1 if missing else 0
+
+
+def _watch(args: argparse.Namespace) -> int:
+    """Run the watch command"""
+    if not Path(args.source).is_dir():
+        print(f"error: source directory not found: {args.source}", file=sys.stderr)
+        return 1
+    
+    def on_convert(input_path: str, output_path: str, seconds: float) -> None:
+        print(f"{input_path} -> {output_path} ({seconds * 1000:.0f} ms)", file=sys.stderr)
+    
+    def on_error(input_path: str, error: Exception) -> None:
+        print(f"error: {input_path}: {error}", file=sys.stderr)
+    
+    watcher = TemplateWatcher(
+        args.source, args.output,
+        pattern=args.pattern,
+        converter=DjangoTemplateConverter(**_converter_options(args)),
+        interval=args.interval,
+        debounce=args.debounce,
+        on_convert=on_convert,
+        on_error=on_error
+    )
+    print(f"Watching {args.source} (Ctrl+C to stop)", file=sys.stderr)
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _run_gui() -> int:
+    """Open the graphical interface"""
+    import tkinter as tk
+    from .gui import DjangoTemplateConverterGUI
+    
+    root = tk.Tk()
+    DjangoTemplateConverterGUI(root)
+    root.mainloop()
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the command-line interface.
+    
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+    
+    Returns:
+        Exit status
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    
+    if args.command == "convert":
+        stats = ConversionStats() if args.profile else None
+        assets = AssetIndex() if args.asset_index or args.static_dir else None
+        try:
+            status = _convert(args, stats, assets)
+            if stats is not None and status == 0:
+                print(stats.report(), file=sys.stderr)
+            if assets is not None and status == 0:
+                status = _check_assets(args, assets)
+        except (OSError, ValueError, re.error) as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 1
+        return status
+    if args.command == "watch":
+        try:
+            return _watch(args)
+        except (ValueError, re.error) as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 1
+    if args.command == "gui":
+        return _run_gui()
+    
+    parser.print_help()
+    return 2
@@ -3,7 +3,22 @@ Core module for Django Template Converter
 ماژول اصلی تبدیل کننده
 """
 
-from .converter import DjangoTemplateConverter
+from .._lazy import lazy_attributes
 
-__all__ = ['DjangoTemplateConverter']
+# Public name -> (module, attribute), resolved by lazy_attributes
+_LAZY_ATTRIBUTES = {
+    'AssetIndex': ('.assets', 'AssetIndex'),
+    'ConversionStats': ('.profiling', 'ConversionStats'),
+    'ConverterPool': ('.pool', 'ConverterPool'),
+    'DjangoTemplateConverter': ('.converter', 'DjangoTemplateConverter'),
+    'PatchConverter': ('.patching', 'PatchConverter'),
+    'StreamingConverter': ('.streaming', 'StreamingConverter'),
+    'convert_tree': ('.batch', 'convert_tree'),
+}
 
+__all__ = [
+    'AssetIndex', 'ConversionStats', 'ConverterPool', 'DjangoTemplateConverter',
+    'PatchConverter', 'StreamingConverter', 'convert_tree',
+]
+
+__getattr__, __dir__ = lazy_attributes(globals(), _LAZY_ATTRIBUTES)
@@ -0,0 +1,173 @@
+"""
+Asset index of converted templates
+
+This module collects the static files referenced by converted templates.
+Pass a list as references to DjangoTemplateConverter.convert_string or
+convert_file and every {% static %} path of a rewritten (tag, attribute)
+is appended to it during the rewrite pass, so no second parse is needed.
+An AssetIndex maps template names to these references and is written as
+JSON for a whole batch.
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple
+
+from ..utils.helpers import atomic_write
+
+
+# {% static %} tag as generated by the converter, single or double quoted
+_STATIC_TAG_RE = re.compile(r'\{%\s*static\s+(["\'])(.*?)\1\s*%\}')
+
+# Query string or fragment of a static path
+_PATH_SUFFIX_RE = re.compile(r'[?#].*', re.DOTALL)
+
+
+class AssetReference(NamedTuple):
+    """Static file referenced by a template"""
+    path: str
+    tag: str
+    attribute: str
+
+
+def static_paths(value: str) -> List[str]:
+    """
+    Find the {% static %} paths of an attribute value or text.
+    
+    Args:
+        value: Attribute value or element text
+    
+    Returns:
+        Static paths in the order they appear
+    """
+    if "static" not in value:
+        return []
+    return [match.group(2) for match in _STATIC_TAG_RE.finditer(value)]
+
+
+class AssetIndex:
+    """
+    Static files referenced by a set of templates.
+    
+    Attributes:
+        templates: Template name -> references, in document order
+    """
+    
+    def __init__(self):
+        """Initialize an empty index"""
+        self.templates = {}
+    
+    def add(self, template: str, references: Iterable[AssetReference]) -> None:
+        """
+        Set the references of a template.
+        
+        Args:
+            template: Template name, e.g. its path relative to the template root
+            references: Static files referenced by the template
+        """
+        self.templates[template] = [AssetReference(*reference) for reference in references]
+    
+    def assets(self) -> Dict[str, List[str]]:
+        """
+        Map every referenced static path to the templates using it.
+        
+        Returns:
+            Sorted static path -> sorted template names
+        """
+        users = {}
+        for template, references in self.templates.items():
+            for reference in references:
+                users.setdefault(reference.path, set()).add(template)
+        return {path: sorted(users[path]) for path in sorted(users)}
+    
+    def missing(self, static_dirs: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        Find referenced static files that exist in none of static_dirs.
+        
+        Query strings and fragments are ignored when looking a path up.
+        
+        Args:
+            static_dirs: Static file directories, e.g. STATICFILES_DIRS
+        
+        Returns:
+            Template name -> sorted missing static paths, for templates
+            with missing files only
+        """
+        static_dirs = [Path(directory) for directory in static_dirs]
+        found = {}
+        
+        def exists(path: str) -> bool:
+            if path not in found:
+                relative = _PATH_SUFFIX_RE.sub("", path).lstrip("/")
+                found[path] = any((directory / relative).is_file() for directory in static_dirs)
+            return found[path]
+        
+        missing = {}
+        for template in sorted(self.templates):
+            paths = sorted({
+                reference.path for reference in self.templates[template]
+                if not exists(reference.path)
+            })
+            if paths:
+                missing[template] = paths
+        return missing
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Describe the index as JSON-compatible data.
+        
+        Returns:
+            Per-template references and the reverse asset -> templates map
+        """
+        return {
+            "templates": {
+                template: [reference._asdict() for reference in self.templates[template]]
+                for template in sorted(self.templates)
+            },
+            "assets": self.assets(),
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AssetIndex":
+        """
+        Create an index from data described by to_dict().
+        
+        Args:
+            data: Index data
+        
+        Returns:
+            Asset index
+        """
+        index = cls()
+        for template, references in data["templates"].items():
+            index.add(template, (AssetReference(**reference) for reference in references))
+        return index
+    
+    def save(self, path: str) -> None:
+        """
+        Write the index as JSON, replacing path atomically.
+        
+        Args:
+            path: Path to output file
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with atomic_write(path) as file:
+            json.dump(self.to_dict(), file, indent=2)
+            file.write("\n")
+    
+    @classmethod
+    def load(cls, path: str) -> "AssetIndex":
+        """
+        Read an index written by save().
+        
+        Args:
+            path: Path to index file
+        
+        Returns:
+            Asset index
+        """
+        with open(path, "r", encoding="utf-8") as file:
+            return cls.from_dict(json.load(file))
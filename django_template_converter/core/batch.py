@@ -0,0 +1,390 @@
+"""
+Batch conversion of template directories
+
+This module converts every matching file of a directory tree, keeping the
+directory layout, on a pool of worker processes.
+"""
+
+import fnmatch
+import os
+import shutil
+import time
+from itertools import repeat
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple
+
+from .assets import AssetIndex, AssetReference
+from .cache import ConversionCache, SourceState, source_state
+from .converter import DjangoTemplateConverter
+from .profiling import ConversionStats
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+
+# Converter reused by all tasks of a worker process
+_worker_converter = None
+
+
+def _init_worker(converter_options: Dict[str, Any]) -> None:
+    """Create the converter of a worker process"""
+    global _worker_converter
+    _worker_converter = DjangoTemplateConverter(**converter_options)
+
+
+def _convert_in_worker(
+    input_path: str,
+    output_path: str,
+    profile: bool = False,
+    index: bool = False,
+    track: bool = False
+) -> Tuple[Optional[Dict[str, Any]], Optional[List[AssetReference]], Optional[SourceState]]:
+    """
+    Convert a single file with the worker's converter.
+    
+    Returns:
+        Statistics of the file if profile is set, its referenced static
+        files if index is set and the state of the converted input if
+        track is set, to be merged by the parent
+    """
+    _worker_converter.stats = ConversionStats() if profile else None
+    references = [] if index else None
+    source = _worker_converter._convert_file(input_path, output_path, references, track)
+    stats = _worker_converter.stats
+    return (stats.to_dict() if stats is not None else None), references, source
+
+
+class FileResult(NamedTuple):
+    """Outcome of converting one file with convert_job"""
+    input_path: str
+    output_path: str
+    seconds: float
+    bytes_in: int
+    bytes_out: int
+    error: Optional[str] = None
+
+
+def create_pool(
+    workers: Optional[int] = None,
+    converter_options: Optional[Dict[str, Any]] = None
+) -> "ProcessPoolExecutor":
+    """
+    Create a process pool whose workers each hold one converter.
+    
+    Submit convert_job to the returned executor.
+    
+    Args:
+        workers: Number of worker processes (default: CPU count)
+        converter_options: Options passed to DjangoTemplateConverter
+    
+    Returns:
+        Process pool executor
+    """
+    # multiprocessing is slow to import and only needed for pooled runs
+    from concurrent.futures import ProcessPoolExecutor
+    
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(converter_options or {},)
+    )
+
+
+def convert_job(input_path: str, output_path: str) -> FileResult:
+    """
+    Convert one file in a create_pool worker and measure it.
+    
+    Errors are reported in the result instead of being raised.
+    
+    Args:
+        input_path: Path to input file
+        output_path: Path to output file
+    
+    Returns:
+        Conversion result
+    """
+    start = time.perf_counter()
+    try:
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        _worker_converter.convert_file(input_path, output_path)
+        return FileResult(
+            input_path, output_path, time.perf_counter() - start,
+            os.path.getsize(input_path), os.path.getsize(output_path)
+        )
+    except (OSError, ValueError) as e:
+        return FileResult(
+            input_path, output_path, time.perf_counter() - start, 0, 0, str(e)
+        )
+
+
+def find_templates(
+    src_dir: str,
+    pattern: str = "*.html",
+    exclude_dir: Optional[str] = None
+) -> List[Path]:
+    """
+    Find templates in a directory tree.
+    
+    Symbolic links to directories are not followed.
+    
+    Args:
+        src_dir: Source directory
+        pattern: Glob pattern of template file names
+        exclude_dir: Directory to skip if it is inside src_dir, e.g. the
+            output directory
+    
+    Returns:
+        Sorted list of template paths
+    
+    Raises:
+        ValueError: If exclude_dir is src_dir itself
+    """
+    source = os.path.normpath(src_dir)
+    skipped = None
+    if exclude_dir:
+        # Resolve once and prune the walk at the excluded directory, instead
+        # of resolving every file: the watcher calls this on every poll
+        try:
+            relative = os.path.relpath(os.path.realpath(exclude_dir), os.path.realpath(source))
+        except ValueError:
+            relative = os.pardir
+        if relative == os.curdir:
+            raise ValueError(f"Output directory is the source directory: {src_dir}")
+        if relative.split(os.sep, 1)[0] != os.pardir:
+            skipped = os.path.join(source, relative)
+    
+    templates = []
+    directories = [source]
+    while directories:
+        try:
+            entries = os.scandir(directories.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.path != skipped:
+                        directories.append(entry.path)
+                elif fnmatch.fnmatch(entry.name, pattern) and entry.is_file():
+                    templates.append(Path(entry.path))
+    return sorted(templates)
+
+
+def plan_tree(
+    src_dir: str,
+    dst_dir: str,
+    pattern: str = "*.html"
+) -> List[Tuple[str, str]]:
+    """
+    Map every template of src_dir to its path under dst_dir.
+    
+    Args:
+        src_dir: Source directory
+        dst_dir: Destination directory
+        pattern: Glob pattern of template file names
+    
+    Returns:
+        List of (input path, output path) pairs
+    """
+    source = Path(src_dir)
+    destination = Path(dst_dir)
+    
+    jobs = []
+    for path in find_templates(src_dir, pattern, exclude_dir=dst_dir):
+        jobs.append((str(path), str(destination / path.relative_to(source))))
+    return jobs
+
+
+def group_identical(
+    jobs: List[Tuple[str, str]]
+) -> Tuple[
+    List[Tuple[str, str]],
+    List[Tuple[str, str, Tuple[str, str]]],
+    Dict[str, SourceState]
+]:
+    """
+    Group jobs whose inputs have the same content.
+    
+    Args:
+        jobs: (input path, output path) pairs
+    
+    Returns:
+        The first job of every distinct input content, the (input path,
+        output path, first job) triple of every other job, and the state
+        of every input when it was hashed
+    """
+    first = {}
+    unique = []
+    copies = []
+    states = {}
+    for job in jobs:
+        states[job[0]] = source_state(job[0])
+        primary = first.setdefault(states[job[0]].hash, job)
+        if primary is job:
+            unique.append(job)
+        else:
+            copies.append((job[0], job[1], primary))
+    return unique, copies, states
+
+
+def _replicate(source: str, destination: str, hardlink: bool = False) -> None:
+    """
+    Give destination the content of source.
+    
+    Args:
+        source: Path to existing file
+        destination: Path to create or replace
+        hardlink: Link instead of copying; falls back to a copy where
+            links are not supported, e.g. across file systems
+    """
+    if os.path.lexists(destination):
+        os.unlink(destination)
+    if hardlink:
+        try:
+            os.link(source, destination)
+            return
+        except OSError:
+            pass
+    shutil.copyfile(source, destination)
+
+
+def convert_tree(
+    src_dir: str,
+    dst_dir: str,
+    pattern: str = "*.html",
+    workers: Optional[int] = None,
+    incremental: bool = False,
+    stats: Optional[ConversionStats] = None,
+    assets: Optional[AssetIndex] = None,
+    deduplicate: bool = True,
+    hardlink: bool = False,
+    **converter_options: Any
+) -> List[str]:
+    """
+    Convert all templates of a directory tree.
+    
+    Each worker process creates one DjangoTemplateConverter and reuses it for
+    all of its files. With workers=1 the conversion runs in this process.
+    
+    With incremental=True a ConversionCache manifest is kept in dst_dir and
+    files whose output is up to date are skipped.
+    
+    With an AssetIndex the static files referenced by every template are
+    collected during the conversion, keyed on the template path relative
+    to src_dir. Skipped files contribute the references stored in the cache.
+    
+    With deduplicate=True the inputs are hashed first and every distinct
+    content is converted once; files with the same content get a copy of
+    its output, or a hard link with hardlink=True. Outputs that are hard
+    links are replaced, never written through, so linked files stay
+    unchanged.
+    
+    Args:
+        src_dir: Source directory
+        dst_dir: Destination directory, the source layout is kept
+        pattern: Glob pattern of template file names
+        workers: Number of worker processes (default: CPU count)
+        incremental: Skip files that have not changed since the last run
+        stats: Statistics to add the per-stage timings of all files to,
+            including those converted by worker processes (optional)
+        assets: Asset index to add the references of all templates to (optional)
+        deduplicate: Convert byte-identical inputs only once
+        hardlink: Hard link the outputs of identical inputs instead of copying
+        **converter_options: Options passed to DjangoTemplateConverter
+    
+    Returns:
+        List of output file paths
+    
+    Raises:
+        FileNotFoundError: If src_dir doesn't exist
+        ValueError: If dst_dir is src_dir itself
+    """
+    if not Path(src_dir).is_dir():
+        raise FileNotFoundError(f"Source directory not found: {src_dir}")
+    
+    jobs = plan_tree(src_dir, dst_dir, pattern)
+    if not jobs:
+        return []
+    
+    converter = DjangoTemplateConverter(stats=stats, **converter_options)
+    planned = jobs
+    outputs = [output_path for _, output_path in jobs]
+    
+    # Input path -> referenced static files, collected only for an index
+    references = {}
+    cache = ConversionCache(dst_dir) if incremental else None
+    if cache is not None:
+        pending = []
+        for input_path, output_path in jobs:
+            if cache.is_current(input_path, output_path, converter.fingerprint):
+                if assets is None:
+                    continue
+                cached = cache.assets(output_path)
+                if cached is not None:
+                    references[input_path] = cached
+                    continue
+            pending.append((input_path, output_path))
+        jobs = pending
+    
+    for _, output_path in jobs:
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        # Writing to a hard link would change the files linked to it
+        if os.path.isfile(output_path) and os.stat(output_path).st_nlink > 1:
+            os.unlink(output_path)
+    
+    # Identical inputs are converted once, their output is copied
+    unique, copies, states = group_identical(jobs) if deduplicate else (jobs, [], {})
+    
+    # Input path -> state of the converted content, recorded in the cache
+    sources = {}
+    track = cache is not None or bool(copies)
+    workers = min(workers or os.cpu_count() or 1, len(unique))
+    if workers <= 1:
+        for input_path, output_path in unique:
+            found = [] if assets is not None else None
+            sources[input_path] = converter._convert_file(input_path, output_path, found, track)
+            references[input_path] = found
+    else:
+        # Hand out several files per task to keep inter-process overhead low
+        chunksize = max(1, len(unique) // (workers * 4))
+        with create_pool(workers, converter_options) as executor:
+            results = list(executor.map(
+                _convert_in_worker,
+                [input_path for input_path, _ in unique],
+                [output_path for _, output_path in unique],
+                repeat(stats is not None),
+                repeat(assets is not None),
+                repeat(track),
+                chunksize=chunksize
+            ))
+        for (input_path, _), (file_stats, found, source) in zip(unique, results):
+            if file_stats is not None:
+                stats.merge(file_stats)
+            references[input_path] = found
+            sources[input_path] = source
+    
+    for input_path, output_path, (primary_input, primary_output) in copies:
+        if sources[primary_input].hash == states[primary_input].hash:
+            _replicate(primary_output, output_path, hardlink)
+            references[input_path] = references[primary_input]
+            sources[input_path] = states[input_path]
+        else:
+            # The first file was saved after hashing, convert this one itself
+            found = [] if assets is not None else None
+            sources[input_path] = converter._convert_file(input_path, output_path, found, True)
+            references[input_path] = found
+    
+    if cache is not None:
+        for input_path, output_path in jobs:
+            cache.record(
+                input_path, output_path, converter.fingerprint,
+                assets=references.get(input_path), source=sources[input_path]
+            )
+        cache.save()
+    
+    if assets is not None:
+        source = Path(src_dir)
+        for input_path, _ in planned:
+            assets.add(Path(input_path).relative_to(source).as_posix(), references[input_path])
+    
+    return outputs
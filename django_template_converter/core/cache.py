@@ -0,0 +1,236 @@
+"""
+Incremental conversion cache
+
+This module keeps a JSON manifest in the output directory that records,
+for every output file, the hash of its input, the converter version and
+the converter options. Files whose entry still matches are not converted
+again.
+"""
+
+import hashlib
+import io
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .. import __version__
+from ..utils.helpers import atomic_write
+from .assets import AssetReference
+
+
+MANIFEST_NAME = ".django-template-converter-cache.json"
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path: str) -> str:
+    """
+    Compute the SHA-256 hash of a file.
+    
+    Args:
+        path: Path to file
+    
+    Returns:
+        Hex digest of the file content
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SourceState(NamedTuple):
+    """Content hash, size and modification time of a converted input"""
+    hash: str
+    size: int
+    mtime_ns: int
+
+
+def source_state(path: str) -> SourceState:
+    """
+    Hash a file and stat it before reading it.
+    
+    A file saved while it is hashed gets a newer modification time than
+    the recorded one, so a cache entry made from the state is checked
+    again by content.
+    
+    Args:
+        path: Path to file
+    
+    Returns:
+        State of the hashed content
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        stat = os.fstat(file.fileno())
+        for chunk in iter(lambda: file.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return SourceState(digest.hexdigest(), stat.st_size, stat.st_mtime_ns)
+
+
+def read_source(path: str, encoding: str = "utf-8") -> Tuple[str, SourceState]:
+    """
+    Read a text file together with the state of the bytes read.
+    
+    The text is decoded with universal newlines, as open() in text mode
+    does. Record the returned state for the output converted from the
+    text, so a save during the conversion is not mistaken for the input
+    of that output.
+    
+    Args:
+        path: Path to file
+        encoding: Text encoding
+    
+    Returns:
+        Decoded text and its state
+    """
+    with open(path, "rb") as file:
+        stat = os.fstat(file.fileno())
+        data = file.read()
+    text = io.TextIOWrapper(io.BytesIO(data), encoding=encoding).read()
+    return text, SourceState(hashlib.sha256(data).hexdigest(), stat.st_size, stat.st_mtime_ns)
+
+
+class ConversionCache:
+    """
+    Manifest of converted files, keyed on the output path.
+    
+    An entry is current when the converter version and options fingerprint
+    match, the output exists and the input content hash is unchanged. The
+    input size and modification time are stored as well, so unchanged files
+    are recognized without reading them.
+    
+    Use as a context manager, or call save() after the conversions.
+    """
+    
+    def __init__(self, directory: str):
+        """
+        Initialize the cache and load its manifest.
+        
+        Args:
+            directory: Directory holding the manifest, usually the output directory
+        """
+        self.directory = Path(directory)
+        self.path = self.directory / MANIFEST_NAME
+        self._entries = self._load()
+        self._dirty = False
+    
+    def __enter__(self) -> "ConversionCache":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.save()
+    
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load the manifest, starting empty if it is missing or invalid"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                manifest = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(manifest, dict) or manifest.get("version") != __version__:
+            return {}
+        entries = manifest.get("entries")
+        return entries if isinstance(entries, dict) else {}
+    
+    def _key(self, output_path: str) -> str:
+        """Manifest key of an output file"""
+        return os.path.relpath(os.path.abspath(output_path), os.path.abspath(self.directory))
+    
+    def is_current(self, input_path: str, output_path: str, fingerprint: str) -> bool:
+        """
+        Check whether an output file is up to date.
+        
+        Args:
+            input_path: Path to input file
+            output_path: Path to output file
+            fingerprint: Options fingerprint of the converter
+        
+        Returns:
+            True if the output does not need to be converted again
+        """
+        entry = self._entries.get(self._key(output_path))
+        if entry is None or entry.get("fingerprint") != fingerprint:
+            return False
+        if entry.get("input") != os.path.abspath(input_path):
+            return False
+        if not os.path.exists(output_path):
+            return False
+        
+        stat = os.stat(input_path)
+        if entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            return True
+        
+        # Touched or rewritten: compare the content
+        digest = hash_file(input_path)
+        if entry.get("hash") != digest:
+            return False
+        
+        entry["size"] = stat.st_size
+        entry["mtime_ns"] = stat.st_mtime_ns
+        self._dirty = True
+        return True
+    
+    def record(
+        self,
+        input_path: str,
+        output_path: str,
+        fingerprint: str,
+        assets: Optional[Iterable[AssetReference]] = None,
+        source: Optional[SourceState] = None
+    ) -> None:
+        """
+        Record a converted file.
+        
+        Args:
+            input_path: Path to input file
+            output_path: Path to output file
+            fingerprint: Options fingerprint of the converter
+            assets: Static files referenced by the output, returned by
+                assets() while the entry is current (optional)
+            source: State of the input content the output was converted
+                from, see read_source(). Without it the input is hashed
+                now, which records a newer version if the file was saved
+                during the conversion (optional)
+        """
+        if source is None:
+            source = source_state(input_path)
+        entry = {
+            "input": os.path.abspath(input_path),
+            "hash": source.hash,
+            "size": source.size,
+            "mtime_ns": source.mtime_ns,
+            "fingerprint": fingerprint,
+        }
+        if assets is not None:
+            entry["assets"] = [list(reference) for reference in assets]
+        self._entries[self._key(output_path)] = entry
+        self._dirty = True
+    
+    def assets(self, output_path: str) -> Optional[List[AssetReference]]:
+        """
+        Static files referenced by a recorded output.
+        
+        Args:
+            output_path: Path to output file
+        
+        Returns:
+            References, or None if they were not recorded
+        """
+        entry = self._entries.get(self._key(output_path))
+        if entry is None or "assets" not in entry:
+            return None
+        return [AssetReference(*reference) for reference in entry["assets"]]
+    
+    def save(self) -> None:
+        """Write the manifest atomically if it has changed"""
+        if not self._dirty:
+            return
+        
+        self.directory.mkdir(parents=True, exist_ok=True)
+        manifest = {"version": __version__, "entries": self._entries}
+        with atomic_write(str(self.path)) as file:
+            json.dump(manifest, file, indent=1, sort_keys=True)
+        self._dirty = False
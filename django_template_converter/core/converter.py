@@ -4,9 +4,93 @@ Core converter logic for converting HTML to Django templates
 This module contains the main conversion logic that is independent of GUI.
 """
 
+import hashlib
+import json
+import re
+import time
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional
-from bs4 import BeautifulSoup
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..utils.helpers import generate_output_path
+from .assets import AssetReference, static_paths
+from .cache import SourceState, read_source
+from .matcher import DEFAULT_EXCLUDED_PREFIXES, UrlMatcher
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    
+    from bs4 import BeautifulSoup
+    
+    from .cache import ConversionCache
+    from .profiling import ConversionStats
+
+
+LOAD_STATIC_TAG = '{% load static %}'
+
+# Parser backends. BeautifulSoup tree builders are listed by their feature
+# name; "lxml.html" works on the raw lxml tree and skips BeautifulSoup.
+BEAUTIFULSOUP_PARSERS = ("html.parser", "lxml")
+LXML_HTML_PARSER = "lxml.html"
+PARSERS = BEAUTIFULSOUP_PARSERS + (LXML_HTML_PARSER,)
+
+# Placeholder for rewritten attribute values in the raw lxml backend. lxml
+# escapes double quotes inside attributes (and URL-escapes href/src), which
+# would break the generated {% static "..." %} tags, so values are
+# substituted after serialization.
+_PLACEHOLDER = "__django_template_converter_{}__"
+_PLACEHOLDER_RE = re.compile(r'"__django_template_converter_(\d+)__"')
+_LXML_URI_ATTRIBUTES = ("href", "src", "action", "name")
+_LXML_ESCAPED_RE = re.compile(r'[^\x21-\x7e]|["<>\\^`{|}]')
+_DOCTYPE_RE = re.compile(r'<!doctype', re.IGNORECASE)
+_DEFAULT_DOCTYPE_RE = re.compile(r'<!DOCTYPE[^>]*>\n?')
+_XML_DECLARATION_RE = re.compile(r'\s*<\?xml\b[^>]*\?>\n?')
+
+# srcset candidates: a URL (leading whitespace and commas skipped), then the
+# descriptors up to the next comma. A URL ending in a comma has none.
+_SRCSET_URL_RE = re.compile(r'[\s,]*(\S+)')
+_SRCSET_DESCRIPTORS_RE = re.compile(r'\s*([^,]*?)\s*(?:,|$)')
+
+# CSS url() reference: a double-quoted, single-quoted or unquoted URL
+_CSS_URL_RE = re.compile(
+    r'url\(\s*(?:"([^"]*)"|\'([^\']*)\'|([^"\'()\s]+))\s*\)',
+    re.IGNORECASE
+)
+
+DEFAULT_CACHE_SIZE = 4096
+
+# Files converted at the same time by convert_files_async
+DEFAULT_CONCURRENCY = 8
+
+# Pseudo tag and attribute names of the rewrite rules: a rule for
+# WILDCARD_TAG applies to every element, and a TEXT_CONTENT rule rewrites
+# the text of the element instead of an attribute.
+WILDCARD_TAG = "*"
+TEXT_CONTENT = "#text"
+
+# (tag, attribute, handler name) triples rewritten by the converter.
+# Handlers receive the attribute value and return the new value, or None
+# to leave the attribute untouched.
+REWRITE_RULES = (
+    ("link", "href", "_rewrite_url"),
+    ("script", "src", "_rewrite_url"),
+    ("img", "src", "_rewrite_url"),
+    ("img", "srcset", "_rewrite_srcset"),
+    ("source", "src", "_rewrite_url"),
+    ("source", "srcset", "_rewrite_srcset"),
+    ("video", "src", "_rewrite_url"),
+    ("video", "poster", "_rewrite_url"),
+    ("audio", "src", "_rewrite_url"),
+    ("track", "src", "_rewrite_url"),
+    ("embed", "src", "_rewrite_url"),
+    ("object", "data", "_rewrite_url"),
+    ("input", "src", "_rewrite_url"),
+    (WILDCARD_TAG, "style", "_rewrite_css"),
+    ("style", TEXT_CONTENT, "_rewrite_stylesheet"),
+)
+
+# Handler names that rewrite rules may use
+REWRITE_HANDLERS = ("_rewrite_url", "_rewrite_srcset", "_rewrite_css", "_rewrite_stylesheet")
 
 
 class DjangoTemplateConverter:
@@ -16,16 +100,153 @@ class DjangoTemplateConverter:
     This class manages all conversion logic without GUI dependencies.
     """
     
-    def __init__(self):
-        """Initialize the converter"""
-        self._excluded_prefixes = [
-            "http://", "https://", "//", "data:", "{%"
+    def __init__(
+        self, 
+        parser: str = "html.parser",
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        exclude_prefixes: Iterable[str] = (),
+        exclude_patterns: Iterable[str] = (),
+        exclude_globs: Iterable[str] = (),
+        stats: Optional["ConversionStats"] = None,
+        rewrite_rules: Iterable[Tuple[str, str, str]] = REWRITE_RULES,
+        prescan: bool = False
+    ):
+        """
+        Initialize the converter.
+        
+        Args:
+            parser: Parser backend, one of PARSERS
+            cache_size: Maximum number of memoized attribute values
+            exclude_prefixes: Additional URL prefixes to leave unchanged
+            exclude_patterns: Regular expressions of URLs to leave unchanged
+            exclude_globs: Glob patterns of URLs to leave unchanged
+            stats: Statistics that every conversion adds its per-stage
+                timings and counters to (optional)
+            rewrite_rules: (tag, attribute, handler name) triples to rewrite,
+                handler names taken from REWRITE_HANDLERS (default: REWRITE_RULES)
+            prescan: Scan documents for rewritable values before parsing
+                them; documents without any are returned as they are, with
+                only {% load static %} added, instead of being re-serialized
+            
+        Raises:
+            ValueError: If parser is not a supported backend, or a rewrite
+                rule uses an unknown handler
+            re.error: If an exclusion pattern is invalid
+        """
+        if parser not in PARSERS:
+            raise ValueError(
+                f"Unsupported parser: {parser!r} (expected one of {', '.join(PARSERS)})"
+            )
+        self.parser = parser
+        self.stats = stats
+        self._url_matcher = UrlMatcher(
+            DEFAULT_EXCLUDED_PREFIXES + tuple(exclude_prefixes),
+            exclude_patterns,
+            exclude_globs
+        )
+        # Templates repeat the same asset URLs and srcset strings, so
+        # rewritten attribute values are memoized per handler and value
+        self._cached_rewrite = lru_cache(maxsize=cache_size)(self._rewrite_value)
+        self.rewrite_rules = tuple(tuple(rule) for rule in rewrite_rules)
+        self._build_rewrite_table(self.rewrite_rules)
+        self.prescan = prescan
+    
+    def cache_info(self):
+        """
+        Get statistics of the rewritten value cache.
+        
+        Returns:
+            functools cache info with hits, misses, maxsize and currsize
+        """
+        return self._cached_rewrite.cache_info()
+    
+    def cache_clear(self) -> None:
+        """Clear the rewritten value cache"""
+        self._cached_rewrite.cache_clear()
+    
+    @property
+    def options(self) -> Dict[str, Any]:
+        """Options that affect the conversion output"""
+        return {
+            "parser": self.parser,
+            "exclude": self._url_matcher.to_dict(),
+            "rewrite_rules": self.rewrite_rules,
+            "prescan": self.prescan,
+        }
+    
+    @property
+    def fingerprint(self) -> str:
+        """Short hash of the options, used to invalidate cached outputs"""
+        data = json.dumps(self.options, sort_keys=True, default=str)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()[:16]
+    
+    def _build_rewrite_table(self, rules: Tuple[Tuple[str, str, str], ...]) -> None:
+        """
+        Build the lookup tables of the rewrite rules.
+        
+        _rewrite_table maps a tag to its [(attribute, handler), ...] list,
+        wildcard rules included; tags without rules of their own use
+        _wildcard_rules. _text_rewrites maps a tag to the handler of its
+        text. _rewrite_tag_names lists the tags to visit, or is None when
+        every element has to be visited. _prescan_re finds the attribute
+        assignments and text elements that rules apply to.
+        
+        Args:
+            rules: (tag, attribute, handler name) triples
+            
+        Raises:
+            ValueError: If a rule uses an unknown handler
+        """
+        table = {}
+        wildcard_rules = []
+        text_rewrites = {}
+        for tag, attribute, handler_name in rules:
+            if handler_name not in REWRITE_HANDLERS:
+                raise ValueError(
+                    f"Unknown rewrite handler: {handler_name!r} "
+                    f"(expected one of {', '.join(REWRITE_HANDLERS)})"
+                )
+            if attribute == TEXT_CONTENT:
+                # Text content is rarely repeated, so it is not memoized
+                text_rewrites[tag] = getattr(self, handler_name)
+                continue
+            handler = partial(self._cached_rewrite, handler_name)
+            if tag == WILDCARD_TAG:
+                wildcard_rules.append((attribute, handler))
+            else:
+                table.setdefault(tag, []).append((attribute, handler))
+        
+        for tag in text_rewrites:
+            table.setdefault(tag, [])
+        for tag_rules in table.values():
+            tag_rules.extend(wildcard_rules)
+        
+        self._rewrite_table = table
+        self._wildcard_rules = wildcard_rules
+        self._text_rewrites = text_rewrites
+        self._rewrite_tag_names = None if wildcard_rules else list(table)
+        
+        candidates = [
+            re.escape(attribute) + r'\s*='
+            for attribute in sorted({attribute for rules in table.values() for attribute, _ in rules})
         ]
+        candidates.extend('<' + re.escape(tag) for tag in sorted(text_rewrites))
+        self._prescan_re = re.compile('|'.join(candidates) or r'(?!)', re.IGNORECASE)
+    
+    def _attribute_rules(self, tag: str) -> List[Tuple[str, Callable[[str], Optional[str]]]]:
+        """Attribute handlers of a tag"""
+        return self._rewrite_table.get(tag, self._wildcard_rules)
+    
+    def _rewrite_value(self, handler_name: str, value: str) -> Optional[str]:
+        """Call a rewrite handler (memoized through _cached_rewrite)"""
+        return getattr(self, handler_name)(value)
     
     def convert_file(
         self, 
         input_path: str, 
-        output_path: Optional[str] = None
+        output_path: Optional[str] = None,
+        cache: Optional["ConversionCache"] = None,
+        references: Optional[List[AssetReference]] = None
     ) -> str:
         """
         Convert HTML file to Django template.
@@ -33,6 +254,10 @@ class DjangoTemplateConverter:
         Args:
             input_path: Path to input HTML file
             output_path: Path to output file (optional)
+            cache: Conversion cache; the file is skipped if its output
+                is up to date (optional)
+            references: List to append the referenced static files to; a
+                skipped file adds the references stored in the cache (optional)
             
         Returns:
             Output file path
@@ -45,151 +270,554 @@ class DjangoTemplateConverter:
         if not input_file.exists():
             raise FileNotFoundError(f"Input file not found: {input_path}")
         
+        # Determine output path
+        if not output_path:
+            output_path = generate_output_path(input_path)
+        
+        # Skip files whose output is up to date
+        if cache is not None and cache.is_current(input_path, output_path, self.fingerprint):
+            cached = cache.assets(output_path) if references is not None else ()
+            if cached is not None:
+                if references is not None:
+                    references.extend(cached)
+                return output_path
+        
+        found = [] if references is not None else None
+        source = self._convert_file(input_path, output_path, found, track=cache is not None)
+        
+        if found is not None:
+            references.extend(found)
+        if cache is not None:
+            cache.record(input_path, output_path, self.fingerprint, assets=found, source=source)
+        
+        return output_path
+    
+    def _convert_file(
+        self,
+        input_path: str,
+        output_path: str,
+        references: Optional[List[AssetReference]] = None,
+        track: bool = False
+    ) -> Optional[SourceState]:
+        """
+        Read, convert and write one file.
+        
+        Args:
+            input_path: Path to input HTML file
+            output_path: Path to output file
+            references: List to append the referenced static files to (optional)
+            track: Hash the content that is read, to record it in a cache
+            
+        Returns:
+            State of the converted input content if track is set, else None
+        """
         # Read HTML file
-        with open(input_path, "r", encoding="utf-8") as file:
-            html_content = file.read()
+        start = time.perf_counter()
+        source = None
+        if track:
+            html_content, source = read_source(input_path)
+        else:
+            with open(input_path, "r", encoding="utf-8") as file:
+                html_content = file.read()
+        read = time.perf_counter()
         
         # Convert content
-        converted_html = self.convert_string(html_content)
-        
-        # Determine output path
-        if not output_path:
-            output_path = str(
-                input_file.parent / f"{input_file.stem}_django{input_file.suffix}"
-            )
+        converted_html = self.convert_string(html_content, references)
         
         # Save file
+        converted = time.perf_counter()
         with open(output_path, "w", encoding="utf-8") as file:
             file.write(converted_html)
         
-        return output_path
+        if self.stats is not None:
+            self.stats.add("read", read - start)
+            self.stats.add("write", time.perf_counter() - converted)
+        return source
     
-    def convert_string(self, html_content: str) -> str:
+    def convert_string(
+        self,
+        html_content: str,
+        references: Optional[List[AssetReference]] = None
+    ) -> str:
         """
         Convert HTML content string to Django template.
         
         Args:
             html_content: HTML content as string
+            references: List to append the static files referenced by the
+                converted content to, in document order (optional)
             
         Returns:
             Converted Django template content
         """
-        soup = BeautifulSoup(html_content, "html.parser")
+        # Fast path: nothing to rewrite, and no existing static tags to index
+        if self.prescan:
+            if not self._may_rewrite(html_content) and (
+                references is None or not static_paths(html_content)
+            ):
+                # Counted apart from parsed documents, and without a stage:
+                # the scan is no parse
+                if self.stats is not None:
+                    self.stats.skipped += 1
+                if LOAD_STATIC_TAG in html_content:
+                    return html_content
+                return LOAD_STATIC_TAG + '\n' + html_content
+        
+        if self.parser == LXML_HTML_PARSER:
+            return self._convert_with_lxml(html_content, references)
+        
+        # Imported here so that only the selected parser backend is loaded
+        from bs4 import BeautifulSoup
+        
+        start = time.perf_counter()
+        soup = BeautifulSoup(html_content, self.parser)
+        parsed = time.perf_counter()
         
         # Add {% load static %} tag
-        self._add_load_static_tag(soup)
+        self._add_load_static_tag(soup, html_content)
+        loaded = time.perf_counter()
+        
+        # Convert static references of all tags in one pass
+        elements, rewrites = self._rewrite_tags(soup, references)
+        rewritten = time.perf_counter()
+        
+        output = str(soup)
+        if self.stats is not None:
+            self._record_stats(
+                start,
+                (("parse", parsed), ("load_static", loaded),
+                 ("rewrite", rewritten), ("serialize", time.perf_counter())),
+                elements,
+                rewrites
+            )
+        return output
+    
+    async def convert_string_async(
+        self,
+        html_content: str,
+        executor: Optional["Executor"] = None
+    ) -> str:
+        """
+        Convert HTML content string without blocking the event loop.
+        
+        The conversion runs in executor, a thread pool that can call this
+        converter's methods.
+        
+        Args:
+            html_content: HTML content as string
+            executor: Executor for the conversion (default: the loop's default executor)
+            
+        Returns:
+            Converted Django template content
+        """
+        import asyncio
         
-        # Convert different types of links
-        self._convert_links(soup)
-        self._convert_scripts(soup)
-        self._convert_images(soup)
-        self._convert_sources(soup)
-        self._convert_srcsets(soup)
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(executor, self.convert_string, html_content)
+    
+    async def convert_files_async(
+        self,
+        input_paths: Iterable[str],
+        output_paths: Optional[Iterable[Optional[str]]] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        executor: Optional["Executor"] = None
+    ) -> List[str]:
+        """
+        Convert HTML files concurrently without blocking the event loop.
+        
+        Reading, converting and writing each run in executor, so the I/O of
+        some files overlaps the parsing of others. At most concurrency files
+        are in progress at a time, which also bounds the memory held by
+        their contents.
+        
+        The files share this converter across executor threads and
+        self.stats is not updated atomically, so statistics can only be
+        collected with concurrency=1.
+        
+        Args:
+            input_paths: Paths to input HTML files
+            output_paths: Paths to output files, in the order of input_paths;
+                a missing path is derived as in convert_file (optional)
+            concurrency: Maximum number of files converted at the same time
+            executor: Executor for I/O and conversions (default: the loop's
+                default executor)
+            
+        Returns:
+            Output file paths, in the order of input_paths
+            
+        Raises:
+            ValueError: If output_paths and input_paths differ in length, or
+                stats is set and concurrency is above 1
+            FileNotFoundError: If an input file doesn't exist
+        """
+        import asyncio
+        
+        if self.stats is not None and concurrency > 1:
+            raise ValueError("convert_files_async needs concurrency=1 to collect stats")
+        
+        input_paths = list(input_paths)
+        output_paths = [None] * len(input_paths) if output_paths is None else list(output_paths)
+        if len(output_paths) != len(input_paths):
+            raise ValueError("output_paths must have one entry per input path")
+        
+        loop = asyncio.get_event_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def convert(input_path: str, output_path: Optional[str]) -> str:
+            async with semaphore:
+                output_path = output_path or generate_output_path(input_path)
+                html_content = await loop.run_in_executor(executor, _read_text, input_path)
+                converted_html = await self.convert_string_async(html_content, executor)
+                await loop.run_in_executor(executor, _write_text, output_path, converted_html)
+                return output_path
+        
+        return list(await asyncio.gather(*(
+            convert(input_path, output_path)
+            for input_path, output_path in zip(input_paths, output_paths)
+        )))
+    
+    def _may_rewrite(self, html_content: str) -> bool:
+        """Check whether the pre-scan finds a value to rewrite"""
+        # Imported here to avoid a circular import
+        from .streaming import may_rewrite
+        
+        return may_rewrite(self, html_content)
+    
+    def _record_stats(
+        self,
+        start: float,
+        marks: Tuple[Tuple[str, float], ...],
+        elements: int,
+        rewrites: int
+    ) -> None:
+        """
+        Add the timings and counters of one conversion to self.stats.
+        
+        Args:
+            start: perf_counter() value when the first stage started
+            marks: (stage, perf_counter() value when it ended) pairs in order
+            elements: Number of elements checked for static references
+            rewrites: Number of rewritten attribute values
+        """
+        for stage, end in marks:
+            self.stats.add(stage, end - start)
+            start = end
+        self.stats.documents += 1
+        self.stats.elements += elements
+        self.stats.rewrites += rewrites
+    
+    def _convert_with_lxml(
+        self,
+        html_content: str,
+        references: Optional[List[AssetReference]] = None
+    ) -> str:
+        """
+        Convert HTML content using the raw lxml.html tree.
+        
+        Like the "lxml" BeautifulSoup backend, lxml always produces a full
+        document, so fragments are wrapped in <html><body>.
         
-        return str(soup)
+        Args:
+            html_content: HTML content as string
+            references: List to append the referenced static files to (optional)
+            
+        Returns:
+            Converted Django template content
+        """
+        import lxml.etree
+        import lxml.html
+        
+        if not html_content.strip():
+            return html_content if LOAD_STATIC_TAG in html_content else LOAD_STATIC_TAG + '\n'
+        
+        # lxml rejects str input with an XML declaration; it is parsed
+        # without it and copied to the output unchanged
+        declaration = _XML_DECLARATION_RE.match(html_content)
+        body = html_content[declaration.end():] if declaration else html_content
+        
+        start = time.perf_counter()
+        document = None
+        if body.strip():
+            document = lxml.etree.fromstring(body, lxml.html.html_parser)
+        parsed = time.perf_counter()
+        if document is None:
+            # No elements, e.g. a partial holding only comments or a doctype
+            if LOAD_STATIC_TAG in html_content:
+                return html_content
+            return LOAD_STATIC_TAG + '\n' + html_content
+        
+        elements = rewrites = 0
+        replacements = []
+        for element in document.iter(lxml.etree.Element):
+            elements += 1
+            for attribute, handler in self._attribute_rules(element.tag):
+                value = element.get(attribute)
+                if value is None:
+                    continue
+                new_value = handler(value)
+                if new_value is not None:
+                    element.set(attribute, _PLACEHOLDER.format(len(replacements)))
+                    replacements.append(new_value)
+                    rewrites += 1
+                    value = new_value
+                if references is not None:
+                    _add_references(references, element.tag, attribute, value)
+            
+            text_handler = self._text_rewrites.get(element.tag)
+            if text_handler is not None and element.text:
+                new_text = text_handler(element.text)
+                if new_text is not None:
+                    element.text = new_text
+                    rewrites += 1
+                if references is not None:
+                    _add_references(references, element.tag, TEXT_CONTENT, element.text)
+            
+            # Keep template tags in other URI attributes from being URL-escaped
+            for attribute in _LXML_URI_ATTRIBUTES:
+                value = element.get(attribute)
+                if value is not None and _LXML_ESCAPED_RE.search(value):
+                    element.set(attribute, _PLACEHOLDER.format(len(replacements)))
+                    replacements.append(value)
+        rewritten = time.perf_counter()
+        
+        if LOAD_STATIC_TAG not in html_content:
+            document.text = LOAD_STATIC_TAG + '\n' + (document.text or '')
+        loaded = time.perf_counter()
+        
+        # The whole tree keeps comments around the root element, but
+        # libxml2 adds a default doctype to documents that have none
+        output = lxml.html.tostring(document.getroottree(), encoding="unicode")
+        if not _DOCTYPE_RE.search(html_content):
+            match = _DEFAULT_DOCTYPE_RE.match(output)
+            if match:
+                output = output[match.end():]
+        output = _PLACEHOLDER_RE.sub(
+            lambda match: _quote_attribute(replacements[int(match.group(1))]),
+            output
+        )
+        if declaration:
+            output = declaration.group() + output
+        if self.stats is not None:
+            self._record_stats(
+                start,
+                (("parse", parsed), ("rewrite", rewritten),
+                 ("load_static", loaded), ("serialize", time.perf_counter())),
+                elements,
+                rewrites
+            )
+        return output
     
-    def _add_load_static_tag(self, soup: BeautifulSoup) -> None:
-        """Add {% load static %} tag at the beginning of the file"""
+    def _add_load_static_tag(self, soup: "BeautifulSoup", html_content: str) -> None:
+        """
+        Add {% load static %} tag at the beginning of the file.
+        
+        The check runs on the raw input so the tree is serialized only once,
+        at the end of the conversion.
+        
+        Args:
+            soup: Parsed document
+            html_content: Original HTML content
+        """
+        if LOAD_STATIC_TAG in html_content:
+            return
+        
+        load_static_tag = soup.new_string(LOAD_STATIC_TAG + '\n')
         if soup.html:
-            html_string = str(soup)
-            if '{% load static %}' not in html_string:
-                load_static_tag = soup.new_string('{% load static %}\n')
-                soup.html.insert(0, load_static_tag)
-    
-    def _convert_links(self, soup: BeautifulSoup) -> None:
-        """Convert <link> tags"""
-        for link in soup.find_all("link", href=True):
-            href = link['href']
-            if self._should_convert(href):
-                link['href'] = f'{{% static "{href}" %}}'
-    
-    def _convert_scripts(self, soup: BeautifulSoup) -> None:
-        """Convert <script> tags"""
-        for script in soup.find_all("script", src=True):
-            src = script['src']
-            if self._should_convert(src):
-                script['src'] = f'{{% static "{src}" %}}'
-    
-    def _convert_images(self, soup: BeautifulSoup) -> None:
-        """Convert <img> tags"""
-        for img in soup.find_all("img", src=True):
-            src = img['src']
-            if self._should_convert(src, include_data_uri=False):
-                img['src'] = f'{{% static "{src}" %}}'
-    
-    def _convert_sources(self, soup: BeautifulSoup) -> None:
-        """Convert <source> tags"""
-        for source in soup.find_all("source", src=True):
-            src = source['src']
-            if self._should_convert(src, include_data_uri=False):
-                source['src'] = f'{{% static "{src}" %}}'
-    
-    def _convert_srcsets(self, soup: BeautifulSoup) -> None:
-        """Convert srcset in <img> and <source> tags"""
-        # Convert srcset in <source>
-        for source in soup.find_all("source", srcset=True):
-            srcset = source['srcset']
-            if srcset and not srcset.startswith("{%"):
-                new_srcset = self._convert_srcset_string(srcset)
-                source['srcset'] = new_srcset
-        
-        # Convert srcset in <img>
-        for img in soup.find_all("img", srcset=True):
-            srcset = img['srcset']
-            if srcset and not srcset.startswith("{%"):
-                new_srcset = self._convert_srcset_string(srcset)
-                img['srcset'] = new_srcset
+            soup.html.insert(0, load_static_tag)
+        else:
+            # Partial templates need their own {% load static %} as well
+            soup.insert(0, load_static_tag)
+    
+    def _rewrite_tags(
+        self,
+        soup: "BeautifulSoup",
+        references: Optional[List[AssetReference]] = None
+    ) -> Tuple[int, int]:
+        """
+        Rewrite static references of all tags in a single traversal.
+        
+        Args:
+            soup: Parsed document
+            references: List to append the referenced static files to (optional)
+        
+        Returns:
+            Number of checked elements and of rewritten values
+        """
+        if self._rewrite_tag_names is None:
+            elements = soup.find_all(True)
+        else:
+            elements = soup.find_all(self._rewrite_tag_names)
+        rewrites = 0
+        for element in elements:
+            for attribute, handler in self._attribute_rules(element.name):
+                value = element.get(attribute)
+                if value is None:
+                    continue
+                new_value = handler(value)
+                if new_value is not None:
+                    element[attribute] = new_value
+                    rewrites += 1
+                    value = new_value
+                if references is not None:
+                    _add_references(references, element.name, attribute, value)
+            
+            text_handler = self._text_rewrites.get(element.name)
+            if text_handler is not None and element.string is not None:
+                text = str(element.string)
+                new_text = text_handler(text)
+                if new_text is not None:
+                    # Keep the string class (e.g. Stylesheet) of the content
+                    element.string.replace_with(type(element.string)(new_text))
+                    rewrites += 1
+                    text = new_text
+                if references is not None:
+                    _add_references(references, element.name, TEXT_CONTENT, text)
+        return len(elements), rewrites
+    
+    def _rewrite_url(self, url: str) -> Optional[str]:
+        """Rewrite a single URL attribute (href/src)"""
+        if self._should_convert(url):
+            return f'{{% static "{url}" %}}'
+        return None
+    
+    def _rewrite_srcset(self, srcset: str) -> Optional[str]:
+        """Rewrite a srcset attribute"""
+        if srcset and not srcset.startswith("{%"):
+            return self._convert_srcset_string(srcset)
+        return None
+    
+    def _rewrite_css(self, css: str) -> Optional[str]:
+        """Rewrite the url() references of a style attribute"""
+        # Static tag quotes must not clash with the quotes of the value, or
+        # the attribute could not be quoted without escaping them
+        if "'" in css:
+            if '"' in css:
+                return None
+            return self._rewrite_css_urls(css, "'")
+        return self._rewrite_css_urls(css, '"')
+    
+    def _rewrite_stylesheet(self, css: str) -> Optional[str]:
+        """Rewrite the url() references of a <style> element"""
+        return self._rewrite_css_urls(css, '"')
+    
+    def _rewrite_css_urls(self, css: str, quote: str) -> Optional[str]:
+        """
+        Rewrite CSS url() references with a single scan.
+        
+        Only the URLs are replaced, so the url() quotes and whitespace are
+        kept. Fragment references like url(#gradient) are left alone.
+        
+        Args:
+            css: CSS text
+            quote: Quote character of the generated static tags
+            
+        Returns:
+            Rewritten CSS text, or None if no URL was rewritten
+        """
+        pieces = None
+        last = 0
+        for match in _CSS_URL_RE.finditer(css):
+            group = match.lastindex
+            url = match.group(group)
+            if url.startswith("#") or quote in url or not self._should_convert(url):
+                continue
+            if pieces is None:
+                pieces = []
+            pieces.append(css[last:match.start(group)])
+            pieces.append(f'{{% static {quote}{url}{quote} %}}')
+            last = match.end(group)
+        
+        if pieces is None:
+            return None
+        pieces.append(css[last:])
+        return "".join(pieces)
     
     def _convert_srcset_string(self, srcset: str) -> str:
         """
         Convert srcset string to Django template format.
         
+        Candidates are split the way browsers parse srcset, so commas
+        inside URLs (e.g. data URIs) are kept and every descriptor is
+        preserved.
+        
         Args:
             srcset: Original srcset string
             
         Returns:
             Converted srcset string
         """
-        parts = srcset.split(',')
         new_parts = []
+        pos = 0
         
-        for part in parts:
-            part = part.strip()
-            url = part.split()[0] if ' ' in part else part
+        while True:
+            match = _SRCSET_URL_RE.match(srcset, pos)
+            if match is None:
+                break
+            url = match.group(1)
+            pos = match.end()
             
-            if self._should_convert(url, include_data_uri=False):
-                if ' ' in part:
-                    size = part.split()[1]
-                    new_parts.append(f'{{% static "{url}" %}} {size}')
-                else:
-                    new_parts.append(f'{{% static "{url}" %}}')
+            if url[-1] == ',':
+                url = url.rstrip(',')
+                descriptors = ''
             else:
-                new_parts.append(part)
+                match = _SRCSET_DESCRIPTORS_RE.match(srcset, pos)
+                descriptors = match.group(1)
+                pos = match.end()
+            
+            if self._should_convert(url):
+                url = f'{{% static "{url}" %}}'
+            new_parts.append(f'{url} {descriptors}' if descriptors else url)
         
         return ', '.join(new_parts)
     
-    def _should_convert(
-        self, 
-        url: str, 
-        include_data_uri: bool = True
-    ) -> bool:
+    def _should_convert(self, url: str) -> bool:
         """
         Check if URL should be converted.
         
         Args:
             url: URL to check
-            include_data_uri: Whether to include data URI
             
         Returns:
             True if should be converted, False otherwise
         """
-        if not url:
-            return False
-        
-        excluded = self._excluded_prefixes.copy()
-        if not include_data_uri:
-            # data: is already in the list, so no need to handle it
-            pass
+        return bool(url) and not self._url_matcher.matches(url)
+
+
+def _quote_attribute(value: str) -> str:
+    """
+    Quote an attribute value the way BeautifulSoup does.
+    
+    Args:
+        value: Attribute value
         
-        return not any(url.startswith(prefix) for prefix in excluded)
+    Returns:
+        Quoted attribute value
+    """
+    if '"' in value:
+        if "'" not in value:
+            return f"'{value}'"
+        value = value.replace('"', "&quot;")
+    return f'"{value}"'
+
+
+def _add_references(
+    references: List[AssetReference],
+    tag: str,
+    attribute: str,
+    value: str
+) -> None:
+    """Append the {% static %} paths of a converted value to references"""
+    for path in static_paths(value):
+        references.append(AssetReference(path, tag, attribute))
+
+
+def _read_text(path: str) -> str:
+    """Read a UTF-8 text file"""
+    with open(path, "r", encoding="utf-8") as file:
+        return file.read()
+
 
+def _write_text(path: str, content: str) -> None:
+    """Write a UTF-8 text file"""
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(content)
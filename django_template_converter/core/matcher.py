@@ -0,0 +1,91 @@
+"""
+URL exclusion matcher
+
+This module decides which URLs are left untouched by the converter. All
+prefixes, regular expressions and glob patterns are compiled once, so a
+check costs one str.startswith call, one match per regular expression and
+one match for all glob patterns together.
+"""
+
+import fnmatch
+import re
+from typing import Any, Dict, Iterable, Tuple
+
+
+# URLs that never point to local static files
+DEFAULT_EXCLUDED_PREFIXES = ("http://", "https://", "//", "data:", "{%")
+
+
+class UrlMatcher:
+    """
+    Compiled set of URL exclusion rules.
+    
+    A URL is excluded if it starts with one of the prefixes, or if one of
+    the regular expressions or glob patterns matches it. Regular expressions
+    are matched from the start of the URL (re.match); glob patterns must
+    match the whole URL.
+    """
+    
+    def __init__(
+        self,
+        prefixes: Iterable[str] = DEFAULT_EXCLUDED_PREFIXES,
+        patterns: Iterable[str] = (),
+        globs: Iterable[str] = ()
+    ):
+        """
+        Compile the exclusion rules.
+        
+        Args:
+            prefixes: URL prefixes to exclude
+            patterns: Regular expressions to exclude
+            globs: Glob patterns to exclude, e.g. "*.example.com/*"
+        
+        Raises:
+            re.error: If a regular expression is invalid
+        """
+        self.prefixes = tuple(prefixes)
+        self.patterns = tuple(patterns)
+        self.globs = tuple(globs)
+        self._regexes = self._compile(self.patterns, self.globs)
+    
+    @staticmethod
+    def _compile(patterns: tuple, globs: tuple) -> Tuple["re.Pattern", ...]:
+        """
+        Compile the regular expressions and globs.
+        
+        User expressions are compiled one by one: joined with "|", global
+        flags such as (?i) would no longer lead the pattern and group
+        numbers of backreferences would shift. Translated globs use no
+        groups or global flags, so they share one pattern.
+        """
+        regexes = [re.compile(pattern) for pattern in patterns]
+        if globs:
+            regexes.append(re.compile("|".join(fnmatch.translate(glob) for glob in globs)))
+        return tuple(regexes)
+    
+    def matches(self, url: str) -> bool:
+        """
+        Check if a URL is excluded.
+        
+        Args:
+            url: URL to check
+        
+        Returns:
+            True if the URL matches an exclusion rule
+        """
+        if url.startswith(self.prefixes):
+            return True
+        return any(regex.match(url) is not None for regex in self._regexes)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Describe the rules, e.g. for option fingerprints.
+        
+        Returns:
+            Prefixes, patterns and globs
+        """
+        return {
+            "prefixes": list(self.prefixes),
+            "patterns": list(self.patterns),
+            "globs": list(self.globs),
+        }
@@ -0,0 +1,167 @@
+"""
+Patch converter for converting HTML to Django templates
+
+This module parses the document with html.parser only to find the source
+offsets of the attribute values to rewrite, then splices the rewritten
+values into the original text. Nothing is re-serialized, so quoting,
+self-closing tags, entities and whitespace stay exactly as they were.
+"""
+
+import re
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from ..utils.helpers import generate_output_path
+from .converter import DjangoTemplateConverter, LOAD_STATIC_TAG
+from .streaming import _START_TAG_RE, attribute_patches
+
+
+_NEWLINE_RE = re.compile(r'\n')
+
+
+class _OffsetParser(HTMLParser):
+    """HTML parser that collects (start, end, replacement) patches"""
+    
+    def __init__(self, converter: DjangoTemplateConverter, html_content: str):
+        """
+        Initialize the parser.
+        
+        Args:
+            converter: Converter providing the rewrite rules
+            html_content: Document, used to map line/column to offsets
+        """
+        super().__init__(convert_charrefs=False)
+        self._handlers = {
+            tag: dict(rules) for tag, rules in converter._rewrite_table.items()
+        }
+        self._wildcard_handlers = dict(converter._wildcard_rules)
+        self._text_rewrites = converter._text_rewrites
+        self._text_handler = None
+        # html.parser reports positions as (line, column); lines end at \n
+        self._line_starts = [0] + [match.end() for match in _NEWLINE_RE.finditer(html_content)]
+        self.patches = []
+    
+    def _offset(self) -> int:
+        """Offset of the current token in the document"""
+        line, column = self.getpos()
+        return self._line_starts[line - 1] + column
+    
+    def handle_starttag(self, tag, attrs):
+        self._text_handler = self._text_rewrites.get(tag)
+        handlers = self._handlers.get(tag, self._wildcard_handlers)
+        if not any(name in handlers for name, _ in attrs):
+            return
+        
+        tag_text = self.get_starttag_text()
+        match = _START_TAG_RE.match(tag_text)
+        if match is None:
+            return
+        
+        offset = self._offset() + match.start(2)
+        for start, end, replacement in attribute_patches(match.group(2), handlers):
+            self.patches.append((offset + start, offset + end, replacement))
+    
+    def handle_endtag(self, tag):
+        self._text_handler = None
+    
+    def handle_data(self, data):
+        if self._text_handler is None:
+            return
+        new_text = self._text_handler(data)
+        if new_text is not None:
+            start = self._offset()
+            self.patches.append((start, start + len(data), new_text))
+
+
+class PatchConverter:
+    """
+    Minimal-diff HTML to Django template converter.
+    
+    Rewrites the same (tag, attribute) table as DjangoTemplateConverter, but
+    only the rewritten attribute values change; every other character of
+    the input is kept. Unlike StreamingConverter, tags are found by
+    html.parser, so markup inside comments, CDATA and script/style content
+    is handled the same way as by the default parser backend.
+    """
+    
+    def __init__(self, converter: Optional[DjangoTemplateConverter] = None):
+        """
+        Initialize the patch converter.
+        
+        Args:
+            converter: Converter providing the rewrite rules (optional)
+        """
+        self.converter = converter or DjangoTemplateConverter()
+    
+    def find_patches(self, html_content: str) -> List[Tuple[int, int, str]]:
+        """
+        Find the attribute values to rewrite.
+        
+        Args:
+            html_content: HTML content as string
+        
+        Returns:
+            Sorted (start, end, replacement) spans, quotes included
+        """
+        parser = _OffsetParser(self.converter, html_content)
+        parser.feed(html_content)
+        parser.close()
+        return parser.patches
+    
+    def convert_string(self, html_content: str) -> str:
+        """
+        Convert HTML content string to Django template.
+        
+        {% load static %} is prepended unless the content already loads it.
+        
+        Args:
+            html_content: HTML content as string
+        
+        Returns:
+            Converted Django template content
+        """
+        pieces = [] if LOAD_STATIC_TAG in html_content else [LOAD_STATIC_TAG + "\n"]
+        last = 0
+        for start, end, replacement in self.find_patches(html_content):
+            pieces.append(html_content[last:start])
+            pieces.append(replacement)
+            last = end
+        pieces.append(html_content[last:])
+        return "".join(pieces)
+    
+    def convert_file(
+        self,
+        input_path: str,
+        output_path: Optional[str] = None
+    ) -> str:
+        """
+        Convert HTML file to Django template, keeping its line endings.
+        
+        Args:
+            input_path: Path to input HTML file
+            output_path: Path to output file (optional)
+        
+        Returns:
+            Output file path
+        
+        Raises:
+            FileNotFoundError: If input file doesn't exist
+            IOError: If error occurs while reading/writing file
+        """
+        input_file = Path(input_path)
+        if not input_file.exists():
+            raise FileNotFoundError(f"Input file not found: {input_path}")
+        
+        if not output_path:
+            output_path = generate_output_path(input_path)
+        
+        with open(input_path, "r", encoding="utf-8", newline="") as file:
+            html_content = file.read()
+        
+        converted_html = self.convert_string(html_content)
+        
+        with open(output_path, "w", encoding="utf-8", newline="") as file:
+            file.write(converted_html)
+        
+        return output_path
@@ -0,0 +1,223 @@
+"""
+Converter pool for long-running services
+
+This module keeps a fixed set of configured converters ready for
+conversion requests from many threads. Each converter keeps its compiled
+URL matcher, rewrite table and memoized attribute values between
+requests, and its parser backend is imported and exercised once when the
+pool is created.
+"""
+
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, List, NamedTuple, Optional
+
+from .assets import AssetReference
+from .converter import DjangoTemplateConverter
+
+
+# Document converted by every converter when the pool is created
+_WARM_UP_HTML = (
+    '<html><head><link rel="stylesheet" href="css/warm-up.css">'
+    '<style>body { background: url(img/warm-up.png); }</style></head>'
+    '<body><img src="img/warm-up.png" srcset="img/warm-up.png 1x"></body></html>'
+)
+
+
+class PoolCounters(NamedTuple):
+    """Snapshot of the counters of a ConverterPool"""
+    conversions: int
+    failures: int
+    in_flight: int
+    busy_seconds: float
+    wait_seconds: float
+    max_latency: float
+    uptime: float
+    
+    @property
+    def mean_latency(self) -> float:
+        """Mean seconds per conversion, waiting for a converter excluded"""
+        completed = self.conversions + self.failures
+        return self.busy_seconds / completed if completed else 0.0
+    
+    @property
+    def throughput(self) -> float:
+        """Conversions per second since the pool was created"""
+        return self.conversions / self.uptime if self.uptime else 0.0
+
+
+class ConverterPool:
+    """
+    Thread-safe pool of warm DjangoTemplateConverter instances.
+    
+    Thread safety: every method may be called from any number of threads at
+    once. A converter is lent to one thread at a time, so its per-instance
+    state (rewrite cache, statistics) is never shared by two conversions;
+    callers that need more converters than the pool holds wait for one to
+    be returned. The counters are updated under a lock and counters()
+    returns a consistent snapshot.
+    """
+    
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        warm: bool = True,
+        **converter_options: Any
+    ):
+        """
+        Initialize the pool and create its converters.
+        
+        Args:
+            size: Number of converters, i.e. of concurrent conversions
+                (default: CPU count)
+            warm: Convert a small document with every converter, so the
+                parser backend is imported and initialized before the
+                first request
+            **converter_options: Options passed to DjangoTemplateConverter,
+                except stats, which would be shared between threads
+        
+        Raises:
+            ValueError: If size is less than 1, stats is given or an option
+                is invalid
+        """
+        if size is None:
+            size = os.cpu_count() or 1
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}")
+        if converter_options.get("stats") is not None:
+            raise ValueError("ConverterPool does not support stats; use counters()")
+        
+        self.size = size
+        self._converters = queue.LifoQueue()
+        for _ in range(size):
+            converter = DjangoTemplateConverter(**converter_options)
+            if warm:
+                converter.convert_string(_WARM_UP_HTML)
+                converter.cache_clear()
+            self._converters.put(converter)
+        
+        self._lock = threading.Lock()
+        self.reset_counters()
+    
+    def reset_counters(self) -> None:
+        """Clear the counters and restart the uptime"""
+        with self._lock:
+            self._started = time.perf_counter()
+            self._conversions = 0
+            self._failures = 0
+            self._in_flight = 0
+            self._busy_seconds = 0.0
+            self._wait_seconds = 0.0
+            self._max_latency = 0.0
+    
+    def counters(self) -> PoolCounters:
+        """
+        Get a snapshot of the throughput and latency counters.
+        
+        Returns:
+            Pool counters
+        """
+        with self._lock:
+            return PoolCounters(
+                self._conversions,
+                self._failures,
+                self._in_flight,
+                self._busy_seconds,
+                self._wait_seconds,
+                self._max_latency,
+                time.perf_counter() - self._started
+            )
+    
+    @contextmanager
+    def converter(self, timeout: Optional[float] = None) -> Iterator[DjangoTemplateConverter]:
+        """
+        Borrow a converter for the duration of a with block.
+        
+        The block is counted as one conversion, or as a failure if it
+        raises. Do not keep the converter after the block.
+        
+        Args:
+            timeout: Maximum seconds to wait for a free converter (default: no limit)
+        
+        Yields:
+            Converter used by no other thread
+        
+        Raises:
+            TimeoutError: If no converter became free within timeout
+        """
+        requested = time.perf_counter()
+        try:
+            converter = self._converters.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No free converter within {timeout} seconds") from None
+        
+        start = time.perf_counter()
+        with self._lock:
+            self._in_flight += 1
+            self._wait_seconds += start - requested
+        
+        failed = True
+        try:
+            yield converter
+            failed = False
+        finally:
+            seconds = time.perf_counter() - start
+            self._converters.put(converter)
+            with self._lock:
+                self._in_flight -= 1
+                self._busy_seconds += seconds
+                self._max_latency = max(self._max_latency, seconds)
+                if failed:
+                    self._failures += 1
+                else:
+                    self._conversions += 1
+    
+    def convert_string(
+        self,
+        html_content: str,
+        references: Optional[List[AssetReference]] = None,
+        timeout: Optional[float] = None
+    ) -> str:
+        """
+        Convert HTML content string with a free converter.
+        
+        Args:
+            html_content: HTML content as string
+            references: List to append the referenced static files to (optional)
+            timeout: Maximum seconds to wait for a free converter (default: no limit)
+        
+        Returns:
+            Converted Django template content
+        
+        Raises:
+            TimeoutError: If no converter became free within timeout
+        """
+        with self.converter(timeout) as converter:
+            return converter.convert_string(html_content, references)
+    
+    def convert_file(
+        self,
+        input_path: str,
+        output_path: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> str:
+        """
+        Convert HTML file to Django template with a free converter.
+        
+        Args:
+            input_path: Path to input HTML file
+            output_path: Path to output file (optional)
+            timeout: Maximum seconds to wait for a free converter (default: no limit)
+        
+        Returns:
+            Output file path
+        
+        Raises:
+            TimeoutError: If no converter became free within timeout
+            FileNotFoundError: If input file doesn't exist
+        """
+        with self.converter(timeout) as converter:
+            return converter.convert_file(input_path, output_path)
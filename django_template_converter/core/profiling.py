@@ -0,0 +1,111 @@
+"""
+Per-stage conversion statistics
+
+This module collects where a conversion spends its time. Pass a
+ConversionStats object to DjangoTemplateConverter and every conversion
+adds its wall time per stage, and the number of visited elements and
+rewritten attributes, to it.
+"""
+
+from typing import Any, Callable, Dict, Optional
+
+
+# Stages in the order they run
+STAGES = ("read", "parse", "load_static", "rewrite", "serialize", "write")
+
+
+class ConversionStats:
+    """
+    Accumulated wall time and counters of conversions.
+    
+    Attributes:
+        seconds: Total seconds per stage
+        documents: Number of parsed documents, not counting skipped ones
+        elements: Number of elements checked for static references
+        rewrites: Number of rewritten attribute values
+        skipped: Number of documents returned unparsed by the pre-scan
+    """
+    
+    def __init__(self, on_stage: Optional[Callable[[str, float], None]] = None):
+        """
+        Initialize empty statistics.
+        
+        Args:
+            on_stage: Called with (stage, seconds) after every stage (optional)
+        """
+        self.on_stage = on_stage
+        self.reset()
+    
+    def reset(self) -> None:
+        """Clear all timings and counters"""
+        self.seconds = dict.fromkeys(STAGES, 0.0)
+        self.documents = 0
+        self.elements = 0
+        self.rewrites = 0
+        self.skipped = 0
+    
+    def add(self, stage: str, seconds: float) -> None:
+        """
+        Add the wall time of a stage.
+        
+        Args:
+            stage: Stage name, one of STAGES
+            seconds: Elapsed seconds
+        """
+        self.seconds[stage] += seconds
+        if self.on_stage is not None:
+            self.on_stage(stage, seconds)
+    
+    @property
+    def total(self) -> float:
+        """Total seconds of all stages"""
+        return sum(self.seconds.values())
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Describe the statistics, e.g. to send them between processes.
+        
+        Returns:
+            Timings and counters
+        """
+        return {
+            "seconds": dict(self.seconds),
+            "documents": self.documents,
+            "elements": self.elements,
+            "rewrites": self.rewrites,
+            "skipped": self.skipped,
+        }
+    
+    def merge(self, data: Dict[str, Any]) -> None:
+        """
+        Add statistics described by to_dict().
+        
+        Args:
+            data: Timings and counters
+        """
+        for stage, seconds in data["seconds"].items():
+            self.seconds[stage] += seconds
+        self.documents += data["documents"]
+        self.elements += data["elements"]
+        self.rewrites += data["rewrites"]
+        self.skipped += data["skipped"]
+    
+    def report(self) -> str:
+        """
+        Format a per-stage breakdown.
+        
+        Returns:
+            Multi-line report
+        """
+        total = self.total
+        lines = [f"{'stage':<12} {'ms':>10} {'share':>7}"]
+        for stage, seconds in self.seconds.items():
+            share = seconds / total * 100 if total else 0.0
+            lines.append(f"{stage:<12} {seconds * 1000:10.1f} {share:6.1f}%")
+        lines.append(f"{'total':<12} {total * 1000:10.1f}")
+        lines.append(
+            f"{self.documents} document(s), {self.elements} element(s) checked, "
+            f"{self.rewrites} attribute(s) rewritten, "
+            f"{self.skipped} document(s) skipped by the pre-scan"
+        )
+        return "\n".join(lines)
@@ -0,0 +1,435 @@
+"""
+Streaming converter for converting HTML to Django templates
+
+This module rewrites static references with a small tokenizer instead of a
+parse tree. Input is read in chunks and every byte outside the rewritten
+attribute values is copied through unchanged. Files are memory-mapped and
+decoded incrementally, so peak memory does not grow with the file size.
+"""
+
+import codecs
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import IO, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from ..utils.helpers import atomic_write, generate_output_path
+from .converter import DjangoTemplateConverter, LOAD_STATIC_TAG
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# A start tag is buffered until it is complete; anything that still is not a
+# tag after this many characters is treated as a literal "<".
+DEFAULT_MAX_TAG_LENGTH = 64 * 1024
+
+# Start tag with its attribute section. The attribute alternatives are
+# mutually exclusive per character, so a failed match backtracks linearly.
+_START_TAG_RE = re.compile(r'<([a-zA-Z][^\t\n\f\r />]*)((?:[^>"\']|"[^"]*"|\'[^\']*\')*)>')
+_ATTRIBUTE_RE = re.compile(
+    r'([^\s"\'>/=]+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'=<>`]+)))?'
+)
+_COMMENT_END_RE = re.compile(r'-->')
+
+# Elements whose content is raw text and must not be tokenized
+RAW_TEXT_ELEMENTS = ("script", "style")
+_RAW_TEXT_END_RE = {
+    name: re.compile(r'</{}[\s/>]'.format(name), re.IGNORECASE)
+    for name in RAW_TEXT_ELEMENTS
+}
+
+
+def requote_attribute(value: str, new_value: str, quote: str) -> Optional[str]:
+    """
+    Quote a rewritten attribute value, keeping the original quote character.
+    
+    Static tags are generated as {% static "..." %}; inside a double-quoted
+    attribute they are switched to single quotes. Values that already use
+    single-quoted static tags (e.g. CSS next to other single quotes) are
+    kept as they are.
+    
+    Args:
+        value: Original attribute value
+        new_value: Rewritten attribute value
+        quote: Original quote character ('"', "'" or '' when unquoted)
+    
+    Returns:
+        Quoted attribute value, or None if it cannot be quoted safely
+    """
+    if quote == "'":
+        return f"'{new_value}'"
+    if '"' not in new_value:
+        return f'"{new_value}"'
+    if "'" in value:
+        return None
+    return '"' + new_value.replace('"', "'") + '"'
+
+
+def read_mapped(file: IO[bytes], chunk_size: int, encoding: str = "utf-8") -> Iterator[str]:
+    """
+    Decode a file chunk by chunk through a read-only memory map.
+    
+    Multi-byte characters split between chunks are handled by an
+    incremental decoder.
+    
+    Args:
+        file: File opened in binary mode
+        chunk_size: Number of bytes decoded per chunk
+        encoding: Text encoding
+    
+    Yields:
+        Decoded text chunks
+    
+    Raises:
+        UnicodeDecodeError: If the file is not valid in the encoding
+    """
+    if os.fstat(file.fileno()).st_size == 0:
+        # Empty files cannot be mapped
+        return
+    
+    decoder = codecs.getincrementaldecoder(encoding)()
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        for pos in range(0, len(mapped), chunk_size):
+            text = decoder.decode(mapped[pos:pos + chunk_size])
+            if text:
+                yield text
+    text = decoder.decode(b"", final=True)
+    if text:
+        yield text
+
+
+def attribute_patches(
+    attribute_text: str,
+    handlers: Dict[str, Callable[[str], Optional[str]]]
+) -> Iterator[Tuple[int, int, str]]:
+    """
+    Find the rewritable attribute values of a start tag.
+    
+    Args:
+        attribute_text: Attribute section of the start tag
+        handlers: Rewrite handler per lowercase attribute name
+    
+    Yields:
+        (start, end, replacement) spans of attribute_text, quotes included
+    """
+    for attribute in _ATTRIBUTE_RE.finditer(attribute_text):
+        handler = handlers.get(attribute.group(1).lower())
+        if handler is None:
+            continue
+        for group, quote in ((2, '"'), (3, "'"), (4, "")):
+            if attribute.group(group) is not None:
+                break
+        else:
+            continue
+        
+        value = attribute.group(group)
+        new_value = handler(value)
+        if new_value is None:
+            continue
+        quoted = requote_attribute(value, new_value, quote)
+        if quoted is None:
+            continue
+        yield (
+            attribute.start(group) - len(quote),
+            attribute.end(group) + len(quote),
+            quoted
+        )
+
+
+def may_rewrite(converter: DjangoTemplateConverter, html_content: str) -> bool:
+    """
+    Check cheaply whether converting a document could rewrite anything.
+    
+    No tree is built: the content is searched for the attribute names of
+    the rewrite rules first, and only if one occurs are start tags matched
+    and their values, and the text of elements with a text rule, passed to
+    the rewrite handlers. Markup inside comments and scripts is checked as
+    well, so doubtful documents are reported as rewritable.
+    
+    Args:
+        converter: Converter providing the rewrite rules
+        html_content: HTML content as string
+    
+    Returns:
+        False if no static reference of the document would be rewritten
+    """
+    if converter._prescan_re.search(html_content) is None:
+        return False
+    
+    text_rewrites = converter._text_rewrites
+    for match in _START_TAG_RE.finditer(html_content):
+        name = match.group(1).lower()
+        rules = converter._attribute_rules(name)
+        if rules:
+            handlers = dict(rules)
+            for attribute in _ATTRIBUTE_RE.finditer(match.group(2)):
+                handler = handlers.get(attribute.group(1).lower())
+                if handler is None:
+                    continue
+                value = next((value for value in attribute.group(2, 3, 4) if value is not None), None)
+                if value is not None and handler(value) is not None:
+                    return True
+        
+        text_handler = text_rewrites.get(name)
+        if text_handler is not None:
+            if name in _RAW_TEXT_END_RE:
+                end = _RAW_TEXT_END_RE[name].search(html_content, match.end())
+                stop = end.start() if end else len(html_content)
+            else:
+                stop = html_content.find("<", match.end())
+                if stop < 0:
+                    stop = len(html_content)
+            text = html_content[match.end():stop]
+            if text_handler(text) is not None:
+                return True
+    return False
+
+
+class _StreamRewriter:
+    """Incremental tokenizer that rewrites static references of fed text"""
+    
+    def __init__(self, converter: DjangoTemplateConverter, max_tag_length: int):
+        """
+        Initialize the rewriter.
+        
+        Args:
+            converter: Converter providing the rewrite table
+            max_tag_length: Maximum length of a buffered start tag
+        """
+        self._converter = converter
+        self._max_tag_length = max_tag_length
+        self._buffer = ""
+        self._raw_end = None
+        self._raw_end_inclusive = False
+        self._text_handler = None
+    
+    def feed(self, data: str) -> str:
+        """
+        Feed text and return the converted output available so far.
+        
+        Args:
+            data: Next chunk of HTML content
+        
+        Returns:
+            Converted content
+        """
+        self._buffer += data
+        return self._process(final=False)
+    
+    def close(self) -> str:
+        """
+        Flush the remaining buffered text.
+        
+        Returns:
+            Converted content
+        """
+        return self._process(final=True)
+    
+    def _process(self, final: bool) -> str:
+        """Tokenize the buffer as far as possible"""
+        buffer = self._buffer
+        length = len(buffer)
+        output = []
+        pos = 0
+        
+        while pos < length:
+            # Inside a comment or raw text element: copy up to its end
+            if self._raw_end is not None:
+                match = self._raw_end.search(buffer, pos)
+                if match is None:
+                    if self._text_handler is not None:
+                        if not final and length - pos <= self._max_tag_length:
+                            # Wait for the whole text so it can be rewritten
+                            break
+                        self._text_handler = None
+                    keep = length if final else max(pos, length - 16)
+                    output.append(buffer[pos:keep])
+                    pos = keep
+                    break
+                end = match.end() if self._raw_end_inclusive else match.start()
+                text = buffer[pos:end]
+                if self._text_handler is not None:
+                    text = self._text_handler(text) or text
+                    self._text_handler = None
+                output.append(text)
+                pos = end
+                self._raw_end = None
+                continue
+            
+            lt = buffer.find("<", pos)
+            if lt < 0:
+                output.append(buffer[pos:])
+                pos = length
+                break
+            output.append(buffer[pos:lt])
+            pos = lt
+            
+            if not final and length - pos < 4:
+                break
+            
+            if buffer.startswith("<!--", pos):
+                output.append("<!--")
+                pos += 4
+                self._raw_end = _COMMENT_END_RE
+                self._raw_end_inclusive = True
+                continue
+            
+            match = _START_TAG_RE.match(buffer, pos)
+            if match:
+                output.append(self._rewrite_start_tag(match))
+                pos = match.end()
+                name = match.group(1).lower()
+                if name in _RAW_TEXT_END_RE:
+                    self._raw_end = _RAW_TEXT_END_RE[name]
+                    self._raw_end_inclusive = False
+                    self._text_handler = self._converter._text_rewrites.get(name)
+                continue
+            
+            if buffer.startswith(("</", "<!", "<?"), pos):
+                # End tags, declarations and processing instructions
+                gt = buffer.find(">", pos)
+                if gt >= 0:
+                    output.append(buffer[pos:gt + 1])
+                    pos = gt + 1
+                    continue
+            elif not buffer[pos + 1:pos + 2].isalpha():
+                output.append("<")
+                pos += 1
+                continue
+            
+            # Incomplete construct: wait for more input unless it can't be one
+            if final or length - pos > self._max_tag_length:
+                output.append("<")
+                pos += 1
+                continue
+            break
+        
+        self._buffer = buffer[pos:]
+        return "".join(output)
+    
+    def _rewrite_start_tag(self, match) -> str:
+        """Rewrite the attribute values of a matched start tag"""
+        rules = self._converter._attribute_rules(match.group(1).lower())
+        if not rules:
+            return match.group(0)
+        
+        tag_text = match.group(0)
+        offset = match.start(2) - match.start()
+        pieces = []
+        last = 0
+        for start, end, quoted in attribute_patches(match.group(2), dict(rules)):
+            pieces.append(tag_text[last:offset + start])
+            pieces.append(quoted)
+            last = offset + end
+        
+        if not pieces:
+            return tag_text
+        pieces.append(tag_text[last:])
+        return "".join(pieces)
+
+
+class StreamingConverter:
+    """
+    Streaming HTML to Django template converter.
+    
+    Rewrites the same (tag, attribute) table as DjangoTemplateConverter
+    without building a parse tree. Peak memory is bounded by the chunk size
+    and the longest start tag, and unchanged bytes are copied verbatim.
+    """
+    
+    def __init__(
+        self,
+        converter: Optional[DjangoTemplateConverter] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_tag_length: int = DEFAULT_MAX_TAG_LENGTH
+    ):
+        """
+        Initialize the streaming converter.
+        
+        Args:
+            converter: Converter providing the rewrite rules (optional)
+            chunk_size: Number of characters (bytes for files) converted per chunk
+            max_tag_length: Maximum length of a buffered start tag
+        """
+        self.converter = converter or DjangoTemplateConverter()
+        self.chunk_size = chunk_size
+        self.max_tag_length = max_tag_length
+    
+    def convert_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Convert HTML content given as chunks.
+        
+        {% load static %} is prepended unless it appears in the first chunk.
+        
+        Args:
+            chunks: HTML content chunks
+        
+        Yields:
+            Converted content chunks
+        """
+        rewriter = _StreamRewriter(self.converter, self.max_tag_length)
+        first = True
+        
+        for chunk in chunks:
+            if first:
+                first = False
+                if LOAD_STATIC_TAG not in chunk:
+                    yield LOAD_STATIC_TAG + "\n"
+            output = rewriter.feed(chunk)
+            if output:
+                yield output
+        
+        if first:
+            yield LOAD_STATIC_TAG + "\n"
+        output = rewriter.close()
+        if output:
+            yield output
+    
+    def convert_string(self, html_content: str) -> str:
+        """
+        Convert HTML content string to Django template.
+        
+        Args:
+            html_content: HTML content as string
+        
+        Returns:
+            Converted Django template content
+        """
+        return "".join(self.convert_stream([html_content]))
+    
+    def convert_file(
+        self,
+        input_path: str,
+        output_path: Optional[str] = None
+    ) -> str:
+        """
+        Convert HTML file to Django template chunk by chunk.
+        
+        The input is memory-mapped and the output is written to a temporary
+        file that replaces output_path once the conversion is complete.
+        
+        Args:
+            input_path: Path to input HTML file
+            output_path: Path to output file (optional)
+        
+        Returns:
+            Output file path
+        
+        Raises:
+            FileNotFoundError: If input file doesn't exist
+            IOError: If error occurs while reading/writing file
+        """
+        input_file = Path(input_path)
+        if not input_file.exists():
+            raise FileNotFoundError(f"Input file not found: {input_path}")
+        
+        if not output_path:
+            output_path = generate_output_path(input_path)
+        
+        with open(input_path, "rb") as source, \
+                atomic_write(output_path, newline="") as target:
+            for output in self.convert_stream(read_mapped(source, self.chunk_size)):
+                target.write(output)
+        
+        return output_path
@@ -0,0 +1,155 @@
+"""
+Watch mode for converting templates on change
+
+This module polls a source directory and reconverts templates whose size
+or modification time changed. Bursts of changes to the same file, e.g. an
+editor writing it in several steps, are debounced into one conversion.
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .batch import find_templates
+from .cache import ConversionCache
+from .converter import DjangoTemplateConverter
+
+
+DEFAULT_INTERVAL = 0.05
+DEFAULT_DEBOUNCE = 0.05
+
+
+class TemplateWatcher:
+    """
+    Polling watcher that keeps dst_dir in sync with the templates of src_dir.
+    
+    The first step converts every template whose cached output is not up to
+    date; later steps only convert files that changed since the last poll.
+    """
+    
+    def __init__(
+        self,
+        src_dir: str,
+        dst_dir: str,
+        pattern: str = "*.html",
+        converter: Optional[DjangoTemplateConverter] = None,
+        interval: float = DEFAULT_INTERVAL,
+        debounce: float = DEFAULT_DEBOUNCE,
+        on_convert: Optional[Callable[[str, str, float], None]] = None,
+        on_error: Optional[Callable[[str, Exception], None]] = None
+    ):
+        """
+        Initialize the watcher.
+        
+        Args:
+            src_dir: Source directory
+            dst_dir: Destination directory, the source layout is kept
+            pattern: Glob pattern of template file names
+            converter: Converter to use (optional)
+            interval: Seconds between polls
+            debounce: Seconds a file must stay unchanged before converting
+            on_convert: Called with (input path, output path, seconds) per file
+            on_error: Called with (input path, exception) on failure
+        """
+        self.src_dir = Path(src_dir)
+        self.dst_dir = Path(dst_dir)
+        self.pattern = pattern
+        self.converter = converter or DjangoTemplateConverter()
+        self.interval = interval
+        self.debounce = debounce
+        self.on_convert = on_convert
+        self.on_error = on_error
+        self.cache = ConversionCache(dst_dir)
+        self._snapshot = {}
+        self._pending = {}
+    
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        """Stat every template of the source directory"""
+        snapshot = {}
+        for path in find_templates(str(self.src_dir), self.pattern, exclude_dir=str(self.dst_dir)):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            snapshot[str(path)] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+    
+    def poll(self) -> List[str]:
+        """
+        Find templates that were added or changed since the last poll.
+        
+        Returns:
+            List of changed input paths
+        """
+        snapshot = self._scan()
+        changed = [
+            path for path, state in snapshot.items()
+            if self._snapshot.get(path) != state
+        ]
+        self._snapshot = snapshot
+        return changed
+    
+    def step(self, now: Optional[float] = None) -> List[str]:
+        """
+        Poll once and convert the templates whose changes have settled.
+        
+        Args:
+            now: Current monotonic time (default: time.monotonic())
+        
+        Returns:
+            List of output paths written in this step
+        """
+        if now is None:
+            now = time.monotonic()
+        for path in self.poll():
+            self._pending[path] = now
+        
+        ready = [
+            path for path, changed_at in self._pending.items()
+            if now - changed_at >= self.debounce
+        ]
+        outputs = []
+        for input_path in ready:
+            del self._pending[input_path]
+            output_path = self._convert(input_path)
+            if output_path:
+                outputs.append(output_path)
+        
+        self.cache.save()
+        return outputs
+    
+    def _convert(self, input_path: str) -> Optional[str]:
+        """Convert a single template, reporting the result"""
+        output_path = self.dst_dir / Path(input_path).relative_to(self.src_dir)
+        start = time.perf_counter()
+        try:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            fingerprint = self.converter.fingerprint
+            if self.cache.is_current(input_path, str(output_path), fingerprint):
+                return None
+            # The cache records the content that was read, not the file
+            # as it is after the conversion, so a save in between is
+            # picked up by the next poll
+            self.converter.convert_file(input_path, str(output_path), cache=self.cache)
+        except (OSError, ValueError) as e:
+            if self.on_error:
+                self.on_error(input_path, e)
+            return None
+        
+        if self.on_convert:
+            self.on_convert(input_path, str(output_path), time.perf_counter() - start)
+        return str(output_path)
+    
+    def run(self, stop_event: Optional[threading.Event] = None) -> None:
+        """
+        Watch until stop_event is set (or forever).
+        
+        Args:
+            stop_event: Event that stops the watcher (optional)
+        """
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            self.step()
+            stop_event.wait(self.interval)
@@ -3,7 +3,15 @@ GUI module for Django Template Converter
 ماژول رابط کاربری گرافیکی
 """
 
-from .window import DjangoTemplateConverterGUI
+from .._lazy import lazy_attributes
 
-__all__ = ['DjangoTemplateConverterGUI']
+# Public name -> (module, attribute), resolved by lazy_attributes so that
+# tkinter is only loaded when a window is actually used
+_LAZY_ATTRIBUTES = {
+    'BatchConversionWindow': ('.batch_window', 'BatchConversionWindow'),
+    'DjangoTemplateConverterGUI': ('.window', 'DjangoTemplateConverterGUI'),
+}
 
+__all__ = ['BatchConversionWindow', 'DjangoTemplateConverterGUI']
+
+__getattr__, __dir__ = lazy_attributes(globals(), _LAZY_ATTRIBUTES)
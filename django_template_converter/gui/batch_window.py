@@ -0,0 +1,322 @@
+"""
+Batch conversion window
+
+This module contains a queue window for converting many files at once on
+a pool of worker processes.
+"""
+
+import os
+import tkinter as tk
+from tkinter import filedialog, messagebox, ttk
+from pathlib import Path
+
+from ..core.batch import convert_job, create_pool, find_templates
+from ..utils.helpers import generate_output_path
+
+
+# Interval for polling worker results
+POLL_INTERVAL_MS = 100
+
+# Template file patterns picked up when adding a folder
+FOLDER_PATTERNS = ("*.html", "*.htm")
+
+
+class BatchConversionWindow:
+    """Queue window for converting many files on a worker pool"""
+    
+    def __init__(self, root: tk.Tk):
+        """
+        Initialize the batch window.
+        
+        Args:
+            root: Main tkinter window
+        """
+        self.window = tk.Toplevel(root)
+        self.window.title("Batch Conversion")
+        self.window.geometry("900x500")
+        self.window.protocol("WM_DELETE_WINDOW", self._close)
+        
+        # Queued files: row id -> (input path, base folder or None)
+        self._queue = {}
+        self._futures = {}
+        self._executor = None
+        
+        self._setup_ui()
+    
+    def _setup_ui(self):
+        """Setup user interface"""
+        toolbar = tk.Frame(self.window, bg="#ecf0f1", padx=10, pady=10)
+        toolbar.pack(fill=tk.X)
+        
+        for text, command in (
+            ("Add Files...", self._add_files),
+            ("Add Folder...", self._add_folder),
+            ("Clear", self._clear_queue),
+        ):
+            tk.Button(
+                toolbar,
+                text=text,
+                command=command,
+                bg="#3498db",
+                fg="white",
+                font=("Arial", 10, "bold"),
+                relief=tk.FLAT,
+                padx=10,
+                pady=3,
+                cursor="hand2"
+            ).pack(side=tk.LEFT, padx=(0, 5))
+        
+        tk.Label(toolbar, text="Workers:", bg="#ecf0f1", font=("Arial", 10)).pack(
+            side=tk.LEFT, padx=(20, 5)
+        )
+        self.workers_var = tk.IntVar(value=os.cpu_count() or 1)
+        tk.Spinbox(
+            toolbar,
+            from_=1,
+            to=64,
+            width=4,
+            textvariable=self.workers_var
+        ).pack(side=tk.LEFT)
+        
+        self.cancel_btn = tk.Button(
+            toolbar,
+            text="Cancel",
+            command=self._cancel,
+            bg="#e74c3c",
+            fg="white",
+            font=("Arial", 10, "bold"),
+            relief=tk.FLAT,
+            padx=10,
+            pady=3,
+            cursor="hand2",
+            state=tk.DISABLED
+        )
+        self.cancel_btn.pack(side=tk.RIGHT)
+        
+        self.start_btn = tk.Button(
+            toolbar,
+            text="Start",
+            command=self._start,
+            bg="#27ae60",
+            fg="white",
+            font=("Arial", 10, "bold"),
+            relief=tk.FLAT,
+            padx=10,
+            pady=3,
+            cursor="hand2"
+        )
+        self.start_btn.pack(side=tk.RIGHT, padx=(0, 5))
+        
+        # Output directory
+        output_frame = tk.Frame(self.window, bg="#ecf0f1", padx=10)
+        output_frame.pack(fill=tk.X)
+        
+        tk.Label(
+            output_frame,
+            text="Output folder (empty: next to each file):",
+            bg="#ecf0f1",
+            font=("Arial", 10)
+        ).pack(side=tk.LEFT)
+        
+        self.output_dir_var = tk.StringVar()
+        tk.Entry(
+            output_frame,
+            textvariable=self.output_dir_var,
+            font=("Arial", 10)
+        ).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        
+        tk.Button(
+            output_frame,
+            text="Browse...",
+            command=self._browse_output_dir,
+            bg="#95a5a6",
+            fg="white",
+            font=("Arial", 10, "bold"),
+            relief=tk.FLAT,
+            padx=10,
+            cursor="hand2"
+        ).pack(side=tk.RIGHT)
+        
+        # Queue table
+        table_frame = tk.Frame(self.window, padx=10, pady=10)
+        table_frame.pack(fill=tk.BOTH, expand=True)
+        
+        columns = ("file", "status", "duration", "bytes_in", "bytes_out")
+        self.table = ttk.Treeview(table_frame, columns=columns, show="headings")
+        for column, heading, width, anchor in (
+            ("file", "File", 420, tk.W),
+            ("status", "Status", 160, tk.W),
+            ("duration", "Duration", 90, tk.E),
+            ("bytes_in", "Bytes in", 90, tk.E),
+            ("bytes_out", "Bytes out", 90, tk.E),
+        ):
+            self.table.heading(column, text=heading)
+            self.table.column(column, width=width, anchor=anchor)
+        
+        scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.table.yview)
+        self.table.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.table.pack(fill=tk.BOTH, expand=True)
+        
+        self.summary_var = tk.StringVar(value="Queue is empty")
+        tk.Label(
+            self.window,
+            textvariable=self.summary_var,
+            anchor=tk.W,
+            font=("Arial", 9),
+            padx=10,
+            pady=5
+        ).pack(fill=tk.X)
+    
+    def _add_files(self):
+        """Add selected files to the queue"""
+        file_paths = filedialog.askopenfilenames(
+            parent=self.window,
+            title="Select HTML Files",
+            filetypes=[
+                ("HTML Files", "*.html *.htm"),
+                ("All Files", "*.*")
+            ]
+        )
+        for file_path in file_paths:
+            self._enqueue(file_path, None)
+        self._update_summary()
+    
+    def _add_folder(self):
+        """Add all templates of a folder to the queue"""
+        folder = filedialog.askdirectory(parent=self.window, title="Select Template Folder")
+        if not folder:
+            return
+        
+        paths = set()
+        for pattern in FOLDER_PATTERNS:
+            paths.update(find_templates(folder, pattern))
+        for path in sorted(paths):
+            self._enqueue(str(path), folder)
+        self._update_summary()
+    
+    def _enqueue(self, input_path: str, base_dir):
+        """Add a file to the queue table"""
+        row = self.table.insert("", tk.END, values=(input_path, "Queued", "", "", ""))
+        self._queue[row] = (input_path, base_dir)
+    
+    def _browse_output_dir(self):
+        """Browse and select the output folder"""
+        folder = filedialog.askdirectory(parent=self.window, title="Select Output Folder")
+        if folder:
+            self.output_dir_var.set(folder)
+    
+    def _output_path(self, input_path: str, base_dir) -> str:
+        """Output path of a queued file"""
+        output_dir = self.output_dir_var.get().strip()
+        if not output_dir:
+            return generate_output_path(input_path, None)
+        if base_dir:
+            return str(Path(output_dir) / Path(input_path).relative_to(base_dir))
+        return str(Path(output_dir) / Path(input_path).name)
+    
+    def _start(self):
+        """Convert all queued files on the worker pool"""
+        if self._executor is not None:
+            return
+        if not self._queue:
+            messagebox.showerror("Error", "Please add files to the queue.", parent=self.window)
+            return
+        
+        try:
+            workers = max(1, int(self.workers_var.get()))
+        except (tk.TclError, ValueError):
+            messagebox.showerror("Error", "Please enter a valid worker count.", parent=self.window)
+            return
+        
+        # Files converted in an earlier run are not converted again
+        rows = [row for row in self._queue if self.table.set(row, "status") != "Done"]
+        if not rows:
+            messagebox.showinfo("Batch Conversion", "All files are converted.", parent=self.window)
+            return
+        
+        self._executor = create_pool(min(workers, len(rows)))
+        for row in rows:
+            input_path, base_dir = self._queue[row]
+            output_path = self._output_path(input_path, base_dir)
+            self._futures[row] = self._executor.submit(convert_job, input_path, output_path)
+            self.table.item(row, values=(input_path, "Queued", "", "", ""))
+        
+        self.start_btn.config(state=tk.DISABLED)
+        self.cancel_btn.config(state=tk.NORMAL)
+        self._update_summary()
+        self.window.after(POLL_INTERVAL_MS, self._poll)
+    
+    def _poll(self):
+        """Update the table with finished and running conversions"""
+        for row, future in list(self._futures.items()):
+            if future.done():
+                del self._futures[row]
+                self._show_result(row, future)
+            elif future.running():
+                self.table.set(row, "status", "Converting")
+        
+        self._update_summary()
+        if self._futures:
+            self.window.after(POLL_INTERVAL_MS, self._poll)
+        else:
+            self._finish()
+    
+    def _show_result(self, row: str, future):
+        """Show the result of one conversion"""
+        if future.cancelled():
+            self.table.set(row, "status", "Cancelled")
+            return
+        
+        try:
+            result = future.result()
+        except Exception as e:
+            self.table.set(row, "status", f"Failed: {e}")
+            return
+        
+        if result.error:
+            self.table.set(row, "status", f"Failed: {result.error}")
+        else:
+            self.table.set(row, "status", "Done")
+            self.table.set(row, "bytes_in", f"{result.bytes_in:,}")
+            self.table.set(row, "bytes_out", f"{result.bytes_out:,}")
+        self.table.set(row, "duration", f"{result.seconds * 1000:.0f} ms")
+    
+    def _cancel(self):
+        """Cancel the conversions that have not started yet"""
+        for future in self._futures.values():
+            future.cancel()
+    
+    def _finish(self):
+        """Shut the worker pool down once the queue is processed"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self.start_btn.config(state=tk.NORMAL)
+        self.cancel_btn.config(state=tk.DISABLED)
+    
+    def _clear_queue(self):
+        """Remove all files from the queue"""
+        if self._executor is not None:
+            return
+        self.table.delete(*self.table.get_children())
+        self._queue.clear()
+        self._update_summary()
+    
+    def _update_summary(self):
+        """Update the summary line below the table"""
+        total = len(self._queue)
+        if not total:
+            self.summary_var.set("Queue is empty")
+            return
+        
+        statuses = [self.table.set(row, "status") for row in self._queue]
+        done = statuses.count("Done")
+        failed = sum(1 for status in statuses if status.startswith("Failed"))
+        self.summary_var.set(f"{total} file(s): {done} done, {failed} failed")
+    
+    def _close(self):
+        """Cancel pending work and close the window"""
+        self._cancel()
+        self._finish()
+        self.window.destroy()
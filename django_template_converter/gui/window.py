@@ -4,14 +4,37 @@ GUI Window for Django Template Converter
 This module contains the graphical user interface for the converter.
 """
 
+import hashlib
+import queue
+import threading
+import time
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext, ttk
 from pathlib import Path
+from typing import Optional, Tuple
 
 from ..core.converter import DjangoTemplateConverter
+from ..core.profiling import ConversionStats
+from .batch_window import BatchConversionWindow
 from ..utils.helpers import validate_html_file, generate_output_path
 
 
+# Interval for polling conversion results from the worker thread
+POLL_INTERVAL_MS = 50
+
+# Text widgets are filled in chunks from timer callbacks, so large documents
+# don't block the event loop
+INSERT_CHUNK_SIZE = 64 * 1024
+
+# Larger outputs are shown as a paged read-only preview, and larger input
+# files are converted from disk instead of being loaded into the editor
+PREVIEW_THRESHOLD = 1024 * 1024
+PREVIEW_PAGE_SIZE = 256 * 1024
+
+# Delay after the last keystroke before a live preview conversion starts
+LIVE_DEBOUNCE_MS = 300
+
+
 class DjangoTemplateConverterGUI:
     """Main GUI class for the converter"""
     
@@ -25,6 +48,22 @@ class DjangoTemplateConverterGUI:
         self.root = root
         self.converter = DjangoTemplateConverter()
         
+        # Background conversion state
+        self._results = queue.Queue()
+        self._job_id = 0
+        self._job_live = False
+        self._cancel_event = None
+        self._polling = False
+        
+        # Live preview state
+        self._live_job = None
+        self._live_hash = None
+        
+        # Pending chunked inserts per text widget and the paged output
+        self._insert_jobs = {}
+        self._output_content = ""
+        self._output_shown = 0
+        
         self._setup_window()
         self._setup_ui()
     
@@ -109,6 +148,16 @@ class DjangoTemplateConverterGUI:
             font=("Arial", 10)
         ).pack(side=tk.LEFT)
         
+        self.live_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            input_type_frame,
+            text="Live preview",
+            variable=self.live_var,
+            command=self._on_live_toggle,
+            bg="#ecf0f1",
+            font=("Arial", 10)
+        ).pack(side=tk.RIGHT)
+        
         # Input content frame
         self.input_content_frame = tk.Frame(input_column, bg="#ecf0f1")
         self.input_content_frame.pack(fill=tk.BOTH, expand=True)
@@ -125,6 +174,7 @@ class DjangoTemplateConverterGUI:
             pady=10
         )
         self.input_code_text.pack(fill=tk.BOTH, expand=True)
+        self.input_code_text.bind("<<Modified>>", self._on_input_modified)
         
         # File input (hidden initially)
         self.input_file_frame = tk.Frame(self.input_content_frame)
@@ -208,6 +258,42 @@ class DjangoTemplateConverterGUI:
         )
         self.output_code_text.pack(fill=tk.BOTH, expand=True)
         
+        # Preview controls for large outputs (hidden initially)
+        self.preview_bar = tk.Frame(output_column, bg="#ecf0f1")
+        
+        self.preview_label_var = tk.StringVar()
+        tk.Label(
+            self.preview_bar,
+            textvariable=self.preview_label_var,
+            font=("Arial", 9),
+            bg="#ecf0f1"
+        ).pack(side=tk.LEFT)
+        
+        tk.Button(
+            self.preview_bar,
+            text="Save...",
+            command=self._save_output,
+            bg="#95a5a6",
+            fg="white",
+            font=("Arial", 9, "bold"),
+            relief=tk.FLAT,
+            padx=10,
+            cursor="hand2"
+        ).pack(side=tk.RIGHT)
+        
+        self.load_more_btn = tk.Button(
+            self.preview_bar,
+            text="Load more",
+            command=self._load_more_output,
+            bg="#3498db",
+            fg="white",
+            font=("Arial", 9, "bold"),
+            relief=tk.FLAT,
+            padx=10,
+            cursor="hand2"
+        )
+        self.load_more_btn.pack(side=tk.RIGHT, padx=(0, 5))
+        
         # File output (hidden initially)
         self.output_file_frame = tk.Frame(self.output_content_frame)
         
@@ -238,7 +324,7 @@ class DjangoTemplateConverterGUI:
         button_column = tk.Frame(parent, bg="#ecf0f1", padx=10)
         button_column.pack(side=tk.LEFT, fill=tk.Y)
         
-        convert_btn = tk.Button(
+        self.convert_btn = tk.Button(
             button_column,
             text="Convert\n→",
             command=self._convert_to_django_template,
@@ -251,7 +337,7 @@ class DjangoTemplateConverterGUI:
             cursor="hand2",
             width=10
         )
-        convert_btn.pack(pady=20)
+        self.convert_btn.pack(pady=20)
         
         clear_btn = tk.Button(
             button_column,
@@ -267,6 +353,57 @@ class DjangoTemplateConverterGUI:
             width=10
         )
         clear_btn.pack()
+        
+        batch_btn = tk.Button(
+            button_column,
+            text="Batch...",
+            command=self._open_batch_window,
+            bg="#3498db",
+            fg="white",
+            font=("Arial", 12, "bold"),
+            relief=tk.FLAT,
+            padx=20,
+            pady=10,
+            cursor="hand2",
+            width=10
+        )
+        batch_btn.pack(pady=(10, 0))
+        
+        self.profile_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            button_column,
+            text="Profile",
+            variable=self.profile_var,
+            bg="#ecf0f1",
+            font=("Arial", 10)
+        ).pack(pady=(10, 0))
+        
+        # Progress indicator and cancel button, shown while converting
+        self.progress_frame = tk.Frame(button_column, bg="#ecf0f1")
+        
+        self.progress_bar = ttk.Progressbar(
+            self.progress_frame,
+            mode="indeterminate",
+            length=120
+        )
+        self.progress_bar.pack(pady=(20, 10))
+        
+        tk.Button(
+            self.progress_frame,
+            text="Cancel",
+            command=self._cancel_conversion,
+            bg="#95a5a6",
+            fg="white",
+            font=("Arial", 10, "bold"),
+            relief=tk.FLAT,
+            padx=15,
+            pady=5,
+            cursor="hand2"
+        ).pack()
+    
+    def _open_batch_window(self):
+        """Open the batch conversion window"""
+        BatchConversionWindow(self.root)
     
     def _on_input_type_change(self):
         """Handle input type change"""
@@ -306,10 +443,15 @@ class DjangoTemplateConverterGUI:
             # Load file content into code text if visible
             if self.input_type_var.get() == "code":
                 try:
+                    if Path(file_path).stat().st_size > PREVIEW_THRESHOLD:
+                        # Too large to edit comfortably: convert it from disk
+                        self.input_type_var.set("file")
+                        self._on_input_type_change()
+                        return
                     with open(file_path, "r", encoding="utf-8") as file:
                         content = file.read()
-                    self.input_code_text.delete(1.0, tk.END)
-                    self.input_code_text.insert(1.0, content)
+                    self._clear_text(self.input_code_text)
+                    self._insert_chunked(self.input_code_text, content)
                 except Exception as e:
                     messagebox.showerror("Error", f"Error reading file: {str(e)}")
     
@@ -327,12 +469,18 @@ class DjangoTemplateConverterGUI:
             self.output_path_var.set(file_path)
     
     def _convert_to_django_template(self):
-        """Convert HTML to Django Template"""
+        """Convert HTML to Django Template on a background thread"""
         input_type = self.input_type_var.get()
         output_type = self.output_type_var.get()
+        html_content = None
+        input_path = None
+        output_path = None
         
         # Get input content
         if input_type == "code":
+            if self.input_code_text in self._insert_jobs:
+                # The file is still being loaded into the editor
+                return
             html_content = self.input_code_text.get(1.0, tk.END).strip()
             if not html_content:
                 messagebox.showerror("Error", "Please enter HTML code in the input field.")
@@ -342,60 +490,396 @@ class DjangoTemplateConverterGUI:
             if not input_path or not validate_html_file(input_path):
                 messagebox.showerror("Error", "Please select a valid HTML file.")
                 return
-            try:
-                with open(input_path, "r", encoding="utf-8") as file:
-                    html_content = file.read()
-            except Exception as e:
-                messagebox.showerror("Error", f"Error reading file: {str(e)}")
-                return
         
-        # Convert content
+        # Determine output path
+        if output_type == "file":
+            output_path = self.output_path_var.get().strip()
+            if not output_path:
+                # Generate default output path
+                if input_type == "file":
+                    output_path = generate_output_path(input_path, None)
+                else:
+                    messagebox.showerror("Error", "Please specify output file path.")
+                    return
+        
+        self._start_conversion(html_content, input_path, output_path)
+    
+    def _start_conversion(
+        self,
+        html_content: str,
+        input_path: str,
+        output_path: str,
+        live: bool = False
+    ):
+        """Start a conversion on a worker thread, superseding any running one"""
+        self._job_id += 1
+        self._job_live = live
+        self._cancel_event = threading.Event()
+        stats = ConversionStats() if self.profile_var.get() and not live else None
+        worker = threading.Thread(
+            target=self._run_conversion,
+            args=(self._job_id, self._cancel_event, html_content, input_path, output_path, stats),
+            daemon=True
+        )
+        worker.start()
+        
+        if not live:
+            self._set_busy(True)
+        if not self._polling:
+            self._polling = True
+            self.root.after(POLL_INTERVAL_MS, self._poll_conversion)
+    
+    def _run_conversion(
+        self,
+        job_id: int,
+        cancel_event: threading.Event,
+        html_content: str,
+        input_path: str,
+        output_path: str,
+        stats: Optional[ConversionStats] = None
+    ):
+        """
+        Read, convert and write on the worker thread.
+        
+        Tk widgets must not be touched here; the result is handed to the
+        event thread through the results queue. Profiled conversions use
+        their own converter, so a concurrent live preview doesn't add to
+        their statistics.
+        """
+        converter = self.converter
+        if stats is not None:
+            converter = DjangoTemplateConverter(self.converter.parser, stats=stats)
         try:
-            converted_html = self.converter.convert_string(html_content)
+            start = time.perf_counter()
+            if html_content is None:
+                with open(input_path, "r", encoding="utf-8") as file:
+                    html_content = file.read()
+            read = time.perf_counter()
             
-            # Handle output
-            if output_type == "code":
-                self.output_code_text.config(state=tk.NORMAL)
-                self.output_code_text.delete(1.0, tk.END)
-                self.output_code_text.insert(1.0, converted_html)
-                self.output_code_text.config(state=tk.DISABLED)
-                messagebox.showinfo("Success", "Conversion completed successfully!")
-            else:
-                output_path = self.output_path_var.get().strip()
-                if not output_path:
-                    # Generate default output path
-                    if input_type == "file":
-                        output_path = generate_output_path(input_path, None)
-                    else:
-                        messagebox.showerror("Error", "Please specify output file path.")
-                        return
-                
+            converted_html = converter.convert_string(html_content)
+            
+            converted = time.perf_counter()
+            if output_path and not cancel_event.is_set():
                 with open(output_path, "w", encoding="utf-8") as file:
                     file.write(converted_html)
-                
-                messagebox.showinfo(
-                    "Success",
-                    f"Conversion completed successfully!\n\nOutput file:\n{output_path}"
-                )
-                
-                # Also show in code output if visible
-                if self.output_code_text.winfo_viewable():
-                    self.output_code_text.config(state=tk.NORMAL)
-                    self.output_code_text.delete(1.0, tk.END)
-                    self.output_code_text.insert(1.0, converted_html)
-                    self.output_code_text.config(state=tk.DISABLED)
+            
+            if stats is not None:
+                stats.add("read", read - start)
+                stats.add("write", time.perf_counter() - converted)
+            self._results.put((job_id, converted_html, output_path, stats, None))
+        except Exception as e:
+            self._results.put((job_id, None, output_path, stats, e))
+    
+    def _poll_conversion(self):
+        """Check for a finished conversion on the Tk event thread"""
+        try:
+            job_id, converted_html, output_path, stats, error = self._results.get_nowait()
+        except queue.Empty:
+            if self._cancel_event is not None:
+                self.root.after(POLL_INTERVAL_MS, self._poll_conversion)
+            else:
+                self._polling = False
+            return
         
+        if job_id != self._job_id or self._cancel_event is None:
+            # Result of a cancelled or superseded conversion
+            self._poll_conversion()
+            return
+        
+        self._cancel_event = None
+        self._polling = False
+        
+        if self._job_live:
+            # Live preview: keep the editor quiet, errors just leave the
+            # previous output in place
+            if error is None:
+                self._update_output(converted_html)
+            return
+        
+        self._set_busy(False)
+        
+        if error is not None:
+            messagebox.showerror("Error", f"Error converting: {str(error)}")
+            return
+        
+        self._show_output(converted_html, output_path, stats)
+    
+    def _on_live_toggle(self):
+        """Handle live preview checkbox"""
+        if self.live_var.get():
+            self._schedule_live_conversion()
+        elif self._live_job is not None:
+            self.root.after_cancel(self._live_job)
+            self._live_job = None
+    
+    def _on_input_modified(self, event=None):
+        """Handle edits of the input code text"""
+        # Reset the flag so the next edit fires <<Modified>> again
+        self.input_code_text.edit_modified(False)
+        if self.live_var.get():
+            self._schedule_live_conversion()
+    
+    def _schedule_live_conversion(self):
+        """(Re)start the live preview debounce timer"""
+        if self._live_job is not None:
+            self.root.after_cancel(self._live_job)
+        self._live_job = self.root.after(LIVE_DEBOUNCE_MS, self._live_convert)
+    
+    def _live_convert(self):
+        """Convert the input code for the live preview if it changed"""
+        self._live_job = None
+        if not self.live_var.get() or self.input_type_var.get() != "code":
+            return
+        if self._cancel_event is not None and not self._job_live:
+            # Don't supersede a conversion started with the Convert button
+            self._schedule_live_conversion()
+            return
+        if self.input_code_text in self._insert_jobs:
+            # A file is still being loaded; its last chunk schedules the preview
+            return
+        
+        html_content = self.input_code_text.get(1.0, tk.END).strip()
+        content_hash = hashlib.blake2b(html_content.encode("utf-8"), digest_size=16).digest()
+        if content_hash == self._live_hash:
+            return
+        self._live_hash = content_hash
+        
+        self._start_conversion(html_content, None, None, live=True)
+    
+    def _update_output(self, content: str):
+        """
+        Replace only the changed lines of the output text.
+        
+        The lines shared with the current output at its start and end are
+        kept, and the differing range in between is replaced in place.
+        """
+        old_content = self._output_content
+        if (len(content) > PREVIEW_THRESHOLD or len(old_content) > PREVIEW_THRESHOLD
+                or self.output_code_text in self._insert_jobs):
+            self._set_output(content)
+            return
+        
+        first, last, replacement = _changed_lines(old_content, content)
+        
+        # Text widget lines are 1-based
+        start = f"{first + 1}.0"
+        end = f"{last + 1}.0"
+        self.output_code_text.config(state=tk.NORMAL)
+        self.output_code_text.delete(start, end)
+        self.output_code_text.insert(start, replacement)
+        self.output_code_text.config(state=tk.DISABLED)
+        
+        self._output_content = content
+        self._output_shown = len(content)
+    
+    def _show_output(
+        self,
+        converted_html: str,
+        output_path: str,
+        stats: Optional[ConversionStats] = None
+    ):
+        """Display a finished conversion and its profile, if any"""
+        message = "Conversion completed successfully!"
+        if output_path:
+            message += f"\n\nOutput file:\n{output_path}"
+        if stats is not None:
+            message += f"\n\n{stats.report()}"
+        
+        if not output_path:
+            self._set_output(converted_html)
+            messagebox.showinfo("Success", message)
+            return
+        
+        messagebox.showinfo("Success", message)
+        
+        # Also show in code output if visible
+        if self.output_code_text.winfo_viewable():
+            self._set_output(converted_html)
+    
+    def _set_output(self, content: str):
+        """Show content in the output text, as a paged preview if large"""
+        self._clear_text(self.output_code_text, read_only=True)
+        self._output_content = content
+        
+        if len(content) > PREVIEW_THRESHOLD:
+            self._output_shown = PREVIEW_PAGE_SIZE
+            self.preview_bar.pack(fill=tk.X, pady=(5, 0))
+        else:
+            self._output_shown = len(content)
+            self.preview_bar.pack_forget()
+        
+        self._insert_chunked(
+            self.output_code_text, content[:self._output_shown], read_only=True
+        )
+        self._update_preview_bar()
+    
+    def _load_more_output(self):
+        """Append the next page of a large output to the preview"""
+        if self.output_code_text in self._insert_jobs:
+            return
+        
+        start = self._output_shown
+        self._output_shown = min(start + PREVIEW_PAGE_SIZE, len(self._output_content))
+        self._insert_chunked(
+            self.output_code_text,
+            self._output_content[start:self._output_shown],
+            read_only=True
+        )
+        self._update_preview_bar()
+    
+    def _update_preview_bar(self):
+        """Update the preview size label and Load more button"""
+        total = len(self._output_content)
+        self.preview_label_var.set(
+            f"Preview: {self._output_shown // 1024:,} of {total // 1024:,} KB"
+        )
+        self.load_more_btn.config(
+            state=tk.NORMAL if self._output_shown < total else tk.DISABLED
+        )
+    
+    def _save_output(self):
+        """Save the full output to a file"""
+        file_path = filedialog.asksaveasfilename(
+            title="Save Output File",
+            defaultextension=".html",
+            filetypes=[
+                ("HTML Files", "*.html"),
+                ("All Files", "*.*")
+            ]
+        )
+        if not file_path:
+            return
+        try:
+            with open(file_path, "w", encoding="utf-8") as file:
+                file.write(self._output_content)
         except Exception as e:
-            messagebox.showerror("Error", f"Error converting: {str(e)}")
+            messagebox.showerror("Error", f"Error saving file: {str(e)}")
+    
+    def _clear_text(self, widget: tk.Text, read_only: bool = False):
+        """Cancel pending inserts into a text widget and empty it"""
+        job = self._insert_jobs.pop(widget, None)
+        if job is not None:
+            self.root.after_cancel(job)
+            if widget is self.input_code_text:
+                self._update_convert_button()
+        
+        if read_only:
+            widget.config(state=tk.NORMAL)
+        widget.delete(1.0, tk.END)
+        if read_only:
+            widget.config(state=tk.DISABLED)
+    
+    def _insert_chunked(
+        self,
+        widget: tk.Text,
+        content: str,
+        read_only: bool = False,
+        start: int = 0
+    ):
+        """
+        Append content to a text widget in chunks.
+        
+        Each chunk is inserted from its own timer callback, so the event
+        loop keeps handling input and redraws between chunks.
+        """
+        end = start + INSERT_CHUNK_SIZE
+        if read_only:
+            widget.config(state=tk.NORMAL)
+        widget.insert(tk.END, content[start:end])
+        if read_only:
+            widget.config(state=tk.DISABLED)
+        
+        if end < len(content):
+            self._insert_jobs[widget] = self.root.after(
+                1, self._insert_chunked, widget, content, read_only, end
+            )
+        else:
+            self._insert_jobs.pop(widget, None)
+        if widget is self.input_code_text:
+            self._update_convert_button()
+    
+    def _cancel_conversion(self):
+        """Cancel the running conversion"""
+        if self._cancel_event is None:
+            return
+        
+        # The worker can't be interrupted mid-parse; its result is discarded
+        # and it does not write the output file once cancelled
+        self._cancel_event.set()
+        self._cancel_event = None
+        self._set_busy(False)
+    
+    def _set_busy(self, busy: bool):
+        """Show or hide the progress indicator"""
+        if busy:
+            self.convert_btn.config(state=tk.DISABLED)
+            self.progress_frame.pack(fill=tk.X)
+            self.progress_bar.start(10)
+        else:
+            self.progress_bar.stop()
+            self.progress_frame.pack_forget()
+            self._update_convert_button()
+    
+    def _update_convert_button(self):
+        """
+        Enable the Convert button unless it would convert the wrong input.
+        
+        The button stays disabled while a conversion started with it is
+        running and while a file is still being inserted into the input
+        code text, which would otherwise be converted half loaded.
+        """
+        busy = self._cancel_event is not None and not self._job_live
+        loading = self.input_code_text in self._insert_jobs
+        self.convert_btn.config(state=tk.DISABLED if busy or loading else tk.NORMAL)
     
     def _clear_all(self):
         """Clear all fields"""
         # Clear input
-        self.input_code_text.delete(1.0, tk.END)
+        self._clear_text(self.input_code_text)
         self.input_path_var.set("")
         
         # Clear output
-        self.output_code_text.config(state=tk.NORMAL)
-        self.output_code_text.delete(1.0, tk.END)
-        self.output_code_text.config(state=tk.DISABLED)
+        self._clear_text(self.output_code_text, read_only=True)
+        self._output_content = ""
+        self._output_shown = 0
+        self.preview_bar.pack_forget()
+        self._live_hash = None
         self.output_path_var.set("")
+
+
+def _split_lines(content: str) -> list:
+    """Split text into lines the way Tk counts them, keeping the newlines"""
+    lines = content.split("\n")
+    last = lines.pop()
+    lines = [line + "\n" for line in lines]
+    if last:
+        lines.append(last)
+    return lines
+
+
+def _changed_lines(old_content: str, new_content: str) -> Tuple[int, int, str]:
+    """
+    Find the range of lines to replace to turn old_content into new_content.
+    
+    Args:
+        old_content: Text currently shown
+        new_content: Text to show
+    
+    Returns:
+        0-based index of the first changed line, index after the last
+        changed line of old_content, and the text replacing that range
+    """
+    old_lines = _split_lines(old_content)
+    new_lines = _split_lines(new_content)
+    common = min(len(old_lines), len(new_lines))
+    
+    prefix = 0
+    while prefix < common and old_lines[prefix] == new_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    while (suffix < common - prefix
+           and old_lines[-1 - suffix] == new_lines[-1 - suffix]):
+        suffix += 1
+    
+    replacement = "".join(new_lines[prefix:len(new_lines) - suffix])
+    return prefix, len(old_lines) - suffix, replacement
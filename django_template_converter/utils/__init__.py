@@ -3,7 +3,7 @@ Utility functions for Django Template Converter
 توابع کمکی
 """
 
-from .helpers import validate_html_file, generate_output_path
+from .helpers import atomic_write, validate_html_file, generate_output_path
 
-__all__ = ['validate_html_file', 'generate_output_path']
+__all__ = ['atomic_write', 'validate_html_file', 'generate_output_path']
 
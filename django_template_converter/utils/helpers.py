@@ -1,11 +1,15 @@
 """
 Helper utility functions
 
-This module contains utility functions for file validation and path generation.
+This module contains utility functions for file validation, path generation
+and atomic file writes.
 """
 
+import os
+import secrets
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import IO, Iterator, Optional
 
 
 def validate_html_file(file_path: str) -> bool:
@@ -42,3 +46,35 @@ def generate_output_path(
     input_file = Path(input_path)
     return str(input_file.parent / f"{input_file.stem}_django{input_file.suffix}")
 
+
+
+@contextmanager
+def atomic_write(
+    path: str,
+    encoding: str = "utf-8",
+    newline: Optional[str] = None
+) -> Iterator[IO[str]]:
+    """
+    Open a text file for writing that replaces path only once it is complete.
+    
+    The content is written to a temporary file next to path, which is renamed
+    into place when the block exits without an error and removed otherwise.
+    
+    Args:
+        path: Path to output file
+        encoding: Text encoding
+        newline: Newline translation, as for open()
+        
+    Yields:
+        Writable text file
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    temp_path = os.path.join(directory, f".{name}.{secrets.token_hex(4)}.tmp")
+    try:
+        with open(temp_path, "x", encoding=encoding, newline=newline) as file:
+            yield file
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
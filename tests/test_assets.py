@@ -0,0 +1,133 @@
+"""
+Unit tests for the asset index
+تست‌های واحد برای فهرست فایل‌های استاتیک
+"""
+
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from pathlib import Path
+from unittest.mock import patch
+
+from django_template_converter.cli import main
+from django_template_converter.core.assets import AssetIndex, AssetReference
+from django_template_converter.core.batch import convert_tree
+from django_template_converter.core.converter import DjangoTemplateConverter
+
+
+HTML = (
+    '<html><head><link rel="stylesheet" href="css/a.css">'
+    '<style>body { background: url(img/bg.png); }</style></head>'
+    '<body><img src="img/a.png" srcset="img/a-1x.png 1x, img/a-2x.png 2x">'
+    '<img src="https://example.com/b.png"><script src="{% static \'js/app.js\' %}"></script>'
+    '</body></html>'
+)
+
+EXPECTED = [
+    AssetReference("css/a.css", "link", "href"),
+    AssetReference("img/bg.png", "style", "#text"),
+    AssetReference("img/a.png", "img", "src"),
+    AssetReference("img/a-1x.png", "img", "srcset"),
+    AssetReference("img/a-2x.png", "img", "srcset"),
+    AssetReference("js/app.js", "script", "src"),
+]
+
+
+class TestAssetIndex(unittest.TestCase):
+    """تست‌های جمع‌آوری فایل‌های استاتیک"""
+    
+    def setUp(self):
+        """ساخت پوشه موقت"""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+    
+    def tearDown(self):
+        """حذف پوشه موقت"""
+        self._tmp.cleanup()
+    
+    def make_tree(self):
+        """ساخت پوشه قالب‌ها"""
+        src = self.root / "src"
+        for name in ("a.html", "blog/b.html", "blog/c.html"):
+            path = src / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(HTML, encoding="utf-8")
+        return src
+    
+    def test_references_per_parser(self):
+        """تست جمع‌آوری ارجاع‌ها در یک بار پیمایش برای هر پارسر"""
+        for parser in ("html.parser", "lxml.html"):
+            with self.subTest(parser=parser):
+                references = []
+                DjangoTemplateConverter(parser=parser).convert_string(HTML, references)
+                self.assertEqual(references, EXPECTED)
+    
+    def test_convert_tree(self):
+        """تست ساخت فهرست برای یک پوشه با و بدون فرایندهای کارگر"""
+        src = self.make_tree()
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                index = AssetIndex()
+                convert_tree(str(src), str(self.root / f"out{workers}"), workers=workers, assets=index)
+                
+                self.assertEqual(sorted(index.templates), ["a.html", "blog/b.html", "blog/c.html"])
+                self.assertEqual(index.templates["blog/b.html"], EXPECTED)
+                self.assertEqual(
+                    index.assets()["css/a.css"], ["a.html", "blog/b.html", "blog/c.html"]
+                )
+    
+    def test_incremental_uses_cache(self):
+        """تست بازگرداندن ارجاع‌های فایل‌های رد شده از حافظه نهان"""
+        src = self.make_tree()
+        convert_tree(str(src), str(self.root / "out"), workers=1, incremental=True, assets=AssetIndex())
+        
+        index = AssetIndex()
+        with patch.object(DjangoTemplateConverter, "convert_string", side_effect=AssertionError):
+            convert_tree(str(src), str(self.root / "out"), workers=1, incremental=True, assets=index)
+        
+        self.assertEqual(index.templates["a.html"], EXPECTED)
+    
+    def test_missing_and_round_trip(self):
+        """تست یافتن فایل‌های ناموجود و ذخیره و بارگذاری JSON"""
+        static = self.root / "static"
+        (static / "css").mkdir(parents=True)
+        (static / "css" / "a.css").write_text("", encoding="utf-8")
+        
+        index = AssetIndex()
+        index.add("page.html", EXPECTED + [AssetReference("css/a.css?v=2", "link", "href")])
+        
+        self.assertEqual(
+            index.missing([str(static)]),
+            {"page.html": ["img/a-1x.png", "img/a-2x.png", "img/a.png", "img/bg.png", "js/app.js"]}
+        )
+        
+        path = self.root / "index.json"
+        index.save(str(path))
+        self.assertEqual(AssetIndex.load(str(path)).templates, index.templates)
+    
+    def test_cli(self):
+        """تست گزینه‌های --asset-index و --static-dir"""
+        src = self.make_tree()
+        static = self.root / "static"
+        static.mkdir()
+        index_path = self.root / "assets.json"
+        
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            status = main([
+                "convert", str(src), "-o", str(self.root / "out"), "-j", "1",
+                "--asset-index", str(index_path), "--static-dir", str(static)
+            ])
+        
+        self.assertEqual(status, 1)
+        self.assertIn("missing static file: blog/b.html: img/bg.png", stderr.getvalue())
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+        self.assertEqual(data["templates"]["a.html"][0], {
+            "path": "css/a.css", "tag": "link", "attribute": "href"
+        })
+
+
+if __name__ == "__main__":
+    unittest.main()
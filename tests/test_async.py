@@ -0,0 +1,134 @@
+"""
+Unit tests for the asyncio API of the converter
+تست‌های واحد برای رابط asyncio تبدیل کننده
+"""
+
+import asyncio
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+from django_template_converter.core.converter import DjangoTemplateConverter
+from django_template_converter.core.profiling import ConversionStats
+
+
+def run(coroutine):
+    """اجرای یک coroutine در حلقه رویداد جدید"""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class TestAsyncConversion(unittest.TestCase):
+    """تست‌های متدهای convert_string_async و convert_files_async"""
+    
+    def setUp(self):
+        """تنظیمات اولیه برای هر تست"""
+        self.converter = DjangoTemplateConverter()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+    
+    def tearDown(self):
+        """حذف پوشه موقت"""
+        self._tmp.cleanup()
+    
+    def test_convert_string_async(self):
+        """تست یکسان بودن خروجی با تبدیل همگام"""
+        html = '<link href="css/a.css"><img src="img/a.png">'
+        
+        self.assertEqual(
+            run(self.converter.convert_string_async(html)),
+            self.converter.convert_string(html)
+        )
+    
+    def test_convert_files_async(self):
+        """تست تبدیل چند فایل و ترتیب خروجی‌ها"""
+        input_paths = []
+        for index in range(5):
+            path = self.root / f"page{index}.html"
+            path.write_text(f'<img src="img/{index}.png">', encoding="utf-8")
+            input_paths.append(str(path))
+        output_paths = [None, str(self.root / "custom.html"), None, None, None]
+        
+        outputs = run(self.converter.convert_files_async(input_paths, output_paths))
+        
+        self.assertEqual(outputs[0], str(self.root / "page0_django.html"))
+        self.assertEqual(outputs[1], str(self.root / "custom.html"))
+        for index, output_path in enumerate(outputs):
+            self.assertIn(
+                f'{{% static "img/{index}.png" %}}',
+                Path(output_path).read_text(encoding="utf-8")
+            )
+    
+    def test_concurrency_limit(self):
+        """تست محدود شدن تعداد تبدیل‌های هم‌زمان و مسدود نشدن حلقه رویداد"""
+        input_paths = []
+        for index in range(6):
+            path = self.root / f"page{index}.html"
+            path.write_text("<p>x</p>", encoding="utf-8")
+            input_paths.append(str(path))
+        
+        lock = threading.Lock()
+        active = [0, 0]
+        convert_string = self.converter.convert_string
+        
+        def slow_convert(html_content):
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return convert_string(html_content)
+        
+        async def main():
+            ticks = 0
+            
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.005)
+                    ticks += 1
+            
+            task = asyncio.ensure_future(ticker())
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                await self.converter.convert_files_async(
+                    input_paths, concurrency=2, executor=executor
+                )
+            task.cancel()
+            return ticks
+        
+        with patch.object(self.converter, "convert_string", side_effect=slow_convert):
+            ticks = run(main())
+        
+        self.assertEqual(active[1], 2)
+        self.assertGreater(ticks, 0)
+    
+    def test_missing_file(self):
+        """تست خطا برای فایل ورودی ناموجود"""
+        with self.assertRaises(FileNotFoundError):
+            run(self.converter.convert_files_async([str(self.root / "missing.html")]))
+        with self.assertRaises(ValueError):
+            run(self.converter.convert_files_async(["a.html"], []))
+    
+    def test_stats_need_single_file(self):
+        """تست رد آمار مشترک در تبدیل هم‌زمان چند فایل"""
+        path = self.root / "page.html"
+        path.write_text('<img src="img/a.png">', encoding="utf-8")
+        stats = ConversionStats()
+        converter = DjangoTemplateConverter(stats=stats)
+        
+        with self.assertRaises(ValueError):
+            run(converter.convert_files_async([str(path)]))
+        run(converter.convert_files_async([str(path)], concurrency=1))
+        self.assertEqual(stats.documents, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
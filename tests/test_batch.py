@@ -0,0 +1,142 @@
+"""
+Unit tests for batch conversion
+تست‌های واحد برای تبدیل دسته‌ای
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from django_template_converter.core.batch import (
+    convert_job, convert_tree, create_pool, find_templates
+)
+from django_template_converter.core.profiling import ConversionStats
+
+
+class TestConvertTree(unittest.TestCase):
+    """تست‌های تابع convert_tree"""
+    
+    def setUp(self):
+        """ساخت یک پوشه قالب نمونه"""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.src = self.root / "theme"
+        for relative in ("index.html", "blog/post.html", "blog/partials/nav.html"):
+            path = self.src / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text('<img src="img/a.png">', encoding="utf-8")
+        (self.src / "css").mkdir()
+        (self.src / "css" / "style.css").write_text("body {}", encoding="utf-8")
+    
+    def tearDown(self):
+        """حذف پوشه موقت"""
+        self._tmp.cleanup()
+    
+    def test_keeps_layout(self):
+        """تست حفظ ساختار پوشه‌ها"""
+        dst = self.root / "templates"
+        outputs = convert_tree(str(self.src), str(dst), workers=1)
+        
+        expected = sorted(
+            str(dst / relative)
+            for relative in ("index.html", "blog/post.html", "blog/partials/nav.html")
+        )
+        self.assertEqual(sorted(outputs), expected)
+        self.assertFalse((dst / "css").exists())
+        self.assertIn(
+            '{% static "img/a.png" %}',
+            (dst / "blog" / "post.html").read_text(encoding="utf-8")
+        )
+    
+    def test_process_pool(self):
+        """تست تبدیل با چند فرایند"""
+        single = convert_tree(str(self.src), str(self.root / "single"), workers=1)
+        pooled = convert_tree(
+            str(self.src), str(self.root / "pooled"), workers=2, parser="lxml.html"
+        )
+        
+        self.assertEqual(len(single), len(pooled))
+        for output_path in pooled:
+            self.assertIn('{% static "img/a.png" %}', Path(output_path).read_text(encoding="utf-8"))
+    
+    def test_output_inside_source(self):
+        """تست نادیده گرفتن پوشه خروجی داخل پوشه ورودی"""
+        dst = self.src / "converted"
+        convert_tree(str(self.src), str(dst), workers=1)
+        outputs = convert_tree(str(self.src), str(dst), workers=1)
+        
+        self.assertEqual(len(outputs), 3)
+    
+    def test_output_is_parent_of_source(self):
+        """تست تبدیل همه قالب‌ها در پوشه خروجی بالاتر از پوشه ورودی"""
+        outputs = convert_tree(str(self.src), str(self.root), workers=1)
+        
+        self.assertEqual(len(outputs), 3)
+        self.assertIn('{% static "img/a.png" %}', (self.root / "index.html").read_text(encoding="utf-8"))
+    
+    def test_find_templates_excluded_dir(self):
+        """تست حذف پوشه خروجی با مسیرهای نوشته شده به شکل‌های مختلف"""
+        for relative in ("converted/index.html", "converted2/index.html"):
+            path = self.src / relative
+            path.parent.mkdir()
+            path.write_text("<p></p>", encoding="utf-8")
+        
+        found = find_templates(str(self.src), exclude_dir=str(self.root / "theme" / "blog" / ".." / "converted"))
+        
+        self.assertEqual(
+            [path.relative_to(self.src).as_posix() for path in found],
+            ["blog/partials/nav.html", "blog/post.html", "converted2/index.html", "index.html"]
+        )
+        with self.assertRaises(ValueError):
+            find_templates(str(self.src), exclude_dir=str(self.src))
+        self.assertEqual(len(find_templates(str(self.src), exclude_dir=str(self.root))), 5)
+        self.assertEqual(len(find_templates(str(self.src), exclude_dir=str(self.root / "other"))), 5)
+    
+    def test_convert_job(self):
+        """تست نتیجه هر فایل در صف تبدیل"""
+        output_path = str(self.root / "queue" / "index.html")
+        with create_pool(1) as executor:
+            result = executor.submit(convert_job, str(self.src / "index.html"), output_path).result()
+            failed = executor.submit(convert_job, str(self.src / "missing.html"), output_path).result()
+        
+        self.assertIsNone(result.error)
+        self.assertEqual(result.bytes_out, Path(output_path).stat().st_size)
+        self.assertGreater(result.bytes_out, result.bytes_in)
+        self.assertIsNotNone(failed.error)
+    
+    def test_identical_inputs_converted_once(self):
+        """تست تبدیل یک‌باره فایل‌های یکسان و کپی خروجی آن‌ها"""
+        (self.src / "about.html").write_text('<img src="img/b.png">', encoding="utf-8")
+        stats = ConversionStats()
+        dst = self.root / "templates"
+        outputs = convert_tree(str(self.src), str(dst), workers=1, stats=stats)
+        
+        self.assertEqual(stats.documents, 2)
+        self.assertEqual(len(outputs), 4)
+        contents = {Path(output).read_text(encoding="utf-8") for output in outputs}
+        self.assertEqual(len(contents), 2)
+        self.assertIn('img/b.png', (dst / "about.html").read_text(encoding="utf-8"))
+    
+    def test_hardlinks_are_replaced(self):
+        """تست پیوند سخت خروجی‌های یکسان و جایگزینی آن‌ها بدون تغییر بقیه"""
+        dst = self.root / "templates"
+        outputs = convert_tree(str(self.src), str(dst), workers=1, incremental=True, hardlink=True)
+        self.assertEqual(len({os.stat(output).st_ino for output in outputs}), 1)
+        self.assertEqual(os.stat(outputs[0]).st_nlink, 3)
+        
+        (self.src / "index.html").write_text('<img src="img/new.png">', encoding="utf-8")
+        convert_tree(str(self.src), str(dst), workers=1, incremental=True, hardlink=True)
+        
+        self.assertIn("img/new.png", (dst / "index.html").read_text(encoding="utf-8"))
+        self.assertIn("img/a.png", (dst / "blog/post.html").read_text(encoding="utf-8"))
+        self.assertEqual(os.stat(dst / "blog/post.html").st_nlink, 2)
+    
+    def test_missing_source(self):
+        """تست خطا برای پوشه ورودی ناموجود"""
+        with self.assertRaises(FileNotFoundError):
+            convert_tree(str(self.root / "missing"), str(self.root / "out"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+Unit tests for the incremental conversion cache
+تست‌های واحد برای حافظه نهان تبدیل
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from django_template_converter.core.batch import convert_tree
+from django_template_converter.core.cache import ConversionCache, MANIFEST_NAME
+from django_template_converter.core.converter import DjangoTemplateConverter
+
+
+class TestConversionCache(unittest.TestCase):
+    """تست‌های کلاس ConversionCache"""
+    
+    def setUp(self):
+        """ساخت فایل ورودی نمونه"""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.input_path = str(self.root / "page.html")
+        self.output_path = str(self.root / "page_django.html")
+        Path(self.input_path).write_text('<img src="a.png">', encoding="utf-8")
+    
+    def tearDown(self):
+        """حذف پوشه موقت"""
+        self._tmp.cleanup()
+    
+    def convert(self, converter=None):
+        """تبدیل با حافظه نهان و بازگرداندن تعداد فراخوانی convert_string"""
+        converter = converter or DjangoTemplateConverter()
+        with patch.object(
+            converter, "convert_string", wraps=converter.convert_string
+        ) as convert_string:
+            with ConversionCache(str(self.root)) as cache:
+                converter.convert_file(self.input_path, self.output_path, cache=cache)
+        return convert_string.call_count
+    
+    def test_skips_unchanged_file(self):
+        """تست رد شدن فایل تغییر نیافته"""
+        self.assertEqual(self.convert(), 1)
+        self.assertTrue((self.root / MANIFEST_NAME).exists())
+        self.assertEqual(self.convert(), 0)
+    
+    def test_touched_file_with_same_content(self):
+        """تست رد شدن فایلی که فقط زمان تغییرش عوض شده"""
+        self.convert()
+        stat = os.stat(self.input_path)
+        os.utime(self.input_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        
+        self.assertEqual(self.convert(), 0)
+    
+    def test_changed_file(self):
+        """تست تبدیل دوباره فایل تغییر یافته"""
+        self.convert()
+        Path(self.input_path).write_text('<img src="b.png">', encoding="utf-8")
+        
+        self.assertEqual(self.convert(), 1)
+        self.assertIn("b.png", Path(self.output_path).read_text(encoding="utf-8"))
+    
+    def test_options_invalidate(self):
+        """تست تبدیل دوباره با تنظیمات متفاوت"""
+        self.convert()
+        
+        self.assertEqual(self.convert(DjangoTemplateConverter(parser="lxml.html")), 1)
+    
+    def test_missing_output(self):
+        """تست تبدیل دوباره در صورت حذف فایل خروجی"""
+        self.convert()
+        os.remove(self.output_path)
+        
+        self.assertEqual(self.convert(), 1)
+    
+    def test_incremental_tree(self):
+        """تست تبدیل افزایشی پوشه"""
+        src = self.root / "theme"
+        dst = self.root / "templates"
+        src.mkdir()
+        for name in ("a.html", "b.html"):
+            (src / name).write_text('<img src="a.png">', encoding="utf-8")
+        
+        convert_tree(str(src), str(dst), workers=1, incremental=True)
+        (src / "b.html").write_text('<img src="b.png">', encoding="utf-8")
+        
+        with patch.object(
+            DjangoTemplateConverter, "convert_string", autospec=True,
+            side_effect=DjangoTemplateConverter.convert_string
+        ) as convert_string:
+            outputs = convert_tree(str(src), str(dst), workers=1, incremental=True)
+        
+        self.assertEqual(len(outputs), 2)
+        self.assertEqual(convert_string.call_count, 1)
+        self.assertIn("b.png", (dst / "b.html").read_text(encoding="utf-8"))
+
+    
+    def save_during_conversion(self, input_path):
+        """جایگزین convert_string که فایل ورودی را در حین تبدیل تغییر می‌دهد"""
+        original = DjangoTemplateConverter.convert_string
+        
+        def convert_string(converter, html_content, *args):
+            stat = os.stat(input_path)
+            Path(input_path).write_text('<img src="new.png">', encoding="utf-8")
+            # Keep the change visible even on coarse modification times
+            os.utime(input_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+            return original(converter, html_content, *args)
+        
+        return patch.object(DjangoTemplateConverter, "convert_string", convert_string)
+    
+    def test_saved_during_conversion(self):
+        """تست تبدیل دوباره فایلی که در حین تبدیل ذخیره شده است"""
+        Path(self.input_path).write_text('<img src="old.png">', encoding="utf-8")
+        with self.save_during_conversion(self.input_path):
+            with ConversionCache(str(self.root)) as cache:
+                DjangoTemplateConverter().convert_file(self.input_path, self.output_path, cache=cache)
+        self.assertIn("old.png", Path(self.output_path).read_text(encoding="utf-8"))
+        
+        self.assertEqual(self.convert(), 1)
+        self.assertIn("new.png", Path(self.output_path).read_text(encoding="utf-8"))
+    
+    def test_tree_saved_during_conversion(self):
+        """تست تبدیل افزایشی پوشه با فایلی که در حین تبدیل ذخیره شده است"""
+        src = self.root / "theme"
+        dst = self.root / "templates"
+        src.mkdir()
+        for name in ("a.html", "b.html"):
+            (src / name).write_text('<img src="old.png">', encoding="utf-8")
+        
+        with self.save_during_conversion(str(src / "a.html")):
+            convert_tree(str(src), str(dst), workers=1, incremental=True)
+        convert_tree(str(src), str(dst), workers=1, incremental=True)
+        
+        self.assertIn("new.png", (dst / "a.html").read_text(encoding="utf-8"))
+        self.assertIn("old.png", (dst / "b.html").read_text(encoding="utf-8"))
+
+
+if __name__ == "__main__":
+    unittest.main()
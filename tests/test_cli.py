@@ -0,0 +1,121 @@
+"""
+Unit tests for the command-line interface
+تست‌های واحد برای رابط خط فرمان
+"""
+
+import io
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+from django_template_converter.cli import main
+
+
+class TestCommandLine(unittest.TestCase):
+    """تست‌های دستور django-template-converter"""
+    
+    def setUp(self):
+        """ساخت پوشه موقت"""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+    
+    def tearDown(self):
+        """حذف پوشه موقت"""
+        self._tmp.cleanup()
+    
+    def run_cli(self, argv, stdin=""):
+        """اجرای دستور و بازگرداندن کد خروج و خروجی استاندارد"""
+        stdout = io.StringIO()
+        with patch("sys.stdin", io.StringIO(stdin)), redirect_stdout(stdout), \
+                redirect_stderr(io.StringIO()):
+            status = main(argv)
+        return status, stdout.getvalue()
+    
+    def test_stdin_to_stdout(self):
+        """تست تبدیل از ورودی استاندارد به خروجی استاندارد"""
+        status, output = self.run_cli(["convert"], stdin='<img src="img/a.png">')
+        
+        self.assertEqual(status, 0)
+        self.assertIn('{% static "img/a.png" %}', output)
+    
+    def test_streaming_stdin(self):
+        """تست تبدیل جریانی از ورودی استاندارد"""
+        status, output = self.run_cli(["convert", "--streaming"], stdin='<img src="img/a.png">')
+        
+        self.assertEqual(status, 0)
+        self.assertEqual(output, '{% load static %}\n<img src="{% static \'img/a.png\' %}">')
+    
+    def test_file_mode(self):
+        """تست تبدیل فایل"""
+        input_path = self.root / "page.html"
+        input_path.write_text('<script src="js/a.js"></script>', encoding="utf-8")
+        output_path = self.root / "out.html"
+        
+        status, _ = self.run_cli(["convert", str(input_path), "-o", str(output_path)])
+        
+        self.assertEqual(status, 0)
+        self.assertIn('{% static "js/a.js" %}', output_path.read_text(encoding="utf-8"))
+    
+    def test_directory_mode(self):
+        """تست تبدیل پوشه"""
+        (self.root / "theme" / "blog").mkdir(parents=True)
+        (self.root / "theme" / "blog" / "post.html").write_text('<img src="a.png">', encoding="utf-8")
+        
+        status, _ = self.run_cli([
+            "convert", str(self.root / "theme"), "-o", str(self.root / "out"), "-j", "1"
+        ])
+        
+        self.assertEqual(status, 0)
+        self.assertTrue((self.root / "out" / "blog" / "post.html").exists())
+    
+    def test_directory_into_itself(self):
+        """تست خطا برای پوشه خروجی برابر با پوشه ورودی"""
+        (self.root / "theme").mkdir()
+        (self.root / "theme" / "index.html").write_text('<img src="a.png">', encoding="utf-8")
+        
+        status, _ = self.run_cli([
+            "convert", str(self.root / "theme"), "-o", str(self.root / "theme"), "-j", "1"
+        ])
+        
+        self.assertEqual(status, 1)
+    
+    def test_profile(self):
+        """تست چاپ زمان مراحل با --profile"""
+        stderr = io.StringIO()
+        with patch("sys.stdin", io.StringIO('<img src="img/a.png">')), \
+                redirect_stdout(io.StringIO()), redirect_stderr(stderr):
+            status = main(["convert", "--profile"])
+        
+        self.assertEqual(status, 0)
+        self.assertIn("serialize", stderr.getvalue())
+        self.assertIn("1 attribute(s) rewritten", stderr.getvalue())
+    
+    def test_missing_input(self):
+        """تست خطا برای فایل ناموجود"""
+        status, _ = self.run_cli(["convert", str(self.root / "missing.html")])
+        
+        self.assertEqual(status, 1)
+    
+    def test_does_not_import_tkinter(self):
+        """تست عدم بارگذاری tkinter در رابط خط فرمان"""
+        code = (
+            "import sys\n"
+            "from django_template_converter.cli import main\n"
+            "main(['convert'])\n"
+            "assert 'tkinter' not in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            input="<img src='a.png'>", capture_output=True, text=True,
+            cwd=str(Path(__file__).resolve().parent.parent)
+        )
+        
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
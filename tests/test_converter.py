@@ -4,6 +4,10 @@ Unit tests for Django Template Converter
 """
 
 import unittest
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup
+
 from django_template_converter.core.converter import DjangoTemplateConverter
 
 
@@ -61,6 +65,115 @@ class TestDjangoTemplateConverter(unittest.TestCase):
         count = result.count('{% static')
         self.assertEqual(count, 1)
 
+    
+    def test_convert_srcset(self):
+        """تست تبدیل ویژگی srcset در <img> و <source>"""
+        html = (
+            '<picture><source srcset="img/a.webp 1x, img/b.webp 2x"></picture>'
+            '<img src="img/a.png" srcset="img/a.png 1x, https://cdn.example.com/b.png 2x">'
+        )
+        result = self.converter.convert_string(html)
+        
+        self.assertIn('{% static "img/a.webp" %} 1x, {% static "img/b.webp" %} 2x', result)
+        self.assertIn('{% static "img/a.png" %} 1x, https://cdn.example.com/b.png 2x', result)
+    
+    def test_single_traversal(self):
+        """تست پیمایش یک‌باره درخت سند"""
+        html = '<link href="a.css"><script src="a.js"></script><img src="a.png">'
+        with patch.object(
+            BeautifulSoup, "find_all", autospec=True, side_effect=BeautifulSoup.find_all
+        ) as find_all:
+            self.converter.convert_string(html)
+        
+        self.assertEqual(find_all.call_count, 1)
+
+    
+    def test_single_serialization(self):
+        """تست سریال‌سازی یک‌باره سند هنگام افزودن {% load static %}"""
+        html = '<html><head><link href="a.css"></head><body></body></html>'
+        with patch.object(
+            BeautifulSoup, "decode", autospec=True, side_effect=BeautifulSoup.decode
+        ) as decode:
+            result = self.converter.convert_string(html)
+        
+        self.assertEqual(decode.call_count, 1)
+        self.assertTrue(result.startswith('<html>{% load static %}'))
+    
+    def test_load_static_not_duplicated(self):
+        """تست عدم افزودن دوباره {% load static %}"""
+        html = '{% load static %}\n<img src="img/a.png">'
+        result = self.converter.convert_string(html)
+        
+        self.assertEqual(result.count('{% load static %}'), 1)
+
+    
+    def test_srcset_descriptors(self):
+        """تست حفظ توصیف‌گرها و data URI در srcset"""
+        html = '<img srcset="data:image/png;base64,AA,BB 1x, img/a.png 100w 2x,img/b.png">'
+        result = self.converter.convert_string(html)
+        
+        self.assertIn(
+            'data:image/png;base64,AA,BB 1x, {% static "img/a.png" %} 100w 2x, '
+            '{% static "img/b.png" %}',
+            result
+        )
+    
+    def test_rewrite_cache(self):
+        """تست حافظه نهان مقادیر تبدیل شده"""
+        html = '<img src="img/icon.png">' * 3 + '<img srcset="a.png 1x">' * 2
+        self.converter.convert_string(html)
+        info = self.converter.cache_info()
+        
+        self.assertEqual((info.hits, info.misses), (3, 2))
+        
+        self.converter.cache_clear()
+        self.assertEqual(self.converter.cache_info().currsize, 0)
+
+    
+    def test_css_urls(self):
+        """تست تبدیل url() در ویژگی style و تگ style"""
+        html = (
+            '<style>.a { background: url("img/a.png") } .b { filter: url(#f) }</style>'
+            '<div style="background: url(img/b.png)"></div>'
+            '<p style="font-family: \'Sans\'; background: url(\'img/c.png\')"></p>'
+            '<div style="background: url(https://example.com/d.png)"></div>'
+        )
+        result = self.converter.convert_string(html)
+        
+        self.assertIn('url("{% static "img/a.png" %}")', result)
+        self.assertIn('url(#f)', result)
+        self.assertIn('style=\'background: url({% static "img/b.png" %})\'', result)
+        self.assertIn("url('{% static 'img/c.png' %}')", result)
+        self.assertIn('url(https://example.com/d.png)', result)
+        self.assertNotIn('&quot;', result)
+    
+    def test_media_attributes(self):
+        """تست تبدیل poster و src عناصر رسانه‌ای"""
+        html = '<video poster="img/p.jpg" src="media/a.mp4"><track src="media/a.vtt"></video>'
+        result = self.converter.convert_string(html)
+        
+        for url in ("img/p.jpg", "media/a.mp4", "media/a.vtt"):
+            self.assertIn(f'{{% static "{url}" %}}', result)
+    
+    def test_custom_rewrite_rules(self):
+        """تست جدول ویژگی‌های قابل تنظیم"""
+        converter = DjangoTemplateConverter(rewrite_rules=[
+            ("img", "src", "_rewrite_url"),
+            ("img", "data-src", "_rewrite_url"),
+        ])
+        result = converter.convert_string(
+            '<img src="a.png" data-src="b.png"><link href="c.css"><div style="background: url(d.png)">'
+        )
+        
+        self.assertIn('{% static "a.png" %}', result)
+        self.assertIn('{% static "b.png" %}', result)
+        self.assertIn('href="c.css"', result)
+        self.assertIn('url(d.png)', result)
+        self.assertNotEqual(converter.fingerprint, self.converter.fingerprint)
+        
+        with self.assertRaises(ValueError):
+            DjangoTemplateConverter(rewrite_rules=[("img", "src", "convert_string")])
+
 
 if __name__ == "__main__":
     unittest.main()
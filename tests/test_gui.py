@@ -0,0 +1,188 @@
+"""
+Unit tests for the display-independent logic of the GUI
+تست‌های واحد برای منطق مستقل از نمایشگر رابط گرافیکی
+"""
+
+import os
+import queue
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+try:
+    import tkinter as tk
+    from django_template_converter.gui import window
+    from django_template_converter.gui.batch_window import BatchConversionWindow
+    from django_template_converter.gui.window import (
+        DjangoTemplateConverterGUI, _changed_lines, _split_lines
+    )
+except ImportError:
+    raise unittest.SkipTest("tkinter is not available")
+
+from django_template_converter.core.converter import DjangoTemplateConverter
+
+
+def apply_change(old_content: str, new_content: str) -> str:
+    """اعمال بازه تغییر یافته روی خطوط متن قبلی"""
+    first, last, replacement = _changed_lines(old_content, new_content)
+    old_lines = _split_lines(old_content)
+    return "".join(old_lines[:first]) + replacement + "".join(old_lines[last:])
+
+
+class TestSplitLines(unittest.TestCase):
+    """تست‌های تابع _split_lines"""
+    
+    def test_split_lines(self):
+        """تست نگه داشتن خط جدید و خط آخر بدون خط جدید"""
+        self.assertEqual(_split_lines(""), [])
+        self.assertEqual(_split_lines("a"), ["a"])
+        self.assertEqual(_split_lines("a\n"), ["a\n"])
+        self.assertEqual(_split_lines("a\n\nb"), ["a\n", "\n", "b"])
+
+
+class TestChangedLines(unittest.TestCase):
+    """تست‌های تابع _changed_lines برای به‌روزرسانی خروجی"""
+    
+    def test_changed_middle_line(self):
+        """تست جایگزینی فقط خط تغییر یافته"""
+        self.assertEqual(
+            _changed_lines("a\nb\nc\n", "a\nB\nc\n"),
+            (1, 2, "B\n")
+        )
+    
+    def test_trailing_newline(self):
+        """تست اضافه و حذف شدن خط جدید انتهای متن"""
+        self.assertEqual(_changed_lines("a\nb", "a\nb\n"), (1, 2, "b\n"))
+        self.assertEqual(_changed_lines("a\nb\n", "a\nb"), (1, 2, "b"))
+    
+    def test_empty_old_output(self):
+        """تست خروجی قبلی خالی"""
+        self.assertEqual(_changed_lines("", "a\nb"), (0, 0, "a\nb"))
+        self.assertEqual(_changed_lines("a\nb", ""), (0, 2, ""))
+    
+    def test_result_matches_new_content(self):
+        """تست یکسان بودن نتیجه با متن جدید"""
+        cases = (
+            ("", ""),
+            ("a\n", "a\n"),
+            ("a\na\n", "a\n"),
+            ("a\n", "a\na\n"),
+            ("x\na\nb\ny", "x\nb\ny"),
+            ("x\ny", "x\na\nb\ny"),
+            ("a\nb\n", "b\na\n"),
+            ("\n\n", "\n"),
+        )
+        for old_content, new_content in cases:
+            with self.subTest(old=old_content, new=new_content):
+                self.assertEqual(apply_change(old_content, new_content), new_content)
+
+
+class FakeText:
+    """جایگزین ویجت Text برای تست بدون نمایشگر"""
+    
+    def __init__(self):
+        self.content = ""
+    
+    def insert(self, index, text):
+        self.content += text
+    
+    def get(self, start, end):
+        return self.content + "\n"
+    
+    def config(self, **options):
+        pass
+
+
+def make_gui() -> "DjangoTemplateConverterGUI":
+    """ساخت نمونه رابط گرافیکی بدون پنجره Tk"""
+    gui = DjangoTemplateConverterGUI.__new__(DjangoTemplateConverterGUI)
+    gui.root = Mock()
+    gui.converter = DjangoTemplateConverter()
+    gui._results = queue.Queue()
+    gui._job_live = False
+    gui._cancel_event = None
+    gui._insert_jobs = {}
+    gui.input_code_text = FakeText()
+    gui.convert_btn = Mock()
+    return gui
+
+
+class TestGuiLogic(unittest.TestCase):
+    """تست‌های منطق تبدیل پس‌زمینه، درج تکه‌ای و پیش‌نمایش زنده"""
+    
+    def setUp(self):
+        """تنظیمات اولیه برای هر تست"""
+        self.gui = make_gui()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+    
+    def tearDown(self):
+        """حذف پوشه موقت"""
+        self._tmp.cleanup()
+    
+    def test_run_conversion(self):
+        """تست تحویل نتیجه از رشته پس‌زمینه و ننوشتن خروجی پس از لغو"""
+        output_path = str(self.root / "out.html")
+        self.gui._run_conversion(1, threading.Event(), '<img src="a.png">', None, output_path)
+        job_id, converted_html, _, _, error = self.gui._results.get_nowait()
+        
+        self.assertEqual((job_id, error), (1, None))
+        self.assertIn('{% static "a.png" %}', Path(output_path).read_text(encoding="utf-8"))
+        
+        cancelled = threading.Event()
+        cancelled.set()
+        os.remove(output_path)
+        self.gui._run_conversion(2, cancelled, '<p></p>', None, output_path)
+        self.assertEqual(self.gui._results.get_nowait()[0], 2)
+        self.assertFalse(os.path.exists(output_path))
+        
+        self.gui._run_conversion(3, threading.Event(), None, str(self.root / "missing.html"), None)
+        self.assertIsInstance(self.gui._results.get_nowait()[4], FileNotFoundError)
+    
+    def test_convert_disabled_while_loading(self):
+        """تست غیرفعال ماندن دکمه تبدیل تا پایان درج فایل ورودی"""
+        content = "x" * (window.INSERT_CHUNK_SIZE * 2 + 1)
+        self.gui._insert_chunked(self.gui.input_code_text, content)
+        
+        self.assertIn(self.gui.input_code_text, self.gui._insert_jobs)
+        self.gui.convert_btn.config.assert_called_with(state=tk.DISABLED)
+        
+        while self.gui.input_code_text in self.gui._insert_jobs:
+            _, callback, *args = self.gui.root.after.call_args[0]
+            callback(*args)
+        
+        self.assertEqual(self.gui.input_code_text.content, content)
+        self.gui.convert_btn.config.assert_called_with(state=tk.NORMAL)
+    
+    def test_live_convert_skips_unchanged_input(self):
+        """تست تبدیل نشدن دوباره ورودی بدون تغییر در پیش‌نمایش زنده"""
+        self.gui.live_var = SimpleNamespace(get=lambda: True)
+        self.gui.input_type_var = SimpleNamespace(get=lambda: "code")
+        self.gui._live_hash = None
+        self.gui._start_conversion = Mock()
+        self.gui.input_code_text.insert("end", "<p>a</p>")
+        
+        self.gui._live_convert()
+        self.gui._live_convert()
+        self.gui.input_code_text.insert("end", "<p>b</p>")
+        self.gui._live_convert()
+        
+        self.assertEqual(self.gui._start_conversion.call_count, 2)
+        self.gui._start_conversion.assert_called_with("<p>a</p><p>b</p>", None, None, live=True)
+    
+    def test_batch_output_path(self):
+        """تست مسیر خروجی فایل‌های صف تبدیل دسته‌ای"""
+        batch = BatchConversionWindow.__new__(BatchConversionWindow)
+        batch.output_dir_var = SimpleNamespace(get=lambda: "")
+        self.assertEqual(batch._output_path("site/a.html", None), str(Path("site/a_django.html")))
+        
+        batch.output_dir_var = SimpleNamespace(get=lambda: "out")
+        self.assertEqual(batch._output_path("site/blog/a.html", "site"), str(Path("out/blog/a.html")))
+        self.assertEqual(batch._output_path("site/blog/a.html", None), str(Path("out/a.html")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Unit tests for the URL exclusion matcher
+تست‌های واحد برای تطبیق‌دهنده آدرس‌ها
+"""
+
+import unittest
+
+from django_template_converter.core.converter import DjangoTemplateConverter
+from django_template_converter.core.matcher import UrlMatcher
+
+
+class TestUrlMatcher(unittest.TestCase):
+    """تست‌های کلاس UrlMatcher"""
+    
+    def test_default_prefixes(self):
+        """تست پیشوندهای پیش‌فرض"""
+        matcher = UrlMatcher()
+        
+        for url in ("http://a/b.css", "https://a/b.css", "//a/b.css", "data:x", "{% static 'a' %}"):
+            self.assertTrue(matcher.matches(url), url)
+        self.assertFalse(matcher.matches("css/style.css"))
+    
+    def test_patterns_and_globs(self):
+        """تست عبارات باقاعده و الگوهای glob"""
+        matcher = UrlMatcher(prefixes=("/media/",), patterns=(r"cdn\d*/",), globs=("*.woff2",))
+        
+        self.assertTrue(matcher.matches("/media/upload.png"))
+        self.assertTrue(matcher.matches("cdn2/lib.js"))
+        self.assertTrue(matcher.matches("fonts/icons.woff2"))
+        self.assertFalse(matcher.matches("js/cdn2/lib.js"))
+        self.assertFalse(matcher.matches("fonts/icons.woff"))
+    
+    def test_patterns_compiled_separately(self):
+        """تست پرچم‌های سراسری و ارجاع‌های برگشتی در چند عبارت باقاعده"""
+        matcher = UrlMatcher(prefixes=(), patterns=(r"(?i)/media/", r"(a)\1", r"(b)\1"))
+        
+        self.assertTrue(matcher.matches("/MEDIA/upload.png"))
+        self.assertTrue(matcher.matches("aa"))
+        self.assertTrue(matcher.matches("bb"))
+        self.assertFalse(matcher.matches("ab"))
+    
+    def test_converter_exclusions(self):
+        """تست استثناهای تعریف شده توسط کاربر در تبدیل کننده"""
+        converter = DjangoTemplateConverter(
+            exclude_prefixes=("/media/",), exclude_globs=("*.svg",)
+        )
+        result = converter.convert_string(
+            '<img src="/media/a.png"><img src="img/b.svg"><img src="img/c.png">'
+        )
+        
+        self.assertIn('src="/media/a.png"', result)
+        self.assertIn('src="img/b.svg"', result)
+        self.assertIn('{% static "img/c.png" %}', result)
+        self.assertNotEqual(converter.fingerprint, DjangoTemplateConverter().fingerprint)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Tests for the converter parser backends
+تست‌های پردازشگرهای HTML
+"""
+
+import unittest
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from django_template_converter.core.converter import (
+    DjangoTemplateConverter,
+    REWRITE_RULES,
+    TEXT_CONTENT,
+    WILDCARD_TAG,
+)
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+PARSERS = ("html.parser", "lxml", "lxml.html")
+
+
+def extract_references(html: str) -> list:
+    """استخراج ویژگی‌های قابل تبدیل از خروجی"""
+    soup = BeautifulSoup(html, "html.parser")
+    references = []
+    for tag, attribute, _ in REWRITE_RULES:
+        for element in soup.find_all(True if tag == WILDCARD_TAG else tag):
+            if attribute == TEXT_CONTENT:
+                references.append((tag, attribute, element.get_text()))
+            elif element.get(attribute) is not None:
+                references.append((tag, attribute, element[attribute]))
+    return sorted(references)
+
+
+class TestParserBackends(unittest.TestCase):
+    """تست یکسان بودن خروجی پردازشگرها"""
+    
+    def test_backends_rewrite_identically(self):
+        """تست یکسان بودن ویژگی‌های تبدیل شده در همه پردازشگرها"""
+        for fixture in sorted(FIXTURES_DIR.glob("*.html")):
+            html = fixture.read_text(encoding="utf-8")
+            expected = extract_references(
+                DjangoTemplateConverter(parser="html.parser").convert_string(html)
+            )
+            
+            for parser in PARSERS:
+                with self.subTest(fixture=fixture.name, parser=parser):
+                    result = DjangoTemplateConverter(parser=parser).convert_string(html)
+                    self.assertEqual(extract_references(result), expected)
+                    self.assertEqual(result.count('{% load static %}'), 1)
+    
+    def test_lxml_html_quotes_static_tags(self):
+        """تست نقل‌قول صحیح تگ‌های static در پردازشگر lxml.html"""
+        converter = DjangoTemplateConverter(parser="lxml.html")
+        result = converter.convert_string('<html><body><img src="img/a.png"></body></html>')
+        
+        self.assertIn('src=\'{% static "img/a.png" %}\'', result)
+        self.assertNotIn('&quot;', result)
+    
+    def test_lxml_html_keeps_template_tags(self):
+        """تست حفظ تگ‌های Django در ویژگی‌های URL دیگر"""
+        converter = DjangoTemplateConverter(parser="lxml.html")
+        result = converter.convert_string('<a href="{% url \'home\' %}">Home</a>')
+        
+        self.assertIn('href="{% url \'home\' %}"', result)
+    
+    def test_documents_without_elements(self):
+        """تست اسناد بدون عنصر مانند قطعه‌ای که فقط توضیح یا doctype دارد"""
+        for html in ('<!-- partial -->\n', '<!DOCTYPE html>'):
+            for parser in PARSERS:
+                with self.subTest(html=html, parser=parser):
+                    result = DjangoTemplateConverter(parser=parser).convert_string(html)
+                    self.assertTrue(result.startswith('{% load static %}'))
+                    self.assertIn(html.strip().lower(), result.lower())
+    
+    def test_comments_around_root(self):
+        """تست حفظ توضیحات قبل و بعد از عنصر html بدون افزودن doctype"""
+        html = '<!-- before --><html><body><img src="a.png"></body></html><!-- after -->'
+        for parser in PARSERS:
+            with self.subTest(parser=parser):
+                result = DjangoTemplateConverter(parser=parser).convert_string(html)
+                self.assertIn('<!-- before -->', result)
+                self.assertIn('<!-- after -->', result)
+                self.assertNotIn('DOCTYPE', result)
+    
+    def test_xml_declaration(self):
+        """تست پذیرش سند دارای اعلان XML"""
+        declaration = '<?xml version="1.0" encoding="utf-8"?>\n'
+        html = declaration + '<!DOCTYPE html>\n<html><body><img src="a.png"></body></html>'
+        for parser in PARSERS:
+            with self.subTest(parser=parser):
+                result = DjangoTemplateConverter(parser=parser).convert_string(html)
+                self.assertIn('{% static "a.png" %}', result)
+        
+        result = DjangoTemplateConverter(parser="lxml.html").convert_string(html)
+        self.assertTrue(result.startswith(declaration + '<!DOCTYPE html>'))
+    
+    def test_invalid_parser(self):
+        """تست خطا برای پردازشگر نامعتبر"""
+        with self.assertRaises(ValueError):
+            DjangoTemplateConverter(parser="regex")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Unit tests for the patch converter
+تست‌های واحد برای تبدیل کننده وصله‌ای
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from django_template_converter.core.patching import PatchConverter
+from django_template_converter.core.streaming import StreamingConverter
+
+
+class TestPatchConverter(unittest.TestCase):
+    """تست‌های کلاس PatchConverter"""
+    
+    def setUp(self):
+        """تنظیمات اولیه برای هر تست"""
+        self.converter = PatchConverter()
+    
+    def test_preserves_unchanged_bytes(self):
+        """تست حفظ بایت‌های تغییر نیافته"""
+        html = (
+            '<!DOCTYPE html>\r\n<HTML>\r\n  <link  rel=stylesheet   href="css/a.css" >\n'
+            '  <IMG alt=\'x\' SRC="img/ä.png"/>\n  <p>a &amp; b &nbsp;<br></p>\n'
+            '  <a href="page.html">x</a>\n</HTML>\n'
+        )
+        result = self.converter.convert_string(html)
+        
+        self.assertEqual(
+            result,
+            '{% load static %}\n<!DOCTYPE html>\r\n<HTML>\r\n'
+            '  <link  rel=stylesheet   href="{% static \'css/a.css\' %}" >\n'
+            '  <IMG alt=\'x\' SRC="{% static \'img/ä.png\' %}"/>\n'
+            '  <p>a &amp; b &nbsp;<br></p>\n  <a href="page.html">x</a>\n</HTML>\n'
+        )
+    
+    def test_skips_comments_and_raw_text(self):
+        """تست عدم تغییر توضیحات و محتوای script"""
+        html = (
+            '{% load static %}<!-- <img src="a.png"> -->'
+            '<script>if (a < b) { s = "<img src=b.png>"; }</script>'
+            '<![CDATA[<img src="c.png">]]>'
+        )
+        
+        self.assertEqual(self.converter.convert_string(html), html)
+    
+    def test_matches_streaming_output(self):
+        """تست یکسان بودن خروجی با تبدیل کننده جریانی"""
+        html = (
+            '<html><head><link href="css/a.css"><script src="js/a.js"></script></head>\n'
+            '<body><img src=\'a.png\' srcset="a.png 1x, b.png 2x"><img src=b.png>\n'
+            '<img src="https://example.com/c.png"><source src="v.mp4">\n'
+            '<style>\n.a { background: url("img/d.png") }\n</style>'
+            '<div style="background: url(img/e.png)"></div></body></html>'
+        )
+        
+        self.assertEqual(
+            self.converter.convert_string(html),
+            StreamingConverter().convert_string(html)
+        )
+    
+    def test_find_patches(self):
+        """تست موقعیت مقادیر بازنویسی شده در متن ورودی"""
+        html = 'x\n<img alt="a" src="a.png">\n<img src=b.png>'
+        patches = self.converter.find_patches(html)
+        
+        self.assertEqual(
+            [html[start:end] for start, end, _ in patches],
+            ['"a.png"', 'b.png']
+        )
+    
+    def test_convert_file(self):
+        """تست حفظ پایان خط‌ها در تبدیل فایل"""
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = Path(directory) / "page.html"
+            input_path.write_bytes(b'<img src="img/a.png">\r\n<p>x</p>\r\n')
+            
+            output_path = self.converter.convert_file(str(input_path))
+            
+            self.assertEqual(
+                Path(output_path).read_bytes(),
+                b'{% load static %}\n<img src="{% static \'img/a.png\' %}">\r\n<p>x</p>\r\n'
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Unit tests for the converter pool
+تست‌های واحد برای مخزن مبدل‌ها
+"""
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from django_template_converter.core.converter import DjangoTemplateConverter
+from django_template_converter.core.pool import ConverterPool
+from django_template_converter.core.profiling import ConversionStats
+
+
+def make_document(i):
+    """ساخت یک سند نمونه"""
+    return (
+        f'<html><head><link rel="stylesheet" href="css/page{i}.css"></head>'
+        f'<body><img src="img/{i % 7}.png" srcset="img/{i}-1x.png 1x, img/{i}-2x.png 2x">'
+        f'<a href="page{i}.html">Page</a></body></html>'
+    )
+
+
+class TestConverterPool(unittest.TestCase):
+    """تست‌های کلاس ConverterPool"""
+    
+    def test_concurrent_convert_string(self):
+        """تست تبدیل همزمان از چند نخ با خروجی یکسان با تبدیل ترتیبی"""
+        documents = [make_document(i) for i in range(200)]
+        expected = [DjangoTemplateConverter().convert_string(html) for html in documents]
+        
+        for parser in ("html.parser", "lxml.html"):
+            with self.subTest(parser=parser):
+                pool = ConverterPool(size=3, parser=parser)
+                reference = DjangoTemplateConverter(parser=parser)
+                with ThreadPoolExecutor(max_workers=16) as executor:
+                    outputs = list(executor.map(pool.convert_string, documents))
+                
+                self.assertEqual(outputs, [reference.convert_string(html) for html in documents])
+                if parser == "html.parser":
+                    self.assertEqual(outputs, expected)
+                counters = pool.counters()
+                self.assertEqual(counters.conversions, len(documents))
+                self.assertEqual(counters.failures, 0)
+                self.assertEqual(counters.in_flight, 0)
+                self.assertGreater(counters.throughput, 0)
+                self.assertGreater(counters.mean_latency, 0)
+    
+    def test_converter_lent_to_one_thread(self):
+        """تست اینکه هر مبدل در هر لحظه فقط در اختیار یک نخ است"""
+        pool = ConverterPool(size=2, warm=False)
+        in_use = set()
+        overlaps = []
+        lock = threading.Lock()
+        
+        def borrow(_):
+            with pool.converter() as converter:
+                with lock:
+                    if id(converter) in in_use or len(in_use) >= pool.size:
+                        overlaps.append(id(converter))
+                    in_use.add(id(converter))
+                time.sleep(0.002)
+                with lock:
+                    in_use.discard(id(converter))
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(borrow, range(64)))
+        
+        self.assertEqual(overlaps, [])
+        self.assertGreater(pool.counters().wait_seconds, 0)
+    
+    def test_timeout_and_failures(self):
+        """تست خطای انتظار و شمارش تبدیل‌های ناموفق"""
+        pool = ConverterPool(size=1, warm=False)
+        with pool.converter():
+            with self.assertRaises(TimeoutError):
+                pool.convert_string("<p></p>", timeout=0.01)
+        
+        with self.assertRaises(FileNotFoundError):
+            pool.convert_file("missing.html")
+        
+        counters = pool.counters()
+        self.assertEqual((counters.conversions, counters.failures), (1, 1))
+        
+        pool.reset_counters()
+        self.assertEqual(pool.counters().conversions, 0)
+    
+    def test_invalid_options(self):
+        """تست خطا برای اندازه نامعتبر و آمار مشترک"""
+        for size in (0, -1):
+            with self.subTest(size=size), self.assertRaises(ValueError):
+                ConverterPool(size=size)
+        with self.assertRaises(ValueError):
+            ConverterPool(size=1, stats=ConversionStats())
+
+
+if __name__ == "__main__":
+    unittest.main()
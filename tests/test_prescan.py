@@ -0,0 +1,90 @@
+"""
+Unit tests for the pre-scan fast path
+تست‌های واحد برای پیش‌بررسی سریع اسناد
+"""
+
+import unittest
+
+from django_template_converter.core.converter import DjangoTemplateConverter
+from django_template_converter.core.profiling import ConversionStats
+from django_template_converter.core.streaming import may_rewrite
+
+
+PARSERS = ("html.parser", "lxml", "lxml.html")
+
+# Documents without anything to rewrite
+UNCHANGED = (
+    '',
+    '<p>Plain <b>text</b><br></p>',
+    '<a href="page.html">Page</a><img src="https://example.com/a.png">',
+    '<img src="{% static \'img/a.png\' %}" srcset="{% static \'img/a.png\' %} 1x">',
+    '<div style="color: red"><style>p { color: blue; }</style></div>',
+    '<img data-src="img/a.png"><a href="#top">Top</a>',
+)
+
+# Documents with one value to rewrite each
+CHANGED = (
+    '<img src="img/a.png">',
+    '<IMG SRC=img/a.png>',
+    '<img\nsrc\n=\n"img/a.png">',
+    '<source srcset="img/a.png 1x">',
+    '<video poster="img/poster.png"></video>',
+    '<div style="background: url(img/bg.png)"></div>',
+    '<style>body { background: url("img/bg.png"); }</style>',
+)
+
+
+class TestPrescan(unittest.TestCase):
+    """تست‌های پیش‌بررسی اسناد بدون ارجاع قابل تبدیل"""
+    
+    def test_no_false_negatives(self):
+        """تست اینکه پیش‌بررسی هیچ سند قابل تبدیلی را رد نمی‌کند"""
+        for parser in PARSERS:
+            converter = DjangoTemplateConverter(parser=parser)
+            for html in CHANGED:
+                with self.subTest(parser=parser, html=html):
+                    self.assertTrue(may_rewrite(converter, html))
+                    stats = ConversionStats()
+                    DjangoTemplateConverter(parser=parser, stats=stats).convert_string(html)
+                    self.assertEqual(stats.rewrites, 1)
+        
+        converter = DjangoTemplateConverter()
+        for html in UNCHANGED:
+            with self.subTest(html=html):
+                self.assertFalse(may_rewrite(converter, html))
+    
+    def test_fast_path(self):
+        """تست بازگرداندن سند بدون پارس و شمارش آن"""
+        stats = ConversionStats()
+        converter = DjangoTemplateConverter(prescan=True, stats=stats)
+        
+        self.assertEqual(
+            converter.convert_string('<p>Text<br></p>'),
+            '{% load static %}\n<p>Text<br></p>'
+        )
+        self.assertIn('{% static "img/a.png" %}', converter.convert_string('<img src="img/a.png">'))
+        self.assertEqual((stats.documents, stats.skipped, stats.rewrites), (1, 1, 1))
+        self.assertIn("1 document(s) skipped by the pre-scan", stats.report())
+    
+    def test_fast_path_records_no_stage(self):
+        """تست ثبت نشدن زمان پیش‌بررسی به عنوان مرحله پارس"""
+        calls = []
+        stats = ConversionStats(on_stage=lambda stage, seconds: calls.append(stage))
+        DjangoTemplateConverter(prescan=True, stats=stats).convert_string('<p>Text</p>')
+        
+        self.assertEqual(calls, [])
+        self.assertEqual((stats.documents, stats.skipped), (0, 1))
+    
+    def test_references_of_converted_document(self):
+        """تست حفظ ارجاع‌های قالب‌های تبدیل شده برای فهرست فایل‌ها"""
+        html = UNCHANGED[3]
+        converter = DjangoTemplateConverter(prescan=True)
+        references = []
+        converter.convert_string(html, references)
+        
+        self.assertEqual([reference.path for reference in references], ["img/a.png", "img/a.png"])
+        self.assertNotEqual(converter.fingerprint, DjangoTemplateConverter().fingerprint)
+
+
+if __name__ == "__main__":
+    unittest.main()
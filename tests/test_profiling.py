@@ -0,0 +1,83 @@
+"""
+Unit tests for per-stage conversion statistics
+تست‌های واحد برای آمار مراحل تبدیل
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from django_template_converter.core.batch import convert_tree
+from django_template_converter.core.converter import DjangoTemplateConverter
+from django_template_converter.core.profiling import STAGES, ConversionStats
+
+
+HTML = (
+    '<html><head><link rel="stylesheet" href="css/a.css"></head>'
+    '<body><img src="img/a.png"><img src="https://example.com/b.png"></body></html>'
+)
+
+
+class TestConversionStats(unittest.TestCase):
+    """تست‌های کلاس ConversionStats"""
+    
+    def test_counts_per_parser(self):
+        """تست شمارش عناصر و بازنویسی‌ها برای هر پارسر"""
+        for parser in ("html.parser", "lxml.html"):
+            with self.subTest(parser=parser):
+                stats = ConversionStats()
+                converter = DjangoTemplateConverter(parser=parser, stats=stats)
+                converter.convert_string(HTML)
+                converter.convert_string(HTML)
+                
+                self.assertEqual(stats.documents, 2)
+                self.assertEqual(stats.rewrites, 4)
+                self.assertGreaterEqual(stats.elements, 6)
+                for stage in ("parse", "load_static", "rewrite", "serialize"):
+                    self.assertGreater(stats.seconds[stage], 0)
+    
+    def test_on_stage_callback(self):
+        """تست فراخوانی callback برای هر مرحله"""
+        calls = []
+        stats = ConversionStats(on_stage=lambda stage, seconds: calls.append(stage))
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = Path(tmp) / "page.html"
+            input_path.write_text(HTML, encoding="utf-8")
+            DjangoTemplateConverter(stats=stats).convert_file(str(input_path))
+        
+        self.assertEqual(sorted(calls), sorted(STAGES))
+    
+    def test_merge_from_workers(self):
+        """تست جمع آمار فرایندهای کارگر در convert_tree"""
+        with tempfile.TemporaryDirectory() as tmp:
+            src = Path(tmp) / "src"
+            for name in ("a.html", "b.html", "c.html"):
+                path = src / name
+                path.parent.mkdir(exist_ok=True)
+                # Distinct contents, identical files are converted once
+                path.write_text(HTML + f"<!-- {name} -->", encoding="utf-8")
+            
+            stats = ConversionStats()
+            convert_tree(str(src), str(Path(tmp) / "dst"), workers=2, stats=stats)
+        
+        self.assertEqual(stats.documents, 3)
+        self.assertEqual(stats.rewrites, 6)
+        self.assertGreater(stats.seconds["write"], 0)
+    
+    def test_report(self):
+        """تست گزارش مراحل"""
+        stats = ConversionStats()
+        DjangoTemplateConverter(stats=stats).convert_string(HTML)
+        report = stats.report()
+        
+        for stage in STAGES:
+            self.assertIn(stage, report)
+        self.assertIn("2 attribute(s) rewritten", report)
+        
+        stats.reset()
+        self.assertEqual(stats.total, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Startup tests measured with python -X importtime
+تست‌های زمان راه‌اندازی با python -X importtime
+"""
+
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+import django_template_converter
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Heavy modules that must only be loaded when they are used
+HEAVY_MODULES = ("bs4", "lxml", "html5lib", "tkinter", "multiprocessing")
+
+
+def import_times(statement: str) -> dict:
+    """
+    Run a statement in a fresh interpreter with -X importtime.
+    
+    Args:
+        statement: Python statement to run
+    
+    Returns:
+        Mapping of imported module name to cumulative microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=str(ROOT),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestStartup(unittest.TestCase):
+    """تست‌های بارگذاری تنبل ماژول‌ها"""
+    
+    def assert_not_loaded(self, statement: str):
+        """بررسی بارگذاری نشدن ماژول‌های سنگین"""
+        times = import_times(statement)
+        for module in HEAVY_MODULES:
+            with self.subTest(statement=statement, module=module):
+                self.assertNotIn(module, times)
+        return times
+    
+    def test_import_package(self):
+        """تست ارزان بودن import بسته"""
+        times = self.assert_not_loaded("import django_template_converter")
+        self.assertIn("django_template_converter", times)
+    
+    def test_import_cli(self):
+        """تست ارزان بودن راه‌اندازی رابط خط فرمان"""
+        self.assert_not_loaded("import django_template_converter.cli")
+        self.assert_not_loaded("import django_template_converter.core")
+        self.assert_not_loaded("import django_template_converter.gui")
+    
+    def test_selected_parser_only(self):
+        """تست بارگذاری فقط پارسر انتخاب شده"""
+        times = import_times(
+            "from django_template_converter import Converter; "
+            "Converter(parser='lxml.html').convert_string('<img src=\"a.png\">')"
+        )
+        self.assertIn("lxml.html", times)
+        self.assertNotIn("bs4", times)
+    
+    def test_lazy_attributes(self):
+        """تست دسترسی به نام‌های عمومی بسته"""
+        from django_template_converter.core.converter import DjangoTemplateConverter
+        
+        self.assertIs(django_template_converter.Converter, DjangoTemplateConverter)
+        self.assertIn("Converter", dir(django_template_converter))
+        with self.assertRaises(AttributeError):
+            django_template_converter.missing
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+Unit tests for the streaming converter
+تست‌های واحد برای تبدیل کننده جریانی
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from django_template_converter.core.streaming import StreamingConverter
+
+
+class TestStreamingConverter(unittest.TestCase):
+    """تست‌های کلاس StreamingConverter"""
+    
+    def setUp(self):
+        """تنظیمات اولیه برای هر تست"""
+        self.converter = StreamingConverter()
+    
+    def test_preserves_unchanged_bytes(self):
+        """تست حفظ بایت‌های تغییر نیافته"""
+        html = (
+            '<!DOCTYPE html>\n<HTML>\n  <link  rel=stylesheet   href="css/a.css" >\n'
+            '  <img alt=\'x\' src="img/a.png"/>\n  <a href="page.html">x</a>\n</HTML>\n'
+        )
+        result = self.converter.convert_string(html)
+        
+        self.assertEqual(
+            result,
+            '{% load static %}\n<!DOCTYPE html>\n<HTML>\n'
+            '  <link  rel=stylesheet   href="{% static \'css/a.css\' %}" >\n'
+            '  <img alt=\'x\' src="{% static \'img/a.png\' %}"/>\n'
+            '  <a href="page.html">x</a>\n</HTML>\n'
+        )
+    
+    def test_quote_styles(self):
+        """تست انواع نقل‌قول ویژگی‌ها"""
+        html = '{% load static %}<img src=\'a.png\'><img src=b.png><img srcset="c.png 1x, d.png 2x">'
+        result = self.converter.convert_string(html)
+        
+        self.assertEqual(
+            result,
+            '{% load static %}<img src=\'{% static "a.png" %}\'>'
+            '<img src="{% static \'b.png\' %}">'
+            '<img srcset="{% static \'c.png\' %} 1x, {% static \'d.png\' %} 2x">'
+        )
+    
+    def test_skips_comments_and_raw_text(self):
+        """تست عدم تغییر توضیحات و محتوای script"""
+        html = (
+            '{% load static %}<!-- <img src="a.png"> -->'
+            '<script>if (a < b) { s = "<img src=b.png>"; }</script>'
+        )
+        
+        self.assertEqual(self.converter.convert_string(html), html)
+    
+    def test_css_urls(self):
+        """تست تبدیل url() در ویژگی style و تگ style"""
+        html = (
+            '{% load static %}<style>.a { background: url(img/a.png) }</style>'
+            '<p style="font: \'Sans\'; background: url(\'img/b.png\')"></p>'
+        )
+        
+        self.assertEqual(
+            self.converter.convert_string(html),
+            '{% load static %}<style>.a { background: url({% static "img/a.png" %}) }</style>'
+            '<p style="font: \'Sans\'; background: url(\'{% static \'img/b.png\' %}\')"></p>'
+        )
+    
+    def test_chunk_boundaries(self):
+        """تست یکسان بودن خروجی با هر اندازه قطعه"""
+        html = (
+            '<html><head><link href="css/a.css"><!-- c --><script src="js/a.js">'
+            'var x = "</scrip";</script><style>.a { background: url(img/c.png) }</style>'
+            '</head><body><p>1 < 2</p>'
+            '<img src="img/a.png" srcset="img/a.png 1x, img/b.png 2x"></body></html>'
+        )
+        expected = self.converter.convert_string(html)
+        
+        for size in (1, 2, 3, 7, 16):
+            with self.subTest(size=size):
+                chunks = [html[i:i + size] for i in range(0, len(html), size)]
+                self.assertEqual("".join(self.converter.convert_stream(chunks)), expected)
+    
+    def test_convert_file(self):
+        """تست تبدیل فایل به صورت جریانی"""
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = Path(directory) / "page.html"
+            input_path.write_text('<img src="img/a.png">\r\n', encoding="utf-8")
+            
+            converter = StreamingConverter(chunk_size=4)
+            output_path = converter.convert_file(str(input_path))
+            
+            self.assertEqual(output_path, str(Path(directory) / "page_django.html"))
+            self.assertEqual(
+                Path(output_path).read_bytes(),
+                b'{% load static %}\n<img src="{% static \'img/a.png\' %}">\r\n'
+            )
+
+    
+    def test_convert_file_multibyte_chunks(self):
+        """تست رمزگشایی تدریجی نویسه‌های چندبایتی بین قطعه‌ها"""
+        html = '<p>سلام دنیا</p><img src="img/تصویر.png">\n'
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = Path(directory) / "page.html"
+            input_path.write_text(html, encoding="utf-8")
+            empty_path = Path(directory) / "empty.html"
+            empty_path.write_bytes(b"")
+            
+            for size in (1, 2, 3, 5):
+                with self.subTest(size=size):
+                    output_path = StreamingConverter(chunk_size=size).convert_file(str(input_path))
+                    self.assertEqual(
+                        Path(output_path).read_text(encoding="utf-8"),
+                        self.converter.convert_string(html)
+                    )
+            
+            output_path = self.converter.convert_file(str(empty_path))
+            self.assertEqual(Path(output_path).read_text(encoding="utf-8"), "{% load static %}\n")
+    
+    def test_convert_file_is_atomic(self):
+        """تست دست نخوردن خروجی قبلی در صورت خطا"""
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = Path(directory) / "page.html"
+            input_path.write_bytes(b'<img src="a.png">\xff')
+            output_path = Path(directory) / "out.html"
+            output_path.write_text("previous", encoding="utf-8")
+            
+            with self.assertRaises(UnicodeDecodeError):
+                self.converter.convert_file(str(input_path), str(output_path))
+            
+            self.assertEqual(output_path.read_text(encoding="utf-8"), "previous")
+            self.assertEqual(sorted(p.name for p in Path(directory).iterdir()), ["out.html", "page.html"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Unit tests for watch mode
+تست‌های واحد برای حالت پایش
+"""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from django_template_converter.core.watcher import TemplateWatcher
+
+
+class TestTemplateWatcher(unittest.TestCase):
+    """تست‌های کلاس TemplateWatcher"""
+    
+    def setUp(self):
+        """ساخت پوشه قالب نمونه"""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.src = self.root / "theme"
+        self.dst = self.root / "templates"
+        (self.src / "blog").mkdir(parents=True)
+        self.write("index.html", '<img src="a.png">')
+        self.write("blog/post.html", '<img src="b.png">')
+    
+    def tearDown(self):
+        """حذف پوشه موقت"""
+        self._tmp.cleanup()
+    
+    def write(self, relative, content):
+        """نوشتن فایل و جلو بردن زمان تغییر آن"""
+        path = self.src / relative
+        path.write_text(content, encoding="utf-8")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    
+    def test_reconverts_changed_files_only(self):
+        """تست تبدیل دوباره فقط فایل‌های تغییر یافته"""
+        watcher = TemplateWatcher(str(self.src), str(self.dst), debounce=0)
+        
+        self.assertEqual(len(watcher.step()), 2)
+        self.assertEqual(watcher.step(), [])
+        
+        self.write("blog/post.html", '<img src="c.png">')
+        outputs = watcher.step()
+        
+        self.assertEqual(outputs, [str(self.dst / "blog" / "post.html")])
+        self.assertIn("c.png", Path(outputs[0]).read_text(encoding="utf-8"))
+    
+    def test_debounce(self):
+        """تست تأخیر تبدیل تا پایان تغییرات پیاپی"""
+        watcher = TemplateWatcher(str(self.src), str(self.dst), debounce=1.0)
+        
+        self.assertEqual(watcher.step(now=100.0), [])
+        self.write("index.html", '<img src="d.png">')
+        self.assertEqual(watcher.step(now=100.5), [])
+        self.assertEqual(len(watcher.step(now=101.0)), 1)
+        self.assertEqual(len(watcher.step(now=101.5)), 1)
+    
+    def test_restart_uses_cache(self):
+        """تست عدم تبدیل دوباره پس از راه‌اندازی مجدد"""
+        TemplateWatcher(str(self.src), str(self.dst), debounce=0).step()
+        
+        self.assertEqual(TemplateWatcher(str(self.src), str(self.dst), debounce=0).step(), [])
+    
+    def test_run_until_stopped(self):
+        """تست اجرای حلقه پایش تا توقف"""
+        converted = []
+        watcher = TemplateWatcher(
+            str(self.src), str(self.dst), interval=0.01, debounce=0,
+            on_convert=lambda source, output, seconds: converted.append(output)
+        )
+        stop_event = threading.Event()
+        thread = threading.Thread(target=watcher.run, args=(stop_event,))
+        thread.start()
+        
+        deadline = time.monotonic() + 5
+        while len(converted) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        stop_event.set()
+        thread.join()
+        
+        self.assertEqual(len(converted), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()